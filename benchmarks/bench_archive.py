@@ -0,0 +1,94 @@
+"""Benchmark `ConfigArchive` against one JSON file per run.
+
+Writes the configs of many runs, of which only a few are distinct,
+once as `to_json` files and once into archives, then compares the space
+on disk and the time to read every run's config back. Fingerprints are
+cached on the instances, so they are timed once, separately.
+
+```sh
+PYTHONPATH=. python benchmarks/bench_archive.py [num_runs] [num_distinct]
+```
+"""
+
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Literal
+
+from rootconfig import RootConfig
+from rootconfig.archive import ConfigArchive
+
+
+@dataclass
+class Config(RootConfig):
+    learning_rate: float = 1e-3
+    batch_size: int = 32
+    optimizer: Literal['Adam', 'AdamW', 'SGD'] = 'Adam'
+    output_path: Path = Path('outputs')
+    schedule: list[float] = field(
+        default_factory=lambda: [0.1 * i for i in range(64)]
+    )
+    seed: int = 0
+
+
+def directory_size(directory: Path) -> int:
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(directory) for name in names
+    )
+
+
+def main(num_runs: int = 10_000, num_distinct: int = 100):
+    configs = [Config(seed=run % num_distinct) for run in range(num_runs)]
+    print(f'{num_runs} runs, {num_distinct} distinct configs')
+
+    def report(label: str, function):
+        start = time.perf_counter()
+        result = function()
+        seconds = time.perf_counter() - start
+        print(f'{label:28} {seconds * 1e3:10.1f} ms')
+        return result
+
+    with TemporaryDirectory() as directory:
+        runs = Path(directory, 'runs')
+        runs.mkdir()
+
+        def write_json():
+            for run, config in enumerate(configs):
+                config.to_json(runs / f'{run:06}.json')
+
+        def read_json():
+            return [
+                Config.from_json(runs / f'{run:06}.json')
+                for run in range(num_runs)
+            ]
+
+        report('to_json per run', write_json)
+        assert report('from_json per run', read_json) == configs
+        print(f'{"":28} {directory_size(runs) / 2 ** 20:10.2f} MiB')
+
+        report(
+            'fingerprint', lambda: [config.fingerprint() for config in configs]
+        )
+        for compression in (None, 'zlib', 'lzma'):
+            path = Path(directory, f'configs.{compression}.rcar')
+            with ConfigArchive(Config, path, compression) as archive:
+                digests = report(
+                    f'add_many ({compression})',
+                    lambda: archive.add_many(configs),
+                )
+            with ConfigArchive(Config, path, readonly=True) as archive:
+                loaded = report(
+                    f'get per run ({compression})',
+                    lambda: [archive[digest] for digest in digests],
+                )
+            assert loaded == configs
+            size = os.path.getsize(path) + os.path.getsize(f'{path}.index')
+            print(f'{"":28} {size / 2 ** 20:10.2f} MiB')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,63 @@
+"""Benchmark `parse_args` with the `argparse` and the `fast` engine.
+
+Measures the first call on a wide config class, which has to compile
+the schema and forge the parser, and the later calls that reuse them.
+
+```sh
+PYTHONPATH=. python benchmarks/bench_argv.py [num_fields] [num_calls]
+```
+"""
+
+import sys
+import time
+import timeit
+from dataclasses import field, make_dataclass
+
+from rootconfig import RootConfig
+
+
+def make_wide_config(num_fields: int):
+    field_specs = []
+    arguments = []
+    for i in range(num_fields):
+        match i % 3:
+            case 0:
+                field_specs.append((f'int_field_{i}', int, field(default=0)))
+                arguments += [f'--int-field-{i}', str(i)]
+            case 1:
+                field_specs.append((
+                    f'float_field_{i}', float, field(default=0.)
+                ))
+                arguments += [f'--float-field-{i}', '1e-3']
+            case 2:
+                field_specs.append((
+                    f'list_field_{i}', list[float],
+                    field(default_factory=list)
+                ))
+                arguments += [f'--list-field-{i}', '0.1', '0.2', '0.3']
+    config_class = make_dataclass(
+        'WideConfig', field_specs, bases=(RootConfig,)
+    )
+    return config_class, arguments
+
+
+def main(num_fields: int = 300, num_calls: int = 200):
+    config_class, arguments = make_wide_config(num_fields)
+    print(f'{num_fields} fields, {len(arguments)} tokens')
+
+    for engine in ('argparse', 'fast'):
+        config_class.clear_cache()
+        start = time.perf_counter()
+        config_class.parse_args(arguments, engine=engine)
+        first_call = time.perf_counter() - start
+
+        later_calls = min(timeit.repeat(
+            lambda: config_class.parse_args(arguments, engine=engine),
+            number=num_calls, repeat=3,
+        )) / num_calls
+        print(f'{engine:>8}: first call {first_call * 1e3:8.2f} ms, '
+              f'later calls {later_calls * 1e3:8.2f} ms')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,59 @@
+"""Benchmark creating configs with large `list` and array fields.
+
+```sh
+PYTHONPATH=. python benchmarks/bench_array.py [list_length]
+```
+"""
+
+import sys
+import timeit
+import tracemalloc
+from array import array
+from dataclasses import dataclass, field
+
+from rootconfig import RootConfig
+
+
+@dataclass
+class Config(RootConfig):
+    schedule: list[float] = field(default_factory=list)
+
+
+@dataclass
+class ArrayConfig(RootConfig):
+    schedule: list[float] = field(
+        default_factory=list, metadata={'storage': 'array'}
+    )
+
+
+def main(list_length: int = 1_000_000):
+    schedule = [i / list_length for i in range(list_length)]
+    schedule_array = array('d', schedule)
+    print(f'{list_length} floats')
+
+    def report(label: str, function):
+        seconds = min(timeit.repeat(function, number=5, repeat=3)) / 5
+        print(f'{label:32} {seconds * 1e3:8.2f} ms')
+
+    report('list field, list', lambda: Config(schedule))
+    report('list field, array', lambda: Config(schedule_array))
+    report('array storage, list', lambda: ArrayConfig(schedule))
+    report('array storage, array', lambda: ArrayConfig(schedule_array))
+
+    def values():
+        return (i / list_length for i in range(list_length))
+
+    for label, create in (
+        ('list', lambda: Config(list(values()))),
+        ('array storage', lambda: ArrayConfig(array('d', values()))),
+    ):
+        tracemalloc.start()
+        config = create()
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del config
+        print(f'{label + " memory":32} {size / 2 ** 20:8.2f} MiB')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
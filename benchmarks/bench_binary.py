@@ -0,0 +1,55 @@
+"""Benchmark the binary format against JSON for configs with large lists.
+
+```sh
+PYTHONPATH=. python benchmarks/bench_binary.py [list_length]
+```
+"""
+
+import os
+import sys
+import timeit
+from dataclasses import dataclass, field
+from fractions import Fraction
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from rootconfig import RootConfig
+
+
+@dataclass
+class Config(RootConfig):
+    epoch: int = 1
+    schedule: list[float] = field(default_factory=list)
+    steps: list[int] = field(default_factory=list)
+    masks: list[bool] = field(default_factory=list)
+    ratios: list[Fraction] = field(default_factory=list)
+
+
+def main(list_length: int = 1_000_000):
+    config = Config(
+        schedule=[i / list_length for i in range(list_length)],
+        steps=list(range(list_length)),
+        masks=[i % 3 == 0 for i in range(list_length)],
+        ratios=[Fraction(i, 7) for i in range(list_length // 100)],
+    )
+    print(f'{list_length} floats, ints and bools, '
+          f'{list_length // 100} fractions')
+
+    def report(label: str, function):
+        seconds = min(timeit.repeat(function, number=1, repeat=3))
+        print(f'{label:16} {seconds * 1e3:8.1f} ms')
+
+    with TemporaryDirectory() as directory:
+        json_file = Path(directory) / 'config.json'
+        binary_file = Path(directory) / 'config.rcfg'
+
+        report('to_json', lambda: config.to_json(json_file))
+        report('to_binary', lambda: config.to_binary(binary_file))
+        report('from_json', lambda: Config.from_json(json_file))
+        report('from_binary', lambda: Config.from_binary(binary_file))
+        print(f'JSON size   {os.path.getsize(json_file) / 2 ** 20:8.2f} MiB')
+        print(f'binary size {os.path.getsize(binary_file) / 2 ** 20:8.2f} MiB')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
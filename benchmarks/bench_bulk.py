@@ -0,0 +1,69 @@
+"""Benchmark loading a directory of experiment configs with `load_many`.
+
+Writes a synthetic directory of `<seed>/config.json` files, then
+compares a serial `from_json` loop with thread and process pools.
+The pools only pay off with several cores.
+
+```sh
+PYTHONPATH=. python benchmarks/bench_bulk.py [num_files] [workers]
+```
+"""
+
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Literal
+
+from rootconfig import RootConfig
+from rootconfig.bulk import expand_paths
+
+
+@dataclass
+class Config(RootConfig):
+    learning_rate: float = 1e-3
+    batch_size: int = 32
+    optimizer: Literal['Adam', 'AdamW', 'SGD'] = 'Adam'
+    margin: Decimal = Decimal('0.5')
+    output_path: Path = Path('outputs')
+    schedule: list[float] = field(default_factory=lambda: [0.1] * 16)
+    seed: int = 0
+
+
+def main(num_files: int = 50_000, workers: int | None = None):
+    workers = workers or os.cpu_count()
+    with TemporaryDirectory() as directory:
+        paths = []
+        for seed in range(num_files):
+            run = Path(directory, f'{seed:06}')
+            run.mkdir()
+            Config(seed=seed).to_json(run / 'config.json')
+            paths.append(run / 'config.json')
+        pattern = os.path.join(directory, '*', 'config.json')
+        print(f'{num_files} files, {workers} workers')
+
+        def report(label: str, function):
+            start = time.perf_counter()
+            function()
+            seconds = time.perf_counter() - start
+            print(f'{label:24} {seconds * 1e3:8.1f} ms')
+
+        [Config.from_json(path) for path in paths]  # warm the page cache
+        report('glob', lambda: expand_paths(pattern))
+        report('serial from_json', lambda: [
+            Config.from_json(path) for path in paths
+        ])
+        for executor in ('thread', 'process'):
+            report(f'load_many {executor}', lambda: Config.load_many(
+                paths, workers, executor  # type: ignore
+            ))
+        report('load_many process none', lambda: Config.load_many(
+            paths, workers, 'process', validate='none'
+        ))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
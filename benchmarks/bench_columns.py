@@ -0,0 +1,54 @@
+"""Benchmark converting config collections to columns.
+
+Compares one `to_dict` per instance, then transposing, against
+`to_columns`, and `from_columns` against `from_records`.
+
+```sh
+PYTHONPATH=. python benchmarks/bench_columns.py [num_configs]
+```
+"""
+
+import sys
+import timeit
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Literal
+
+from rootconfig import RootConfig
+
+
+@dataclass
+class Config(RootConfig):
+    learning_rate: float = 1e-3
+    batch_size: int = 32
+    optimizer: Literal['Adam', 'AdamW', 'SGD'] = 'Adam'
+    debug: bool = False
+    output_path: Path = Path('outputs')
+    schedule: list[float] = field(default_factory=lambda: [0.1] * 8)
+    seed: int = 0
+
+
+def main(num_configs: int = 100_000):
+    configs = [Config(seed=seed) for seed in range(num_configs)]
+    names = Config._compiled_schema().names
+    print(f'{num_configs} configs')
+
+    def report(label: str, function):
+        seconds = min(timeit.repeat(function, number=1, repeat=3))
+        print(f'{label:24} {seconds * 1e3:8.1f} ms')
+
+    def to_dicts():
+        rows = [config.to_dict() for config in configs]
+        return {name: [row[name] for row in rows] for name in names}
+
+    report('to_dict per row', to_dicts)
+    report('to_columns', lambda: Config.to_columns(configs))
+
+    records = [config.to_dict(copy='none') for config in configs]
+    columns = Config.to_columns(configs)
+    report('from_records', lambda: Config.from_records(records))
+    report('from_columns', lambda: Config.from_columns(columns))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
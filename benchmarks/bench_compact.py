@@ -0,0 +1,52 @@
+"""Benchmark the memory of plain and compact `RootConfig` instances.
+
+```sh
+PYTHONPATH=. python benchmarks/bench_compact.py [num_instances]
+```
+"""
+
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from typing import Literal
+
+from rootconfig import RootConfig, config_dataclass
+
+
+@dataclass
+class Config(RootConfig):
+    learning_rate: float
+    batch_size: int
+    dropout: float
+    optimizer: Literal['Adam', 'AdamW', 'SGD']
+    seed: int = 0
+    debug: bool = False
+
+
+@config_dataclass(compact=True)
+class CompactConfig(RootConfig):
+    learning_rate: float
+    batch_size: int
+    dropout: float
+    optimizer: Literal['Adam', 'AdamW', 'SGD']
+    seed: int = 0
+    debug: bool = False
+
+
+def main(num_instances: int = 100_000):
+    # Shared values, so that only the instances themselves are measured.
+    values = [(1e-3, 32, 0.1, 'Adam')] * num_instances
+    print(f'{num_instances} instances with 6 fields')
+
+    for config_class in (Config, CompactConfig):
+        config_class(*values[0])
+        tracemalloc.start()
+        instances = [config_class(*args) for args in values]
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f'{config_class.__name__:14} {size / 2 ** 20:8.2f} MiB, '
+              f'{size / len(instances):6.1f} bytes/instance')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,49 @@
+"""Benchmark deriving config variants with `evolve` and `dataclasses.replace`.
+
+```sh
+PYTHONPATH=. python benchmarks/bench_evolve.py [num_variants]
+```
+"""
+
+import sys
+import timeit
+from dataclasses import dataclass, field, replace
+from decimal import Decimal
+from fractions import Fraction
+from typing import Literal
+
+from rootconfig import RootConfig
+
+
+@dataclass
+class Config(RootConfig):
+    learning_rate: float = 1e-3
+    batch_size: int = 32
+    optimizer: Literal['Adam', 'AdamW', 'SGD'] = 'Adam'
+    margin: Decimal = Decimal('0.5')
+    ratios: list[Fraction] = field(
+        default_factory=lambda: [Fraction(i, 7) for i in range(1000)]
+    )
+    seed: int = 0
+
+
+def main(num_variants: int = 100_000):
+    config = Config()
+    seeds = range(num_variants)
+    print(f'{num_variants} variants of a config with a 1000-element list')
+
+    def report(label: str, function):
+        seconds = min(timeit.repeat(function, number=1, repeat=3))
+        print(f'{label:24} {seconds * 1e3:8.1f} ms')
+
+    report('dataclasses.replace', lambda: [
+        replace(config, seed=seed) for seed in seeds
+    ])
+    report('evolve', lambda: [config.evolve(seed=seed) for seed in seeds])
+    report('evolve_many', lambda: config.evolve_many(
+        {'seed': seed} for seed in seeds
+    ))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
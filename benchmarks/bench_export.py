@@ -0,0 +1,64 @@
+"""Benchmark exporting configs with large list fields.
+
+Compares `to_dict` copy modes, and `to_json` against dumping
+a deep copy through `json.dump`, in time and peak traced memory.
+
+```sh
+PYTHONPATH=. python benchmarks/bench_export.py [list_length]
+```
+"""
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from tempfile import TemporaryDirectory
+
+from rootconfig import RootConfig
+from rootconfig.rootconfig import RootConfigJSONEncoder
+
+
+@dataclass
+class Config(RootConfig):
+    epoch: int = 1
+    schedule: list[float] = field(default_factory=list)
+    layers: list[int] = field(default_factory=list)
+
+
+def measure(label: str, function):
+    start = time.perf_counter()
+    function()
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f'{label:24} {seconds * 1e3:8.2f} ms {peak / 2 ** 20:8.2f} MiB')
+
+
+def main(list_length: int = 1_000_000):
+    config = Config(
+        schedule=[i / list_length for i in range(list_length)],
+        layers=list(range(list_length)),
+    )
+    print(f'2 lists of {list_length} values')
+
+    for copy in ('deep', 'shallow', 'none'):
+        measure(f"to_dict(copy='{copy}')", lambda: config.to_dict(copy=copy))
+
+    with TemporaryDirectory() as directory:
+        json_file = os.path.join(directory, 'config.json')
+
+        def dump_deep_copy():
+            with open(json_file, 'w') as f:
+                json.dump(config.to_dict(), f, cls=RootConfigJSONEncoder)
+
+        measure('json.dump(to_dict())', dump_deep_copy)
+        measure('to_json()', lambda: config.to_json(json_file))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
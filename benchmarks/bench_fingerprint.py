@@ -0,0 +1,49 @@
+"""Benchmark fingerprinting and hashing `RootConfig` instances.
+
+```sh
+PYTHONPATH=. python benchmarks/bench_fingerprint.py [num_instances]
+```
+"""
+
+import sys
+import time
+from dataclasses import field
+from fractions import Fraction
+from typing import Literal
+
+from rootconfig import RootConfig, config_dataclass
+
+
+@config_dataclass(hashable=True)
+class Config(RootConfig):
+    learning_rate: float
+    batch_size: int
+    optimizer: Literal['Adam', 'AdamW', 'SGD'] = 'Adam'
+    ratios: list[Fraction] = field(default_factory=lambda: [Fraction(1, 3)])
+    seed: int = 0
+
+
+def main(num_instances: int = 100_000):
+    configs = [Config(1e-3, 32, seed=i) for i in range(num_instances)]
+    print(f'{num_instances} instances')
+
+    start = time.perf_counter()
+    for config in configs:
+        config.fingerprint()
+    elapsed = time.perf_counter() - start
+    print(f'first fingerprint {elapsed:8.3f} s')
+
+    start = time.perf_counter()
+    table = {config: None for config in configs}
+    elapsed = time.perf_counter() - start
+    print(f'cached hash       {elapsed:8.3f} s')
+
+    start = time.perf_counter()
+    for config in configs:
+        assert config in table
+    elapsed = time.perf_counter() - start
+    print(f'dict lookup       {elapsed:8.3f} s')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,72 @@
+"""Benchmark `ConfigIndex` against filtering freshly loaded configs.
+
+Writes a synthetic directory of `<seed>/config.json` files, then times
+one query by loading every file, the first and the incremental scans of
+the index, and the same query on the index.
+
+```sh
+PYTHONPATH=. python benchmarks/bench_index.py [num_files]
+```
+"""
+
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Literal
+
+from rootconfig import RootConfig
+from rootconfig.bulk import expand_paths
+from rootconfig.index import ConfigIndex
+
+
+@dataclass
+class Config(RootConfig):
+    learning_rate: float = 1e-3
+    batch_size: int = 32
+    optimizer: Literal['Adam', 'AdamW', 'SGD'] = 'Adam'
+    seed: int = 0
+
+
+def main(num_files: int = 20_000):
+    optimizers = ('Adam', 'AdamW', 'SGD')
+    with TemporaryDirectory() as directory:
+        root = Path(directory, 'runs')
+        for seed in range(num_files):
+            run = root / f'{seed:06}'
+            run.mkdir(parents=True)
+            Config(
+                10. ** -(seed % 5), 2 ** (seed % 8), optimizers[seed % 3], seed
+            ).to_json(run / 'config.json')
+        print(f'{num_files} files')
+
+        def report(label: str, function):
+            start = time.perf_counter()
+            result = function()
+            seconds = time.perf_counter() - start
+            print(f'{label:24} {seconds * 1e3:10.1f} ms')
+            return result
+
+        def load_and_filter():
+            configs = [
+                (path, Config.from_json(path))  # type: ignore
+                for path in expand_paths(root / '**' / 'config.json')
+            ]
+            return [
+                path for path, config in configs
+                if config.optimizer == 'AdamW' and config.learning_rate < 1e-3
+            ]
+
+        expected = report('load and filter', load_and_filter)
+        with ConfigIndex(Config, Path(directory, 'index.sqlite')) as index:
+            report('first scan', lambda: index.scan(root))
+            report('incremental scan', lambda: index.scan(root))
+            paths = report('query', lambda: index.query(
+                optimizer='AdamW', learning_rate__lt=1e-3
+            ))
+        assert sorted(paths) == sorted(expected)
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,73 @@
+"""Benchmark JSON encoding and decoding of configs with large list fields.
+
+Compares the type-dispatch encoder with an `isinstance` chain encoder,
+and the object hook run on every `Object` by the C decoder, which
+`from_json` uses, with decoding only the fields that need it after
+parsing, which is used for records parsed without the hook.
+
+```sh
+PYTHONPATH=. python benchmarks/bench_json.py [list_length]
+```
+"""
+
+import json
+import sys
+import timeit
+from dataclasses import dataclass, field
+from decimal import Decimal
+from fractions import Fraction
+from pathlib import Path
+from typing import Any
+
+from rootconfig import RootConfig
+from rootconfig.rootconfig import (RootConfigJSONEncoder,
+                                   root_config_json_decode_object_hook)
+
+
+class IsinstanceChainEncoder(json.JSONEncoder):
+    def default(self, o: Any) -> Any:
+        for cls in (complex, Decimal, Fraction, Path):
+            if isinstance(o, cls):
+                return {'__custom_type__': cls.__name__, '__value__': str(o)}
+        return super().default(o)
+
+
+@dataclass
+class Config(RootConfig):
+    epoch: int = 1
+    schedule: list[float] = field(default_factory=list)
+    ratios: list[Fraction] = field(default_factory=list)
+    paths: list[Path] = field(default_factory=list)
+
+
+def main(list_length: int = 100_000):
+    config = Config(
+        schedule=[i / list_length for i in range(list_length)],
+        ratios=[Fraction(i, 7) for i in range(list_length // 10)],
+        paths=[Path(f'data/{i}.wav') for i in range(list_length // 10)],
+    )
+    data = config.to_dict()
+    encoded = json.dumps(data, cls=RootConfigJSONEncoder)
+    assert encoded == json.dumps(data, cls=IsinstanceChainEncoder)
+    print(f'{list_length} floats, {list_length // 10} fractions and paths')
+
+    def report(label: str, function):
+        seconds = min(timeit.repeat(function, number=5, repeat=3)) / 5
+        print(f'{label:28} {seconds * 1e3:8.2f} ms')
+
+    report('encode, isinstance chain', lambda: json.dumps(
+        data, cls=IsinstanceChainEncoder
+    ))
+    report('encode, type dispatch', lambda: json.dumps(
+        data, cls=RootConfigJSONEncoder
+    ))
+    report('decode, hook on every object', lambda: Config.from_dict(
+        json.loads(encoded, object_hook=root_config_json_decode_object_hook)
+    ))
+    report('decode, schema aware', lambda: Config._from_json_object(
+        json.loads(encoded)
+    ))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
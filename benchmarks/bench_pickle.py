@@ -0,0 +1,79 @@
+"""Benchmark pickling `RootConfig` instances and broadcasting one to workers.
+
+Compares the `RootConfig.__reduce__` path against the default pickling of
+an equivalent plain dataclass, then compares sending one large config to
+every task of a process pool as a pickle against sending a `SharedConfig`.
+
+```sh
+PYTHONPATH=. python benchmarks/bench_pickle.py [num_configs] [num_tasks]
+```
+"""
+
+import pickle
+import sys
+import timeit
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Literal
+
+from rootconfig import RootConfig
+from rootconfig.shared import SharedConfig
+
+
+@dataclass
+class Config(RootConfig):
+    learning_rate: float = 1e-3
+    batch_size: int = 32
+    optimizer: Literal['Adam', 'AdamW', 'SGD'] = 'Adam'
+    schedule: list[float] = field(default_factory=lambda: [0.1] * 8)
+    seed: int = 0
+
+
+@dataclass
+class PlainConfig:
+    learning_rate: float = 1e-3
+    batch_size: int = 32
+    optimizer: Literal['Adam', 'AdamW', 'SGD'] = 'Adam'
+    schedule: list[float] = field(default_factory=lambda: [0.1] * 8)
+    seed: int = 0
+
+
+def schedule_length(config: Config) -> int:
+    return len(config.schedule)
+
+
+def shared_schedule_length(shared: SharedConfig[Config]) -> int:
+    return len(shared.get().schedule)
+
+
+def main(num_configs: int = 100_000, num_tasks: int = 2000):
+    def report(label: str, function):
+        seconds = min(timeit.repeat(function, number=1, repeat=3))
+        print(f'{label:28} {seconds * 1e3:8.1f} ms')
+
+    print(f'{num_configs} configs')
+    for config_class in (PlainConfig, Config):
+        configs = [config_class(seed=seed) for seed in range(num_configs)]
+        data = pickle.dumps(configs, pickle.HIGHEST_PROTOCOL)
+        label = config_class.__name__
+        print(f'{label + " size:":28} {len(data) / num_configs:8.1f} '
+              f'bytes/config')
+        report(f'{label} dumps', lambda: pickle.dumps(
+            configs, pickle.HIGHEST_PROTOCOL
+        ))
+        report(f'{label} loads', lambda: pickle.loads(data))
+
+    config = Config(schedule=[0.1] * 1_000_000)
+    print(f'{num_tasks} tasks with a config of 1M floats')
+    with ProcessPoolExecutor() as executor:
+        report('pickled config', lambda: list(executor.map(
+            schedule_length, [config] * num_tasks, chunksize=16
+        )))
+        with SharedConfig(config) as shared:
+            report('SharedConfig', lambda: list(executor.map(
+                shared_schedule_length, [shared] * num_tasks, chunksize=16
+            )))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
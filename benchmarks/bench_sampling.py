@@ -0,0 +1,70 @@
+"""Benchmark `ConfigSampler` against sampling one config at a time.
+
+Only the NumPy backend is faster: without NumPy, drawing and mapping
+the uniforms costs about as much as the `random` calls it replaces.
+
+```sh
+PYTHONPATH=. python benchmarks/bench_sampling.py [num_configs]
+```
+"""
+
+import math
+import random
+import sys
+import time
+from dataclasses import dataclass
+from typing import Literal
+
+from rootconfig import RootConfig
+from rootconfig.sampling import (Choice, ConfigSampler, IntUniform,
+                                 LogUniform, Uniform, np)
+
+
+@dataclass
+class Config(RootConfig):
+    learning_rate: float
+    dropout: float
+    batch_size: int
+    optimizer: Literal['Adam', 'AdamW', 'SGD']
+    weight_decay: float = 0.
+
+
+def one_at_a_time(num_configs: int):
+    rng = random.Random(0)
+    return [
+        Config(
+            learning_rate=math.exp(rng.uniform(math.log(1e-5), math.log(.1))),
+            dropout=rng.uniform(0., .5),
+            batch_size=rng.randint(16, 256),
+            optimizer=rng.choice(['Adam', 'AdamW', 'SGD']),
+        )
+        for _ in range(num_configs)
+    ]
+
+
+def main(num_configs: int = 1_000_000):
+    distributions = {
+        'learning_rate': LogUniform(1e-5, 1e-1),
+        'dropout': Uniform(0., .5),
+        'batch_size': IntUniform(16, 256),
+        'optimizer': Choice(['Adam', 'AdamW', 'SGD']),
+    }
+    print(f'{num_configs} configs')
+
+    start = time.perf_counter()
+    one_at_a_time(num_configs)
+    print(f'one at a time:   {time.perf_counter() - start:8.2f} s')
+
+    for backend in ('python', 'numpy'):
+        if backend == 'numpy' and np is None:
+            continue
+        sampler = ConfigSampler(Config, distributions, backend=backend)
+        start = time.perf_counter()
+        for _ in sampler.batches(num_configs, batch_size=65536):
+            pass
+        print(f'{backend + " sampler:":16} '
+              f'{time.perf_counter() - start:8.2f} s')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
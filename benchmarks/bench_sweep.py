@@ -0,0 +1,63 @@
+"""Benchmark `run_sweep` and its restart.
+
+Runs a cheap function over a lazy sweep of configs, then runs the same
+sweep again, which only has to skip the completed configs, and reports
+the peak memory of both with `tracemalloc`.
+
+```sh
+PYTHONPATH=. python benchmarks/bench_sweep.py [num_configs] [workers]
+```
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from tempfile import TemporaryDirectory
+
+from rootconfig import RootConfig
+from rootconfig.sweep import run_sweep
+
+
+@dataclass
+class Config(RootConfig):
+    learning_rate: float = 1e-3
+    batch_size: int = 32
+    seed: int = 0
+
+
+def train(config: Config) -> float:
+    return config.learning_rate * config.batch_size + config.seed
+
+
+def sweep(num_configs: int):
+    for seed in range(num_configs):
+        yield Config(10. ** -(seed % 5), 2 ** (seed % 8), seed)
+
+
+def main(num_configs: int = 20_000, workers: int = 2):
+    with TemporaryDirectory() as directory:
+        results_path = os.path.join(directory, 'results.jsonl')
+        print(f'{num_configs} configs, {workers} workers')
+
+        def report(label: str):
+            tracemalloc.start()
+            start = time.perf_counter()
+            summary = run_sweep(
+                train, sweep(num_configs), results_path, workers=workers
+            )
+            seconds = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(
+                f'{label:12} {seconds * 1e3:10.1f} ms '
+                f'{peak / 2 ** 20:8.2f} MiB peak  {summary}'
+            )
+
+        report('first run')
+        report('restart')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,75 @@
+"""Benchmark the per-instance cost of `RootConfig` validation.
+
+Builds a wide config class and compares instantiation with the cached,
+compiled schema against recompiling the schema for every instance,
+which is what each instantiation used to pay,
+then compares the validation levels.
+
+```sh
+PYTHONPATH=. python benchmarks/bench_validation.py [num_fields] [num_instances]
+```
+"""
+
+import sys
+import timeit
+from dataclasses import field, make_dataclass
+from typing import Literal
+
+from rootconfig import RootConfig, validation_level
+
+
+def make_wide_config(num_fields: int):
+    field_specs = []
+    for i in range(num_fields):
+        match i % 4:
+            case 0:
+                field_specs.append((f'int_{i}', int, field(default=i)))
+            case 1:
+                field_specs.append((f'float_{i}', float, field(default=0.1)))
+            case 2:
+                field_specs.append((
+                    f'choice_{i}', Literal['a', 'b', 'c'],
+                    field(default='b')
+                ))
+            case 3:
+                field_specs.append((
+                    f'list_{i}', list[float],
+                    field(default_factory=lambda: [0.1] * 8)
+                ))
+    return make_dataclass('WideConfig', field_specs, bases=(RootConfig,))
+
+
+def main(num_fields: int = 200, num_instances: int = 2000):
+    config_class = make_wide_config(num_fields)
+
+    def cached():
+        config_class()
+
+    def recompiled():
+        config_class.clear_cache()
+        config_class()
+
+    cached()
+    cached_time = min(timeit.repeat(cached, number=num_instances, repeat=3))
+    recompiled_time = min(
+        timeit.repeat(recompiled, number=num_instances, repeat=3)
+    )
+
+    print(f'{num_fields} fields, {num_instances} instances')
+    print(f'recompiled schema: {recompiled_time / num_instances * 1e6:9.2f} '
+          f'us/instance')
+    print(f'cached schema:     {cached_time / num_instances * 1e6:9.2f} '
+          f'us/instance')
+    print(f'speedup:           {recompiled_time / cached_time:9.2f}x')
+
+    for level in ('full', 'values-only', 'none'):
+        with validation_level(level):  # type: ignore
+            level_time = min(
+                timeit.repeat(cached, number=num_instances, repeat=3)
+            )
+        print(f'{level + ":":18} {level_time / num_instances * 1e6:9.2f} '
+              f'us/instance')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
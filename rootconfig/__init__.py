@@ -1,4 +1,9 @@
-from .rootconfig import RootConfig
+from .grid import ConfigGrid
+from .rootconfig import (RootConfig, ValidationLevel, config_dataclass,
+                         register_json_type, validation_level)
 
-__all__ = ['RootConfig']
+__all__ = [
+    'ConfigGrid', 'RootConfig', 'ValidationLevel', 'config_dataclass',
+    'register_json_type', 'validation_level',
+]
 __version__ = '1.0.0'
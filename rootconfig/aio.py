@@ -0,0 +1,138 @@
+"""
+asyncio-native JSON import/export of `RootConfig` instances.
+
+The blocking `from_json` and `to_json` run in a bounded thread pool,
+shared by the whole process unless another executor is given, so that
+the event loop keeps running while files are read, decoded, encoded, or
+written. Bulk variants additionally cap how many files are in flight.
+
+Cancelling a coroutine stops waiting at once, and files that have not
+been started are never opened, but a file already being read or written
+by a thread is finished in the background.
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import (TYPE_CHECKING, Any, Awaitable, Callable, Iterable,
+                    TypeVar)
+
+if TYPE_CHECKING:
+    from .rootconfig import RootConfig, ValidationLevel
+
+C = TypeVar('C', bound='RootConfig')
+T = TypeVar('T')
+
+DEFAULT_LIMIT = 32
+
+_default_executor: ThreadPoolExecutor | None = None
+_default_executor_lock = threading.Lock()
+
+
+def default_executor() -> ThreadPoolExecutor:
+    """Return the thread pool shared by the coroutines of this module."""
+
+    global _default_executor
+    if _default_executor is None:
+        with _default_executor_lock:
+            if _default_executor is None:
+                _default_executor = ThreadPoolExecutor(
+                    DEFAULT_LIMIT, thread_name_prefix='rootconfig-io'
+                )
+    return _default_executor
+
+
+async def _run(executor: Executor | None, function: Callable[[], T]) -> T:
+    return await asyncio.get_running_loop().run_in_executor(
+        executor or default_executor(), function
+    )
+
+
+async def afrom_json(
+    config_class: type[C], json_file: os.PathLike | str,
+    validate: 'ValidationLevel | None' = None,
+    executor: Executor | None = None,
+) -> C:
+    """Create an instance from a JSON file without blocking the loop."""
+
+    return await _run(executor, partial(
+        config_class.from_json, json_file, validate  # type: ignore
+    ))
+
+
+async def ato_json(
+    config: 'RootConfig', json_file: os.PathLike | str,
+    executor: Executor | None = None,
+):
+    """Export an instance to a JSON file without blocking the loop."""
+
+    await _run(executor, partial(config.to_json, json_file))  # type: ignore
+
+
+async def _gather_limited(
+    functions: Iterable[Callable[[], Awaitable[Any]]], limit: int,
+    return_exceptions: bool,
+) -> list[Any]:
+    """Await coroutine functions, at most `limit` at a time.
+
+    Coroutines are only created once a slot is free, so that cancelled
+    ones waiting for a slot are never created. On the first error, or on
+    cancellation, the remaining ones are cancelled.
+    """
+
+    if limit < 1:
+        raise ValueError(f'`limit` must be positive, but got {limit}.')
+    semaphore = asyncio.Semaphore(limit)
+
+    async def limited(function: Callable[[], Awaitable[Any]]):
+        async with semaphore:
+            return await function()
+
+    tasks = [
+        asyncio.ensure_future(limited(function)) for function in functions
+    ]
+    try:
+        return await asyncio.gather(
+            *tasks, return_exceptions=return_exceptions
+        )
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+async def afrom_json_many(
+    config_class: type[C], json_files: Iterable[os.PathLike | str],
+    limit: int = DEFAULT_LIMIT, return_exceptions: bool = False,
+    validate: 'ValidationLevel | None' = None,
+    executor: Executor | None = None,
+) -> list[C]:
+    """Create instances from JSON files, at most `limit` at a time.
+
+    Return the instances in order. The first error is raised unless
+    `return_exceptions` is `True`, in which case errors are returned in
+    place of their instances, like `asyncio.gather`.
+    """
+
+    return await _gather_limited((
+        partial(afrom_json, config_class, json_file, validate, executor)
+        for json_file in json_files
+    ), limit, return_exceptions)
+
+
+async def ato_json_many(
+    items: Iterable[tuple['RootConfig', os.PathLike | str]],
+    limit: int = DEFAULT_LIMIT, return_exceptions: bool = False,
+    executor: Executor | None = None,
+) -> list[Exception | None]:
+    """Export `(instance, path)` pairs to JSON files, `limit` at a time.
+
+    Errors are handled like `afrom_json_many`.
+    """
+
+    return await _gather_limited((
+        partial(ato_json, config, json_file, executor)
+        for config, json_file in items
+    ), limit, return_exceptions)
@@ -0,0 +1,370 @@
+"""
+`ConfigArchive`: a content-addressed, deduplicating store of configs.
+
+An archive is an append-only data file and an offset index next to it,
+`<path>.index`. Each distinct config is stored once, under its
+`fingerprint`, in the compact binary format (see `rootconfig.binary`),
+optionally compressed with `zlib` or `lzma`.
+
+Layout of the data file, little-endian:
+
+- The magic `b'RCAR'`, the format version (`u8`), and 3 padding bytes.
+- One record per config: the 32 bytes of the SHA-256 digest,
+  the compression (`u8`, 0 for none, 1 for `zlib`, and 2 for `lzma`),
+  7 padding bytes, the length of the payload (`u64`), and the payload.
+
+The index file has the magic `b'RCAI'`, the version, 3 padding bytes,
+and one `(digest, offset of the record)` entry per record. It is read
+into a `dict` when the archive is opened, and records are read through a
+memory map of the data file, so that a lookup by digest is O(1).
+
+Records are written before their index entries. On opening, the records
+past the last indexed one are indexed, a partially written last record
+is cut off, and an index that does not match the data file is rebuilt.
+"""
+
+import lzma
+import mmap
+import os
+import struct
+import zlib
+from typing import (TYPE_CHECKING, Generic, Iterable, Iterator, Literal,
+                    TypeVar)
+
+from .binary import decode
+
+if TYPE_CHECKING:
+    from .rootconfig import RootConfig, ValidationLevel
+
+C = TypeVar('C', bound='RootConfig')
+
+Compression = Literal['zlib', 'lzma']
+
+MAGIC = b'RCAR'
+INDEX_MAGIC = b'RCAI'
+VERSION = 1
+
+_PREAMBLE = struct.Struct('<4sB3x')
+_RECORD = struct.Struct('<32sB7xQ')
+_ENTRY = struct.Struct('<32sQ')
+
+_COMPRESSION_CODES: dict[Compression | None, int] = {
+    None: 0, 'zlib': 1, 'lzma': 2,
+}
+_COMPRESSORS = {1: zlib.compress, 2: lzma.compress}
+_DECOMPRESSORS = {1: zlib.decompress, 2: lzma.decompress}
+
+
+class ConfigArchive(Generic[C]):
+    """An archive of instances of one `RootConfig` class, keyed by digest.
+
+    Digests are the hexadecimal `fingerprint`s of the instances.
+    `compression` applies to the configs added from now on, and a config
+    is only stored compressed if that makes it smaller. A `readonly`
+    archive neither creates nor modifies any file.
+
+    ```python
+    with ConfigArchive(Config, 'configs.rcar', compression='zlib') as a:
+        digest = a.add(config)
+        assert a[digest] == config
+    ```
+
+    An archive expects one writer at a time. Readers in other processes
+    see the configs added before they opened the archive.
+    """
+
+    def __init__(
+        self, config_class: type[C], path: os.PathLike | str,
+        compression: Compression | None = None, readonly: bool = False,
+    ):
+        if compression not in _COMPRESSION_CODES:
+            raise ValueError(
+                f'`{compression}` is not one of `zlib` or `lzma`.'
+            )
+        self.config_class = config_class
+        self.path = os.fspath(path)
+        self.index_path = self.path + '.index'
+        self.compression = compression
+        self.readonly = readonly
+        self._offsets: dict[bytes, int] = dict()
+        self._mapped: mmap.mmap | None = None
+        self._open()
+
+    def _open(self):
+        self._index = None
+        self._data = (
+            open(self.path, 'rb') if self.readonly
+            else _open_for_update(self.path, MAGIC)
+        )
+        try:
+            if not self.readonly:
+                self._index = _open_for_update(self.index_path, INDEX_MAGIC)
+            self._check_preamble(self._data.read(_PREAMBLE.size), MAGIC)
+            self._read_index()
+            self._catch_up()
+        except BaseException:
+            self.close()
+            raise
+
+    @staticmethod
+    def _check_preamble(preamble: bytes, magic: bytes):
+        if len(preamble) < _PREAMBLE.size:
+            raise ValueError('Truncated `ConfigArchive` file.')
+        found, version = _PREAMBLE.unpack(preamble)
+        if found != magic:
+            raise ValueError('Not a `ConfigArchive` file.')
+        if version != VERSION:
+            raise ValueError(
+                f'Unsupported `ConfigArchive` format version {version}.'
+            )
+
+    def _read_index(self):
+        if self._index is not None:
+            data = self._index.read()
+        else:
+            try:
+                with open(self.index_path, 'rb') as f:
+                    data = f.read()
+            except FileNotFoundError:
+                return
+        self._check_preamble(data[:_PREAMBLE.size], INDEX_MAGIC)
+        entries = memoryview(data)[_PREAMBLE.size:]
+        complete = len(entries) - len(entries) % _ENTRY.size
+        self._offsets = dict(_ENTRY.iter_unpack(entries[:complete]))
+        if self._index is not None and complete < len(entries):
+            self._index.truncate(_PREAMBLE.size + complete)
+
+    def _record_end(self, offset: int, size: int) -> int:
+        """Return the end of the record at `offset`, or -1 if truncated."""
+
+        if not _PREAMBLE.size <= offset <= size - _RECORD.size:
+            return -1
+        self._data.seek(offset)
+        end = offset + _RECORD.size + _RECORD.unpack(
+            self._data.read(_RECORD.size)
+        )[2]
+        return end if end <= size else -1
+
+    def _catch_up(self):
+        size = os.fstat(self._data.fileno()).st_size
+        end = _PREAMBLE.size
+        if self._offsets:
+            end = self._record_end(
+                next(reversed(self._offsets.values())), size
+            )
+            if end < 0:  # The index does not match the data.
+                self._offsets.clear()
+                end = _PREAMBLE.size
+                if self._index is not None:
+                    self._index.truncate(_PREAMBLE.size)
+
+        new_entries = []
+        while end < size:
+            record_end = self._record_end(end, size)
+            if record_end < 0:
+                if not self.readonly:
+                    self._data.truncate(end)
+                break
+            self._data.seek(end)
+            digest = self._data.read(32)
+            if digest not in self._offsets:
+                self._offsets[digest] = end
+                new_entries.append(_ENTRY.pack(digest, end))
+            end = record_end
+        if self._index is not None:
+            self._index.seek(0, os.SEEK_END)
+            self._index.write(b''.join(new_entries))
+            self._index.flush()
+        self._data.seek(0, os.SEEK_END)
+
+    def _check_writable(self):
+        if self.readonly:
+            raise ValueError(f'`{self.path}` is opened read-only.')
+
+    def _append(self, config: C) -> str:
+        digest = config.fingerprint()
+        key = bytes.fromhex(digest)
+        if key in self._offsets:
+            return digest
+        payload = config.to_bytes()
+        code = _COMPRESSION_CODES[self.compression]
+        if code:
+            compressed = _COMPRESSORS[code](payload)
+            if len(compressed) < len(payload):
+                payload = compressed
+            else:
+                code = 0
+        offset = self._data.tell()
+        self._data.write(_RECORD.pack(key, code, len(payload)))
+        self._data.write(payload)
+        self._offsets[key] = offset
+        self._index.write(_ENTRY.pack(key, offset))  # type: ignore
+        return digest
+
+    def add(self, config: C) -> str:
+        """Store an instance, unless already stored, and return its digest."""
+
+        self._check_writable()
+        digest = self._append(config)
+        self.flush()
+        return digest
+
+    def add_many(self, configs: Iterable[C]) -> list[str]:
+        """Same as `add`, but for many instances, flushed once."""
+
+        self._check_writable()
+        try:
+            return [self._append(config) for config in configs]
+        finally:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered records, and then their index entries."""
+
+        if not self.readonly:
+            self._data.flush()
+            self._index.flush()  # type: ignore
+
+    def _map(self, end: int) -> mmap.mmap:
+        """Return a memory map of the data file, covering `end` bytes."""
+
+        mapped = self._mapped
+        if mapped is None or end > len(mapped):
+            self.flush()
+            if mapped is not None:
+                mapped.close()
+            mapped = self._mapped = mmap.mmap(
+                self._data.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        return mapped
+
+    def _view(self, offset: int) -> tuple[memoryview, bytes, int]:
+        """Return a view of the record at `offset`, its digest and code."""
+
+        start = offset + _RECORD.size
+        digest, code, length = _RECORD.unpack_from(self._map(start), offset)
+        mapped = self._map(start + length)
+        return memoryview(mapped)[offset:start + length], digest, code
+
+    def get(self, digest: str, validate: 'ValidationLevel | None' = None) -> C:
+        """Return the instance stored under a digest.
+
+        Raise `KeyError` if no instance is stored under it.
+        `validate` overrides the validation level, see `ValidationLevel`.
+        """
+
+        try:
+            offset = self._offsets[bytes.fromhex(digest)]
+        except (KeyError, ValueError):
+            raise KeyError(digest) from None
+        record, stored, code = self._view(offset)
+        with record, record[_RECORD.size:] as payload:
+            if stored.hex() != digest:
+                raise ValueError(f'Corrupted record at offset {offset}.')
+            if code:
+                return decode(
+                    self.config_class, _DECOMPRESSORS[code](payload),
+                    validate,
+                )
+            return decode(self.config_class, payload, validate)
+
+    def __getitem__(self, digest: str) -> C:
+        return self.get(digest)
+
+    def __contains__(self, digest: object) -> bool:
+        try:
+            return bytes.fromhex(digest) in self._offsets  # type: ignore
+        except (TypeError, ValueError):
+            return False
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the digests, in the order they were added."""
+
+        return (key.hex() for key in list(self._offsets))
+
+    def items(
+        self, validate: 'ValidationLevel | None' = None,
+    ) -> Iterator[tuple[str, C]]:
+        """Lazily iterate over the digests and instances."""
+
+        for digest in self:
+            yield digest, self.get(digest, validate)
+
+    def compact(self, keep: Iterable[str]) -> int:
+        """Drop the instances whose digests are not in `keep`.
+
+        Both files are rewritten, copying the kept records as they are,
+        and replace the old ones. Return the number of dropped instances.
+        """
+
+        self._check_writable()
+        keys = set()
+        for digest in keep:
+            try:
+                keys.add(bytes.fromhex(digest))
+            except ValueError:
+                pass
+        kept = [
+            (key, offset) for key, offset in self._offsets.items()
+            if key in keys
+        ]
+        data_path = self.path + '.compact'
+        index_path = self.index_path + '.compact'
+        preamble = _PREAMBLE.pack(MAGIC, VERSION)
+        with open(data_path, 'wb') as data, open(index_path, 'wb') as index:
+            data.write(preamble)
+            index.write(_PREAMBLE.pack(INDEX_MAGIC, VERSION))
+            for key, offset in kept:
+                record, _, _ = self._view(offset)
+                with record:
+                    index.write(_ENTRY.pack(key, data.tell()))
+                    data.write(record)
+        dropped = len(self._offsets) - len(kept)
+
+        self.close()
+        # Without an index, an interrupted compaction is caught up from
+        # whichever data file is in place.
+        os.remove(self.index_path)
+        os.replace(data_path, self.path)
+        os.replace(index_path, self.index_path)
+        self._offsets = dict()
+        self._open()
+        return dropped
+
+    def close(self):
+        """Flush and close the files. Closing again does nothing."""
+
+        if self._mapped is not None:
+            self._mapped.close()
+            self._mapped = None
+        for f in (self._data, self._index):
+            if f is not None and not f.closed:
+                f.close()  # Flushing first.
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return (
+            f'{type(self).__name__}({self.config_class.__name__}, '
+            f'{self.path!r})'
+        )
+
+
+def _open_for_update(path: str, magic: bytes):
+    """Open a file for reading and appending, creating it if missing."""
+
+    try:
+        f = open(path, 'r+b')
+    except FileNotFoundError:
+        f = open(path, 'w+b')
+        f.write(_PREAMBLE.pack(magic, VERSION))
+        f.flush()
+        f.seek(0)
+    return f
@@ -0,0 +1,282 @@
+"""
+A compact, versioned binary encoding of `RootConfig` instances.
+
+Layout, little-endian, with every section aligned to 8 bytes:
+
+- The magic `b'RCFG'`, the format version (`u8`), 3 padding bytes,
+  and the length of the header (`u32`).
+- The header: a UTF-8 JSON list of `[field name, code]` pairs,
+  written once, in the order of the values that follow.
+- One value per field, encoded according to its code:
+
+  - `'?'`: a `bool`, as a `u64` 0 or 1.
+  - `'q'`: an `int` fitting in an `i64`.
+  - `'d'`: a `float`, as an IEEE 754 double, including `nan` and `inf`.
+  - `'c'`: a `complex`, as two doubles.
+  - `'n'`, `'s'`, `'p'`, `'f'`, `'D'`: an `int` too large for an `i64`,
+    a `str`, a `Path`, a `Fraction`, and a `Decimal`, as a `u64`
+    length and the UTF-8 bytes of its `str`, which round-trips
+    exactly.
+  - `'[?'`, `'[q'`, `'[d'`: a `list` of `bool`, `int`, or `float`
+    values, as a `u64` length and a raw packed array.
+  - `'[*'`: any other `list`, as a `u64` length, one scalar code byte
+    per element, and the elements.
+
+Decoding reads arrays through `memoryview`s of the input, or of the
+memory-mapped file, without intermediate copies. Packed arrays of fields
+with `'array'` storage are copied straight into `array.array`s, rather
+than through `list`s.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from decimal import Decimal
+from fractions import Fraction
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+if TYPE_CHECKING:
+    from .rootconfig import RootConfig, ValidationLevel
+
+C = TypeVar('C', bound='RootConfig')
+
+MAGIC = b'RCFG'
+VERSION = 1
+
+_PREAMBLE = struct.Struct('<4sB3xI')
+_U64 = struct.Struct('<Q')
+_I64 = struct.Struct('<q')
+_F64 = struct.Struct('<d')
+_C128 = struct.Struct('<dd')
+_I64_MIN, _I64_MAX = -2 ** 63, 2 ** 63 - 1
+_LITTLE_ENDIAN = sys.byteorder == 'little'
+
+_STRING_CODES: dict[type, str] = {
+    str: 's', Fraction: 'f', Decimal: 'D',
+}
+_STRING_DECODERS: dict[str, Callable[[str], Any]] = {
+    'n': int, 's': str, 'p': Path, 'f': Fraction, 'D': Decimal,
+}
+
+
+def _padding(length: int) -> bytes:
+    return bytes(-length % 8)
+
+
+def _scalar_code(value: Any) -> str:
+    if isinstance(value, bool):
+        return '?'
+    if isinstance(value, int):
+        return 'q' if _I64_MIN <= value <= _I64_MAX else 'n'
+    if isinstance(value, float):
+        return 'd'
+    if isinstance(value, complex):
+        return 'c'
+    if isinstance(value, Path):
+        return 'p'
+    for value_type, code in _STRING_CODES.items():
+        if isinstance(value, value_type):
+            return code
+    raise TypeError(f'Cannot encode {type(value)} values.')
+
+
+def _list_code(values: list[Any]) -> str:
+    if not values:
+        return '[*'
+    types = set(map(type, values))
+    if types == {bool}:
+        return '[?'
+    if types == {float}:
+        return '[d'
+    if types == {int} and (
+        _I64_MIN <= min(values) and max(values) <= _I64_MAX
+    ):
+        return '[q'
+    return '[*'
+
+
+def _encode_scalar(code: str, value: Any, chunks: list[bytes]):
+    if code in ('?', 'q'):
+        chunks.append(_I64.pack(value))
+    elif code == 'd':
+        chunks.append(_F64.pack(value))
+    elif code == 'c':
+        chunks.append(_C128.pack(value.real, value.imag))
+    else:
+        encoded = str(value).encode()
+        chunks.append(_U64.pack(len(encoded)))
+        chunks.append(encoded)
+        chunks.append(_padding(len(encoded)))
+
+
+def _packed(typecode: str, values: Any) -> bytes:
+    if _LITTLE_ENDIAN and isinstance(values, array) and (
+        values.typecode == typecode
+    ):
+        return values.tobytes()
+    packed = array(typecode, values)
+    if not _LITTLE_ENDIAN:  # pragma: no cover
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def encode(config: 'RootConfig') -> bytes:
+    """Encode the fields of an instance."""
+
+    schema = type(config)._compiled_schema()
+    values = schema.values_of(config)
+    header = []
+    chunks: list[bytes] = []
+    for field_schema, value in zip(schema.fields, values):
+        if field_schema.kind != 'list':
+            code = _scalar_code(value)
+            _encode_scalar(code, value, chunks)
+        else:
+            if isinstance(value, array) and value.typecode in ('q', 'd'):
+                code = '[' + value.typecode
+            else:
+                if type(value) is not list:
+                    if not hasattr(value, 'tolist'):
+                        raise TypeError(
+                            f'Cannot encode {type(value)} values '
+                            f'of `list` fields.'
+                        )
+                    value = value.tolist()  # Other typed arrays
+                code = _list_code(value)
+            chunks.append(_U64.pack(len(value)))
+            if code == '[?':
+                chunks.append(bytes(value))
+                chunks.append(_padding(len(value)))
+            elif code == '[q':
+                chunks.append(_packed('q', value))
+            elif code == '[d':
+                chunks.append(_packed('d', value))
+            else:
+                codes = ''.join(map(_scalar_code, value))
+                chunks.append(codes.encode())
+                chunks.append(_padding(len(codes)))
+                for element_code, element in zip(codes, value):
+                    _encode_scalar(element_code, element, chunks)
+        header.append([field_schema.name, code])
+
+    encoded_header = json.dumps(header, separators=(',', ':')).encode()
+    return b''.join([
+        _PREAMBLE.pack(MAGIC, VERSION, len(encoded_header)),
+        encoded_header, _padding(_PREAMBLE.size + len(encoded_header)),
+        *chunks,
+    ])
+
+
+class _Reader:
+    """Decode values from a buffer, keeping track of the offset."""
+
+    def __init__(self, view: memoryview, offset: int):
+        self.view = view
+        self.offset = offset
+
+    def _take(self, size: int) -> memoryview:
+        start = self.offset
+        if start + size > len(self.view):
+            raise ValueError('Truncated `RootConfig` binary data.')
+        self.offset = start + size + (-(start + size) % 8)
+        return self.view[start:start + size]
+
+    def scalar(self, code: str) -> Any:
+        if code == '?':
+            return bool(_I64.unpack(self._take(8))[0])
+        if code == 'q':
+            return _I64.unpack(self._take(8))[0]
+        if code == 'd':
+            return _F64.unpack(self._take(8))[0]
+        if code == 'c':
+            return complex(*_C128.unpack(self._take(16)))
+        try:
+            decode = _STRING_DECODERS[code]
+        except KeyError:
+            raise ValueError(f'Unknown value code `{code}`.') from None
+        length = _U64.unpack(self._take(8))[0]
+        return decode(str(self._take(length), 'utf-8'))
+
+    def array(self, typecode: str, length: int) -> list[Any]:
+        size = length * (1 if typecode == '?' else 8)
+        view = self._take(size)
+        if _LITTLE_ENDIAN or typecode == '?':
+            return view.cast(typecode).tolist()
+        unpacked = array(typecode, view)  # pragma: no cover
+        unpacked.byteswap()  # pragma: no cover
+        return unpacked.tolist()  # pragma: no cover
+
+    def packed(self, typecode: str, length: int) -> array:
+        """Read a packed array straight into an `array.array`."""
+
+        packed = array(typecode)
+        packed.frombytes(self._take(length * 8))
+        if not _LITTLE_ENDIAN:  # pragma: no cover
+            packed.byteswap()
+        return packed
+
+    def value(self, code: str, storage_typecode: str | None = None) -> Any:
+        # Fields with `'array'` storage take packed arrays of their
+        # typecode as they are, without an intermediate `list`.
+        if not code.startswith('['):
+            return self.scalar(code)
+        length = _U64.unpack(self._take(8))[0]
+        if code[1:] == storage_typecode:
+            return self.packed(storage_typecode, length)
+        if code in ('[?', '[q', '[d'):
+            return self.array(code[1], length)
+        if code != '[*':
+            raise ValueError(f'Unknown value code `{code}`.')
+        codes = str(self._take(length), 'ascii')
+        return [self.scalar(element_code) for element_code in codes]
+
+
+def decode(
+    config_class: type[C], data: Any,
+    validate: 'ValidationLevel | None' = None,
+) -> C:
+    """Create an instance from encoded bytes or any buffer."""
+
+    with memoryview(data) as view:
+        if len(view) < _PREAMBLE.size:
+            raise ValueError('Truncated `RootConfig` binary data.')
+        magic, version, header_length = _PREAMBLE.unpack_from(view)
+        if magic != MAGIC:
+            raise ValueError('Not `RootConfig` binary data.')
+        if version != VERSION:
+            raise ValueError(
+                f'Unsupported `RootConfig` binary format version {version}.'
+            )
+        reader = _Reader(view, _PREAMBLE.size)
+        header = json.loads(bytes(reader._take(header_length)))
+        storage_typecodes = {
+            name: typecode for name, typecode, _
+            in config_class._compiled_schema().array_fields
+        }
+        values = {
+            name: reader.value(code, storage_typecodes.get(name))
+            for name, code in header
+        }
+    return config_class.from_dict(values, validate)
+
+
+def write(binary_file: os.PathLike | str, config: 'RootConfig'):
+    """Write the encoding of an instance to a file."""
+
+    with open(binary_file, 'wb') as f:
+        f.write(encode(config))
+
+
+def read(
+    config_class: type[C], binary_file: os.PathLike | str,
+    validate: 'ValidationLevel | None' = None,
+) -> C:
+    """Create an instance from a file, through a memory map."""
+
+    with open(binary_file, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return decode(config_class, mapped, validate)
@@ -0,0 +1,119 @@
+"""
+Parallel loading of many `RootConfig` JSON files, such as the `config.json`
+files of a directory of experiments.
+
+Paths are split into chunks, and each chunk is loaded by one task of a
+thread or process pool, so that the per-task overhead is paid once per
+chunk rather than once per file. A file that cannot be loaded is
+reported in its `LoadResult` instead of aborting the whole load.
+"""
+
+import os
+from concurrent.futures import (Executor, Future, ProcessPoolExecutor,
+                                ThreadPoolExecutor, as_completed)
+from glob import glob
+from itertools import islice
+from typing import (TYPE_CHECKING, Iterable, Iterator, Literal, NamedTuple,
+                    TypeVar)
+
+if TYPE_CHECKING:
+    from .rootconfig import RootConfig, ValidationLevel
+
+C = TypeVar('C', bound='RootConfig')
+
+ExecutorKind = Literal['thread', 'process']
+
+
+class LoadResult(NamedTuple):
+    """The outcome of loading one file.
+
+    Exactly one of `config` and `error` is not `None`.
+    """
+
+    path: str
+    config: 'RootConfig | None'
+    error: Exception | None
+
+
+def expand_paths(paths: os.PathLike | str | Iterable[os.PathLike | str]):
+    """Return a list of paths from a glob pattern, or from paths."""
+
+    if isinstance(paths, (str, os.PathLike)):
+        return sorted(glob(os.fspath(paths), recursive=True))
+    return [os.fspath(path) for path in paths]
+
+
+def _load_chunk(
+    config_class: type['RootConfig'], paths: list[str],
+    validate: 'ValidationLevel | None',
+) -> list[LoadResult]:
+    results = []
+    for path in paths:
+        try:
+            config = config_class.from_json(path, validate)  # type: ignore
+        except (OSError, TypeError, ValueError) as e:
+            results.append(LoadResult(path, None, e))
+        else:
+            results.append(LoadResult(path, config, None))
+    return results
+
+
+def _make_executor(executor: ExecutorKind, workers: int | None) -> Executor:
+    match executor:
+        case 'thread':
+            return ThreadPoolExecutor(workers)
+        case 'process':
+            return ProcessPoolExecutor(workers)
+        case _:
+            raise ValueError(
+                f'`{executor}` is not one of `thread` or `process`.'
+            )
+
+
+def iter_load_many(
+    config_class: type[C],
+    paths: os.PathLike | str | Iterable[os.PathLike | str],
+    workers: int | None = None, executor: ExecutorKind = 'thread',
+    ordered: bool = True, chunk_size: int | None = None,
+    validate: 'ValidationLevel | None' = None,
+) -> Iterator[LoadResult]:
+    """Lazily load JSON files in parallel, yielding one result per file.
+
+    Results are yielded in the order of `paths`, or as soon as their
+    chunk is loaded if `ordered` is `False`. Closing the iterator early
+    cancels the chunks that have not started yet.
+    """
+
+    paths = expand_paths(paths)
+    pool = _make_executor(executor, workers)
+    if chunk_size is None:
+        num_workers = getattr(pool, '_max_workers', None) or 1
+        chunk_size = max(1, min(256, len(paths) // (num_workers * 4)))
+    path_iterator = iter(paths)
+    futures: list[Future[list[LoadResult]]] = []
+    try:
+        while chunk := list(islice(path_iterator, chunk_size)):
+            futures.append(
+                pool.submit(_load_chunk, config_class, chunk, validate)
+            )
+        for future in futures if ordered else as_completed(futures):
+            yield from future.result()
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def load_many(
+    config_class: type[C],
+    paths: os.PathLike | str | Iterable[os.PathLike | str],
+    workers: int | None = None, executor: ExecutorKind = 'thread',
+    chunk_size: int | None = None,
+    validate: 'ValidationLevel | None' = None,
+) -> list[LoadResult]:
+    """Load JSON files in parallel, returning one result per file, in order.
+
+    See `iter_load_many`.
+    """
+
+    return list(iter_load_many(
+        config_class, paths, workers, executor, True, chunk_size, validate,
+    ))
@@ -0,0 +1,318 @@
+"""
+`ConfigCache`: an on-disk cache of results keyed by `RootConfig` contents.
+
+Entries are pickled into files named after the key, under a local
+directory that several processes of one machine can share:
+
+- Writes go to a temporary file first, which is then atomically
+  renamed, so that readers never see a partial entry.
+- Reading an entry bumps its modification time, and eviction removes
+  the least recently used entries first, under an exclusive file lock.
+- The total size and number of entries are kept up to date in a small
+  usage file under the same lock, so that storing an entry only scans
+  the directory once a limit is exceeded. Eviction then goes down to
+  90% of the limits, so that the scans are amortized over many stores,
+  and the usage file is recounted from the directory.
+- An entry evicted by another process is simply a miss.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from contextlib import contextmanager
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, TypeVar
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+if TYPE_CHECKING:
+    from .rootconfig import RootConfig
+
+C = TypeVar('C', bound='RootConfig')
+R = TypeVar('R')
+
+_SUFFIX = '.pkl'
+_LOCK_NAME = '.lock'
+_USAGE_NAME = '.usage'
+
+
+class ConfigCache:
+    """A directory of pickled results, with size and LRU eviction limits.
+
+    `max_bytes` and `max_entries` bound the total size and the number
+    of entries. When a stored entry exceeds any of them, the least
+    recently used entries are evicted, down to 90% of the limit.
+    `None` means no limit.
+
+    `hits`, `misses`, and `evictions` count the events of this
+    `ConfigCache` object, in this process.
+
+    Also see `memoize_on_config` decorator.
+    """
+
+    def __init__(
+        self, directory: os.PathLike | str, max_bytes: int | None = None,
+        max_entries: int | None = None,
+    ):
+        for name, limit in (
+            ('max_bytes', max_bytes), ('max_entries', max_entries),
+        ):
+            if limit is not None and limit < 0:
+                raise ValueError(
+                    f'`{name}` should not be negative, but got {limit}.'
+                )
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def key(
+        config: 'RootConfig', fields: Iterable[str] | None = None,
+        namespace: str = '',
+    ) -> str:
+        """Return the cache key of a config.
+
+        The key digests the `fingerprint` of the config, restricted to
+        `fields` if given, together with a `namespace`, such as the name
+        of the function computing the result.
+        """
+
+        fingerprint = config.fingerprint(fields)
+        return hashlib.sha256(
+            f'{namespace}\n{fingerprint}'.encode()
+        ).hexdigest()
+
+    def load(self, key: str) -> Any:
+        """Return the value stored under `key`, or raise `KeyError`."""
+
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            raise KeyError(key) from None
+        except (EOFError, pickle.UnpicklingError):
+            # Not written by `store`; drop it and recompute.
+            self._remove(path)
+            self.misses += 1
+            raise KeyError(key) from None
+        self.hits += 1
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value stored under `key`, or `default`."""
+
+        try:
+            return self.load(key)
+        except KeyError:
+            return default
+
+    def store(self, key: str, value: Any):
+        """Atomically store `value` under `key`, then enforce the limits."""
+
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temporary_path = tempfile.mkstemp(
+            dir=self.directory, prefix='.tmp-'
+        )
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            if self.max_bytes is None and self.max_entries is None:
+                os.replace(temporary_path, path)
+                return
+            size = os.path.getsize(temporary_path)
+            with self._lock():
+                try:
+                    replaced: int | None = os.path.getsize(path)
+                except FileNotFoundError:
+                    replaced = None
+                os.replace(temporary_path, path)
+                usage = self._read_usage()
+                if usage is None:
+                    self._evict()
+                    return
+                total_bytes, count = usage
+                if replaced is None:
+                    total_bytes, count = total_bytes + size, count + 1
+                else:
+                    total_bytes += size - replaced
+                if self._exceeds(total_bytes, count):
+                    self._evict()
+                else:
+                    self._write_usage(total_bytes, count)
+        except BaseException:
+            self._remove(temporary_path)
+            raise
+
+    def evict(self):
+        """Remove the least recently used entries exceeding the limits."""
+
+        with self._lock():
+            self._evict()
+
+    def _exceeds(self, total_bytes: int, count: int) -> bool:
+        return (
+            self.max_bytes is not None and total_bytes > self.max_bytes
+            or self.max_entries is not None and count > self.max_entries
+        )
+
+    def _evict(self):
+        """Evict entries down to 90% of the exceeded limits, and recount.
+
+        The lock must be held.
+        """
+
+        entries = []
+        for path in self._entry_paths():
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        entries.sort()
+
+        total_bytes = sum(size for _, size, _ in entries)
+        count = len(entries)
+        if self._exceeds(total_bytes, count):
+            max_bytes, max_entries = self.max_bytes, self.max_entries
+            if max_bytes is not None:
+                max_bytes -= max_bytes // 10
+            if max_entries is not None:
+                max_entries -= max_entries // 10
+            for _, size, path in entries:
+                if (
+                    (max_bytes is None or total_bytes <= max_bytes)
+                    and (max_entries is None or count <= max_entries)
+                ):
+                    break
+                if self._remove(path):
+                    self.evictions += 1
+                total_bytes -= size
+                count -= 1
+        self._write_usage(total_bytes, count)
+
+    def _read_usage(self) -> tuple[int, int] | None:
+        """Return the recorded total size and number of entries, if any."""
+
+        try:
+            with open(os.path.join(self.directory, _USAGE_NAME)) as f:
+                total_bytes, count = map(int, f.read().split())
+        except (OSError, ValueError):
+            return None
+        return total_bytes, count
+
+    def _write_usage(self, total_bytes: int, count: int):
+        with open(os.path.join(self.directory, _USAGE_NAME), 'w') as f:
+            f.write(f'{total_bytes} {count}\n')
+
+    def clear(self):
+        """Remove all entries."""
+
+        with self._lock():
+            for path in self._entry_paths():
+                self._remove(path)
+            self._write_usage(0, 0)
+
+    def stats(self) -> dict[str, int]:
+        """Return the `hits`, `misses`, and `evictions` counters."""
+
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+    def __repr__(self):
+        return (
+            f'{type(self).__name__}({self.directory!r}, '
+            f'max_bytes={self.max_bytes}, max_entries={self.max_entries})'
+        )
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + _SUFFIX)
+
+    def _entry_paths(self) -> Iterator[str]:
+        for subdirectory in os.scandir(self.directory):
+            if not subdirectory.is_dir() or subdirectory.name.startswith('.'):
+                continue
+            for entry in os.scandir(subdirectory.path):
+                if entry.name.endswith(_SUFFIX):
+                    yield entry.path
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    @contextmanager
+    def _lock(self):
+        """Hold an exclusive lock over the directory, where supported."""
+
+        if fcntl is None:  # pragma: no cover
+            yield
+            return
+        with open(os.path.join(self.directory, _LOCK_NAME), 'a') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def memoize_on_config(
+    cache: ConfigCache, fields: Iterable[str] | None = None,
+) -> Callable[[Callable[[C], R]], Callable[[C], R]]:
+    """Cache the results of a function of a config in a `ConfigCache`.
+
+    The function should be pure, and take the config as its only
+    argument. Results are keyed by the function's qualified name and
+    the fingerprint of the config, restricted to `fields` if given,
+    so that changing any other field still hits the cache.
+
+    ```python
+    cache = ConfigCache('.cache/preprocess', max_bytes=2 ** 30)
+
+    @memoize_on_config(cache, fields=['dataset_path', 'vocab_size'])
+    def preprocess(config: Config) -> Dataset:
+        ...
+    ```
+    """
+
+    if fields is not None:
+        fields = tuple(fields)
+
+    def wrap(function: Callable[[C], R]) -> Callable[[C], R]:
+        namespace = f'{function.__module__}.{function.__qualname__}'
+
+        @wraps(function)
+        def memoized(config: C) -> R:
+            key = cache.key(config, fields, namespace)
+            try:
+                return cache.load(key)
+            except KeyError:
+                pass
+            result = function(config)
+            cache.store(key, result)
+            return result
+
+        memoized.cache = cache  # type: ignore
+        return memoized
+
+    return wrap
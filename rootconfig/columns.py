@@ -0,0 +1,218 @@
+"""
+Columnar export and import of `RootConfig` collections.
+
+A collection of instances becomes one column per field, built in a
+single pass over the instances without any per-instance `dict`:
+
+- `int`, `float`, and `bool` fields, and `int` or `bool` `Literal`
+  fields, become `array.array`s of typecode `'q'`, `'d'`, and `'b'`.
+  `int` columns that do not fit in 64 bits stay `list`s.
+- `str` and `Path` fields, and `str` `Literal` fields, become `list`s in
+  which equal values are the same object, interning `str`s.
+- Other fields become `list`s of the values themselves, which are not
+  copied, so `list` values are shared with the instances.
+
+NumPy and pandas are optional, and only needed by `to_numpy` and
+`to_pandas`.
+"""
+
+import sys
+from array import array
+from operator import attrgetter
+from pathlib import PurePath
+from typing import (TYPE_CHECKING, Any, Iterable, Mapping, Sequence,
+                    TypeVar)
+
+if TYPE_CHECKING:
+    from .rootconfig import FieldSchema, RootConfig, ValidationLevel
+
+C = TypeVar('C', bound='RootConfig')
+
+_typecodes = {int: 'q', float: 'd', bool: 'b'}
+
+
+def _typecode_of(field_schema: 'FieldSchema') -> str | None:
+    if field_schema.kind == 'list':
+        return None
+    return _typecodes.get(field_schema.value_type)
+
+
+def _deduplicated(column: Sequence[Any]) -> list[Any]:
+    unique: dict[Any, Any] = dict()
+    return [unique.setdefault(value, value) for value in column]
+
+
+def _to_column(field_schema: 'FieldSchema', column: Sequence[Any]):
+    typecode = _typecode_of(field_schema)
+    if typecode is not None:
+        try:
+            return array(typecode, column)
+        except OverflowError:
+            return list(column)
+    if field_schema.kind != 'list':
+        if field_schema.value_type is str:
+            return list(map(sys.intern, column))
+        if issubclass(field_schema.value_type, PurePath):
+            return _deduplicated(column)
+    return list(column)
+
+
+def to_columns(
+    config_class: type['RootConfig'], configs: Iterable['RootConfig'],
+) -> dict[str, Any]:
+    """Convert instances to typed columns, keyed by field names."""
+
+    schema = config_class._compiled_schema()
+    rows = list(map(schema.values_of, configs))
+    if not rows:
+        return {
+            field_schema.name: _to_column(field_schema, ())
+            for field_schema in schema.fields
+        }
+    return {
+        field_schema.name: _to_column(field_schema, column)
+        for field_schema, column in zip(schema.fields, zip(*rows))
+    }
+
+
+def _from_column(field_schema: 'FieldSchema', column: Any) -> list[Any]:
+    if type(column) is not list:
+        tolist = getattr(column, 'tolist', None)
+        column = list(column) if tolist is None else tolist()
+    if (
+        field_schema.value_type is bool and field_schema.kind != 'list'
+        and not all(type(value) is bool for value in column)
+        and all(value in (0, 1) for value in column)
+    ):
+        column = list(map(bool, column))
+    return column
+
+
+def from_columns(
+    config_class: type[C], columns: Mapping[str, Any],
+    validate: 'ValidationLevel | None' = None,
+) -> list[C]:
+    """Create instances from columns of field values, keyed by field names.
+
+    Columns may be `list`s, `array.array`s, NumPy arrays, or pandas
+    `Series`, and a pandas `DataFrame` is a mapping of columns too.
+    Columns that are not fields are ignored, and missing columns take
+    the default values. Columns are type-checked as a whole, like
+    `from_records`, and an invalid value is reported with its row.
+    """
+
+    from .rootconfig import _validation_level
+
+    level = config_class._effective_validation(validate)
+    schema = config_class._compiled_schema()
+    field_schemas = [
+        field_schema for field_schema in schema.fields
+        if field_schema.name in columns
+    ]
+    decoded = [
+        _from_column(field_schema, columns[field_schema.name])
+        for field_schema in field_schemas
+    ]
+    lengths = {len(column) for column in decoded}
+    if len(lengths) > 1:
+        raise ValueError(
+            f'Expects columns of the same length, but got lengths '
+            f'{sorted(lengths)}.'
+        )
+
+    if level != 'none':
+        for field_schema, column in zip(field_schemas, decoded):
+            try:
+                field_schema.check_column(column)
+            except TypeError as e:
+                raise TypeError(
+                    f'Row {e.index}: {e}'  # type: ignore
+                ) from e
+
+    names = [field_schema.name for field_schema in field_schemas]
+    num_rows = lengths.pop() if lengths else 0
+    rows = zip(*decoded) if decoded else [()] * num_rows
+    token = _validation_level.set('none')
+    try:
+        instances = []
+        for index, row in enumerate(rows):
+            try:
+                instances.append(config_class(**dict(zip(names, row))))
+            except TypeError as e:
+                raise TypeError(f'Row {index}: {e}') from e
+            except ValueError as e:
+                raise ValueError(f'Row {index}: {e}') from e
+    finally:
+        _validation_level.reset(token)
+    if level == 'none':
+        return instances
+    if instances and level == 'full':
+        instances[0]._validate_instance_is_dataclass()
+    for field_schema in schema.fields:
+        if field_schema.name in columns:
+            continue  # Checked above.
+        # Default values, which the instances were not checked against.
+        column = list(map(attrgetter(field_schema.name), instances))
+        try:
+            field_schema.check_column(column)
+        except TypeError as e:
+            raise TypeError(f'Row {e.index}: {e}') from e  # type: ignore
+    return instances
+
+
+def to_numpy(
+    config_class: type['RootConfig'], configs: Iterable['RootConfig'],
+) -> dict[str, Any]:
+    """Same as `to_columns`, but with NumPy arrays.
+
+    Array columns are viewed without a copy, and the other columns
+    become arrays of `object`s, except `str` columns, which become
+    arrays of unicode strings.
+    """
+
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError('`to_numpy` requires NumPy.') from None
+
+    schema = config_class._compiled_schema()
+    arrays = dict()
+    for field_schema, (name, column) in zip(
+        schema.fields, to_columns(config_class, configs).items()
+    ):
+        typecode = _typecode_of(field_schema)
+        if typecode is not None and type(column) is array:
+            values = np.frombuffer(column, dtype=typecode)
+            arrays[name] = values.astype(bool) if typecode == 'b' else values
+        elif field_schema.value_type is str and field_schema.kind != 'list':
+            arrays[name] = np.array(column, dtype=str)
+        else:
+            values = np.empty(len(column), dtype=object)
+            for index, value in enumerate(column):
+                values[index] = value  # without broadcasting `list`s
+            arrays[name] = values
+    return arrays
+
+
+def to_pandas(
+    config_class: type['RootConfig'], configs: Iterable['RootConfig'],
+) -> Any:
+    """Same as `to_columns`, but as a pandas `DataFrame`.
+
+    `Literal` fields become `Categorical` columns of their choices.
+    """
+
+    try:
+        import pandas as pd
+    except ImportError:
+        raise ImportError('`to_pandas` requires pandas.') from None
+
+    schema = config_class._compiled_schema()
+    data = to_numpy(config_class, configs)
+    for field_schema in schema.fields:
+        if field_schema.kind == 'literal':
+            data[field_schema.name] = pd.Categorical(
+                data[field_schema.name],
+                categories=list(field_schema.choices),  # type: ignore
+            )
+    return pd.DataFrame(data, columns=list(schema.names))
@@ -0,0 +1,123 @@
+"""
+`FastArgumentParser`: a schema-specific command-line parser
+that bypasses `argparse` for well-formed arguments.
+"""
+
+import re
+from argparse import SUPPRESS, ArgumentTypeError
+from typing import Any, Callable, Iterable
+
+_NEGATIVE_NUMBER = re.compile(r'^-\d+$|^-\d*\.\d+$')
+"""The same negative number pattern used by `ArgumentParser`.
+
+Tokens matching the pattern are values, not options.
+"""
+
+
+class _FastOption:
+    __slots__ = ('dest', 'convert', 'many', 'choices')
+
+    def __init__(self, dest: str, options: dict[str, Any]):
+        self.dest = dest
+        self.convert: Callable[[str], Any] = options['type']
+        self.many = options.get('nargs') == '*'
+        self.choices = options.get('choices')
+
+
+class FastArgumentParser:
+    """Parse `--kebab-case` arguments with one `dict` lookup per token.
+
+    The parser is built from the argument names and options yielded by
+    `RootConfig.parser_named_options`, and accepts the same arguments
+    as the `ArgumentParser` forged from them.
+
+    It only handles well-formed arguments. Whenever the arguments need
+    anything beyond that, such as abbreviations, `--name=value`,
+    `--`, `--help`, or reporting an error, `parse` returns `None`
+    and the caller is expected to fall back to `ArgumentParser`,
+    which then produces the exact same result or error.
+    """
+
+    def __init__(self, named_options: Iterable[tuple[str, dict[str, Any]]]):
+        self._options: dict[str, _FastOption] = dict()
+        self._required: list[str] = []
+        self._string_defaults: list[tuple[str, Callable, str]] = []
+
+        for arg_name, arg_options in named_options:
+            dest = arg_name.lstrip('-').replace('-', '_')
+            option = _FastOption(dest, arg_options)
+            self._options[arg_name] = option
+
+            if arg_options.get('required'):
+                self._required.append(dest)
+            default = arg_options.get('default', None)
+            if isinstance(default, str) and default is not SUPPRESS:
+                # `ArgumentParser` converts string defaults with `type`.
+                self._string_defaults.append((dest, option.convert, default))
+
+    def parse(self, arguments: list[str]) -> dict[str, Any] | None:
+        """Parse the arguments into a `dict` keyed by field names.
+
+        Return `None` if the arguments should be handed to
+        `ArgumentParser` instead.
+        """
+
+        options = self._options
+        values: dict[str, Any] = dict()
+        count = len(arguments)
+        index = 0
+
+        while index < count:
+            option = options.get(arguments[index])
+            if option is None:
+                return None
+            index += 1
+
+            if option.many:
+                end = index
+                while end < count and not _is_option(arguments[end]):
+                    end += 1
+                tokens = arguments[index:end]
+                index = end
+            elif index < count and not _is_option(arguments[index]):
+                tokens = arguments[index:index + 1]
+                index += 1
+            else:
+                return None
+
+            try:
+                converted = [option.convert(token) for token in tokens]
+            except (ArgumentTypeError, TypeError, ValueError):
+                return None
+            if option.choices is not None:
+                for value in converted:
+                    if value not in option.choices:
+                        return None
+
+            values[option.dest] = converted if option.many else converted[0]
+
+        for dest in self._required:
+            if dest not in values:
+                return None
+        for dest, convert, default in self._string_defaults:
+            if dest not in values:
+                try:
+                    values[dest] = convert(default)
+                except (ArgumentTypeError, TypeError, ValueError):
+                    return None
+
+        return values
+
+
+def _is_option(token: str) -> bool:
+    """Whether `ArgumentParser` would not take the token as a value.
+
+    Everything starting with `-` counts, except `-` itself and
+    negative numbers. `parse` gives up on such tokens unless they are
+    exactly one of the known argument names.
+    """
+
+    return (
+        token[:1] == '-' and token != '-'
+        and _NEGATIVE_NUMBER.match(token) is None
+    )
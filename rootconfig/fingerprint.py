@@ -0,0 +1,121 @@
+"""
+Canonical encoding and content fingerprints of `RootConfig` instances.
+
+The canonical encoding is a compact JSON text with sorted keys,
+in which every value is written in one canonical, platform-independent
+form, so that equal configs always produce the same bytes:
+
+- `bool`: `true` or `false`.
+- `int`: the decimal integer, also for `bool` values in `int` fields.
+- `float`: `repr`, with `-0.0` as `"0.0"` and all NaNs as `"nan"`.
+- `Fraction`: `"numerator/denominator"` in lowest terms.
+- `Decimal`: `"<sign><digits>e<exponent>"` without trailing zeros,
+  so that `Decimal('1.0')` and `Decimal('1')` are the same.
+- `complex`: the `[real, imag]` pair of canonical `float`s.
+- `Path`: the POSIX form of the path.
+- `str`: the string itself.
+- `list`: the list of canonical elements, also for typed arrays.
+"""
+
+import hashlib
+import json
+import math
+from decimal import Decimal
+from fractions import Fraction
+from pathlib import PurePath
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+if TYPE_CHECKING:
+    from .rootconfig import FieldSchema
+
+
+def _canonical_float(value: float) -> str:
+    if math.isnan(value):
+        return 'nan'
+    if value == 0.:
+        return '0.0'
+    return repr(float(value))
+
+
+def _canonical_decimal(value: Decimal) -> str:
+    if value.is_nan():
+        return 'nan'
+    if value.is_infinite():
+        return '-inf' if value.is_signed() else 'inf'
+    sign, digits, exponent = value.as_tuple()
+    coefficient = int(''.join(map(str, digits)) or '0')
+    if coefficient == 0:
+        return '0'
+    while coefficient % 10 == 0:
+        coefficient //= 10
+        exponent += 1  # type: ignore
+    return f'{"-" if sign else ""}{coefficient}e{exponent}'
+
+
+def _canonical_fraction(value: Fraction) -> str:
+    return f'{value.numerator}/{value.denominator}'
+
+
+def _canonical_complex(value: complex) -> list[str]:
+    return [_canonical_float(value.real), _canonical_float(value.imag)]
+
+
+def _canonical_path(value: PurePath) -> str:
+    return value.as_posix()
+
+
+_canonical_singletons: dict[type, Callable[[Any], Any]] = {
+    bool: bool,
+    int: int,
+    float: _canonical_float,
+    Fraction: _canonical_fraction,
+    Decimal: _canonical_decimal,
+    complex: _canonical_complex,
+    str: str,
+}
+
+
+def canonical_encoder(field_schema: 'FieldSchema') -> Callable[[Any], Any]:
+    """Create the function converting a field value to its canonical form."""
+
+    value_type = field_schema.value_type
+    if issubclass(value_type, PurePath):
+        encode: Callable[[Any], Any] = _canonical_path
+    else:
+        encode = _canonical_singletons[value_type]
+
+    if field_schema.kind == 'list':
+        def encode_list(values: Any) -> list[Any]:
+            if type(values) is not list:
+                values = values.tolist()  # `array.array` or NumPy arrays
+            return [encode(value) for value in values]
+        return encode_list
+    return encode
+
+
+def canonical_bytes(
+    encoders: Iterable[tuple[str, Callable[[Any], Any]]],
+    values: Iterable[Any],
+) -> bytes:
+    """Encode field values into the canonical UTF-8 JSON text.
+
+    `encoders` pairs the field names with their `canonical_encoder`.
+    """
+
+    canonical = {
+        name: encode(value)
+        for (name, encode), value in zip(encoders, values)
+    }
+    return json.dumps(
+        canonical, sort_keys=True, separators=(',', ':'),
+        ensure_ascii=False, allow_nan=False,
+    ).encode()
+
+
+def content_digest(
+    encoders: Iterable[tuple[str, Callable[[Any], Any]]],
+    values: Iterable[Any],
+) -> str:
+    """The hexadecimal SHA-256 digest of the canonical encoding."""
+
+    return hashlib.sha256(canonical_bytes(encoders, values)).hexdigest()
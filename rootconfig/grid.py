@@ -0,0 +1,130 @@
+"""
+`ConfigGrid`: a lazy hyper-parameter grid of `RootConfig` instances.
+"""
+
+from copy import copy
+from itertools import islice, product
+from math import prod
+from typing import (TYPE_CHECKING, Any, Iterator, Mapping, Sequence, TypeVar,
+                    overload)
+
+if TYPE_CHECKING:
+    from .rootconfig import RootConfig
+
+C = TypeVar('C', bound='RootConfig')
+
+
+class ConfigGrid(Sequence[C]):
+    """The Cartesian product of field values, as a sequence of instances.
+
+    Instances are created on demand, in the same order as
+    `itertools.product` over the axes. The grid supports `len()` and
+    random access by index without materializing the product.
+
+    Every axis value is checked against its field once when the grid is
+    created, and so is the first combination as a whole, which covers
+    the fields that are not on any axis. Instances are then created
+    without running `check_sanity` again.
+
+    With `num_shards`, the grid only covers the `shard`-th of
+    `num_shards` contiguous slices of the full product.
+
+    Use `RootConfig.grid` to create a grid.
+    """
+
+    def __init__(
+        self, config_class: type[C], axes: Mapping[str, Sequence[Any]],
+        shard: int = 0, num_shards: int = 1,
+    ):
+        if num_shards < 1:
+            raise ValueError(
+                f'`num_shards` should be positive, but got {num_shards}.'
+            )
+        if not 0 <= shard < num_shards:
+            raise ValueError(
+                f'`shard` should be in [0, {num_shards}), but got {shard}.'
+            )
+
+        schema = config_class._compiled_schema()
+        self.config_class = config_class
+        self.names = tuple(axes)
+        self.values: tuple[tuple[Any, ...], ...] = tuple(
+            tuple(values) for values in axes.values()
+        )
+        for name, values in zip(self.names, self.values):
+            if name not in schema.by_name:
+                raise TypeError(
+                    f'`{name}` is not a field of `{config_class.__name__}`.'
+                )
+            try:
+                schema.by_name[name].check_column(values)
+            except TypeError as e:
+                raise TypeError(
+                    f'Axis `{name}` value {e.index}: {e}'  # type: ignore
+                ) from e
+        self._copied = tuple(
+            schema.by_name[name].kind == 'list' for name in self.names
+        )
+
+        total = prod(map(len, self.values))
+        self.start = total * shard // num_shards
+        self.stop = total * (shard + 1) // num_shards
+
+        if total:
+            self._create(self._combination(0), validate=True)
+
+    def __len__(self):
+        return self.stop - self.start
+
+    @overload
+    def __getitem__(self, index: int) -> C: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[C]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError('`ConfigGrid` index out of range.')
+        return self._create(self._combination(self.start + index))
+
+    def __iter__(self) -> Iterator[C]:
+        combinations = islice(product(*self.values), self.start, self.stop)
+        for combination in combinations:
+            yield self._create(combination)
+
+    def __repr__(self):
+        axes = ', '.join(
+            f'{name}=<{len(values)} values>'
+            for name, values in zip(self.names, self.values)
+        )
+        return (
+            f'{type(self).__name__}({self.config_class.__name__}, {axes}, '
+            f'range({self.start}, {self.stop}))'
+        )
+
+    def _combination(self, index: int) -> tuple[Any, ...]:
+        """Decode a flat index of the full product, last axis fastest."""
+
+        combination = []
+        for values in reversed(self.values):
+            index, position = divmod(index, len(values))
+            combination.append(values[position])
+        combination.reverse()
+        return tuple(combination)
+
+    def _create(self, combination: tuple[Any, ...], validate: bool = False):
+        kwargs = {
+            name: (list(value) if type(value) is list else copy(value))
+            if copied else value
+            for name, value, copied in zip(
+                self.names, combination, self._copied
+            )
+        }
+        if validate:
+            return self.config_class(**kwargs)
+        return self.config_class._create_unchecked(kwargs)
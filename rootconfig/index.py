@@ -0,0 +1,313 @@
+"""
+`ConfigIndex`: a persistent SQLite index over `RootConfig` JSON files.
+
+Each indexed file is one row of a table with one typed column per field,
+so that queries never open the JSON files:
+
+- `int`, `bool`, and `int` or `bool` `Literal` fields are `INTEGER`s.
+- `float`, `Fraction`, and `Decimal` fields are `REAL`s, so that ranges
+  work across them. `nan` is stored as `NULL`, which matches nothing.
+- `str`, `Path`, and `str` `Literal` fields are `TEXT`s, with paths in
+  their POSIX form.
+- `complex` and `list` fields are `TEXT`s of their canonical encoding
+  (see `rootconfig.fingerprint`), so they only support equality.
+
+Rows remember the `(st_mtime_ns, st_size)` of their file, so that a scan
+only loads new and changed files, and removes the rows of deleted ones.
+Files that fail to load are kept with their error, and never match.
+"""
+
+import json
+import os
+import sqlite3
+from decimal import Decimal
+from fractions import Fraction
+from glob import escape, glob
+from pathlib import PurePath
+from typing import TYPE_CHECKING, Any, Callable, Generic, NamedTuple, TypeVar
+
+from .bulk import ExecutorKind, iter_load_many
+from .fingerprint import canonical_encoder
+
+if TYPE_CHECKING:
+    from .rootconfig import FieldSchema, RootConfig, ValidationLevel
+
+C = TypeVar('C', bound='RootConfig')
+
+_OPERATORS = {
+    'eq': '=', 'ne': '!=', 'lt': '<', 'le': '<=', 'gt': '>', 'ge': '>=',
+    'in': 'IN',
+}
+
+_BATCH_SIZE = 1024
+
+
+def _path_text(value: Any) -> str:
+    return PurePath(value).as_posix()
+
+
+def _column_of(field_schema: 'FieldSchema') -> tuple[str, Callable]:
+    """Return the SQLite type of a field and the converter of its values."""
+
+    value_type = field_schema.value_type
+    if field_schema.kind == 'list' or value_type is complex:
+        encode = canonical_encoder(field_schema)
+        return 'TEXT', lambda value: json.dumps(
+            encode(value), ensure_ascii=False, separators=(',', ':')
+        )
+    if value_type in (bool, int):
+        return 'INTEGER', int
+    if value_type in (float, Fraction, Decimal):
+        return 'REAL', float
+    if issubclass(value_type, PurePath):
+        return 'TEXT', _path_text
+    return 'TEXT', str
+
+
+def _numeric_bound(value: Any) -> int | float:
+    """Convert a query bound on a numeric column, without truncating it."""
+
+    if type(value) in (bool, int, float):
+        return value
+    return float(value)  # `Fraction`s, `Decimal`s, and NumPy scalars
+
+
+class ScanResult(NamedTuple):
+    """The number of files of each outcome of `ConfigIndex.scan`."""
+
+    added: int
+    updated: int
+    removed: int
+    unchanged: int
+    failed: int
+
+
+class ConfigIndex(Generic[C]):
+    """A persistent index of the JSON files of one `RootConfig` class.
+
+    The index lives in an SQLite `database` file, or in memory by default.
+    If the fields of the class changed since the database was written,
+    its rows are dropped and rebuilt by the next scan.
+
+    Queries are keyword arguments, named after a field and optionally
+    suffixed with an operator, all of which must hold:
+
+    - `field=value` or `field__ne=value`: equality or inequality;
+    - `field__lt`, `field__le`, `field__gt`, or `field__ge`: ranges;
+    - `field__in=values`: membership, such as of some `Literal` values.
+
+    ```python
+    with ConfigIndex(Config, 'runs.sqlite') as index:
+        index.scan('runs')
+        paths = index.query(optimizer='AdamW', learning_rate__lt=1e-3)
+    ```
+    """
+
+    def __init__(
+        self, config_class: type[C],
+        database: os.PathLike | str = ':memory:',
+    ):
+        self.config_class = config_class
+        fields = config_class._compiled_schema().fields
+        columns = [(schema.name, *_column_of(schema)) for schema in fields]
+        self._names = [name for name, _, _ in columns]
+        self._converters: dict[str, Callable] = {
+            name: convert for name, _, convert in columns
+        }
+        self._numeric = {
+            name for name, sql_type, _ in columns
+            if sql_type in ('INTEGER', 'REAL')
+        }
+        self._connection = sqlite3.connect(database)
+        self._create_tables([
+            (name, sql_type) for name, sql_type, _ in columns
+        ])
+
+    def _create_tables(self, columns: list[tuple[str, str]]):
+        signature = json.dumps([
+            self.config_class.__qualname__, columns,
+        ])
+        with self._connection as connection:
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS meta '
+                '(key TEXT PRIMARY KEY, value TEXT)'
+            )
+            row = connection.execute(
+                "SELECT value FROM meta WHERE key = 'signature'"
+            ).fetchone()
+            if row is not None and row[0] == signature:
+                return
+            connection.execute('DROP TABLE IF EXISTS configs')
+            connection.execute(
+                'CREATE TABLE configs (path TEXT PRIMARY KEY, '
+                'mtime_ns INTEGER, size INTEGER, error TEXT'
+                + ''.join(f', "{name}" {sql_type}'
+                          for name, sql_type in columns)
+                + ')'
+            )
+            for name, _ in columns:
+                connection.execute(
+                    f'CREATE INDEX "configs_{name}" ON configs ("{name}")'
+                )
+            connection.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('signature', ?)",
+                (signature,)
+            )
+
+    def scan(
+        self, root: os.PathLike | str, pattern: str = '**/config.json',
+        workers: int | None = None, executor: ExecutorKind = 'thread',
+        validate: 'ValidationLevel | None' = None,
+    ) -> ScanResult:
+        """Bring the index of the files under `root` up to date.
+
+        Files matching the glob `pattern` under `root` are loaded with
+        `load_many` if they are new or their modification time or size
+        changed. Rows of files under `root` that no longer exist are
+        removed.
+        """
+
+        root = os.path.abspath(root)
+        prefix = os.path.join(root, '')
+        known = {
+            path: (mtime_ns, size)
+            for path, mtime_ns, size in self._connection.execute(
+                'SELECT path, mtime_ns, size FROM configs'
+            )
+            if path.startswith(prefix)
+        }
+        versions: dict[str, tuple[int, int]] = dict()
+        added = updated = unchanged = failed = 0
+        for path in glob(os.path.join(escape(root), pattern), recursive=True):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            version = (stat.st_mtime_ns, stat.st_size)
+            known_version = known.pop(path, None)
+            if known_version == version:
+                unchanged += 1
+                continue
+            if known_version is None:
+                added += 1
+            else:
+                updated += 1
+            versions[path] = version
+
+        placeholders = ', '.join('?' * (len(self._names) + 4))
+        insert = f'INSERT OR REPLACE INTO configs VALUES ({placeholders})'
+        converters = [self._converters[name] for name in self._names]
+        empty_values = (None,) * len(self._names)
+        with self._connection as connection:
+            rows = []
+            results = iter_load_many(
+                self.config_class, versions, workers, executor,
+                ordered=False, validate=validate,
+            ) if versions else ()
+            for path, config, error in results:
+                if error is None:
+                    values = tuple(
+                        None if value is None else convert(value)
+                        for convert, value in zip(
+                            converters,
+                            (getattr(config, name) for name in self._names),
+                        )
+                    )
+                else:
+                    failed += 1
+                    values = empty_values
+                rows.append((
+                    path, *versions[path],
+                    None if error is None
+                    else f'{type(error).__name__}: {error}',
+                    *values,
+                ))
+                if len(rows) >= _BATCH_SIZE:
+                    connection.executemany(insert, rows)
+                    rows.clear()
+            connection.executemany(insert, rows)
+            connection.executemany(
+                'DELETE FROM configs WHERE path = ?',
+                ((path,) for path in known)
+            )
+        return ScanResult(added, updated, len(known), unchanged, failed)
+
+    def _where(self, conditions: dict[str, Any]) -> tuple[str, list[Any]]:
+        clauses = ['error IS NULL']
+        parameters: list[Any] = []
+        for key, value in conditions.items():
+            name, separator, operator = key.rpartition('__')
+            if not separator or operator not in _OPERATORS:
+                name, operator = key, 'eq'
+            convert = self._converters.get(name)
+            if convert is None:
+                raise TypeError(
+                    f'`{name}` is not a field of '
+                    f'`{self.config_class.__name__}`.'
+                )
+            if name in self._numeric:
+                # Bounds are compared as they are, so that `epoch__lt=2.5`
+                # is not truncated to `epoch__lt=2` by the `int` converter.
+                convert = _numeric_bound
+            if operator == 'in':
+                values = [convert(member) for member in value]
+                clauses.append(
+                    f'"{name}" IN ({", ".join("?" * len(values))})'
+                )
+                parameters.extend(values)
+            else:
+                clauses.append(f'"{name}" {_OPERATORS[operator]} ?')
+                parameters.append(convert(value))
+        return ' AND '.join(clauses), parameters
+
+    def query(self, **conditions: Any) -> list[str]:
+        """Return the sorted paths of the files matching all conditions."""
+
+        where, parameters = self._where(conditions)
+        return [path for path, in self._connection.execute(
+            f'SELECT path FROM configs WHERE {where} ORDER BY path',
+            parameters
+        )]
+
+    def count(self, **conditions: Any) -> int:
+        """Return the number of files matching all conditions."""
+
+        where, parameters = self._where(conditions)
+        return self._connection.execute(
+            f'SELECT COUNT(*) FROM configs WHERE {where}', parameters
+        ).fetchone()[0]
+
+    def configs(
+        self, validate: 'ValidationLevel | None' = None, **conditions: Any,
+    ) -> list[C]:
+        """Load the files matching all conditions, see `query`."""
+
+        return [
+            self.config_class.from_json(path, validate)  # type: ignore
+            for path in self.query(**conditions)
+        ]
+
+    def errors(self) -> dict[str, str]:
+        """Return the errors of the files that failed to load, by path."""
+
+        return dict(self._connection.execute(
+            'SELECT path, error FROM configs WHERE error IS NOT NULL '
+            'ORDER BY path'
+        ))
+
+    def __len__(self) -> int:
+        return self._connection.execute(
+            'SELECT COUNT(*) FROM configs'
+        ).fetchone()[0]
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.config_class.__name__})'
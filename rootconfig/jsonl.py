@@ -0,0 +1,86 @@
+"""
+JSON Lines import/export of `RootConfig` collections.
+
+One config per line, encoded the same way as `RootConfig.to_json`.
+Files ending with `.gz`, `.bz2`, `.xz`, or `.lzma` are transparently
+(de)compressed with the standard library.
+"""
+
+import bz2
+import gzip
+import json
+import lzma
+import os
+from typing import IO, TYPE_CHECKING, Iterable, Iterator, TypeVar
+
+from .rootconfig import (RootConfigJSONEncoder,
+                         root_config_json_decode_object_hook)
+
+if TYPE_CHECKING:
+    from .rootconfig import RootConfig, ValidationLevel
+
+C = TypeVar('C', bound='RootConfig')
+
+_COMPRESSED_OPENERS = {
+    '.gz': gzip.open,
+    '.bz2': bz2.open,
+    '.xz': lzma.open,
+    '.lzma': lzma.open,
+}
+
+
+def open_text(file: os.PathLike | str, mode: str = 'r') -> IO[str]:
+    """Open a UTF-8 text file, decompressing it based on its suffix."""
+
+    opener = _COMPRESSED_OPENERS.get(os.path.splitext(file)[1].lower())
+    if opener is None:
+        return open(file, mode, encoding='utf-8')
+    return opener(file, mode + 't', encoding='utf-8')  # type: ignore
+
+
+def iter_jsonl(
+    config_class: type[C], jsonl_file: os.PathLike | str,
+    validate: 'ValidationLevel | None' = None,
+) -> Iterator[C]:
+    """Lazily create instances from a JSON Lines file, one per line.
+
+    Only one line is held in memory at a time. Blank lines are skipped.
+    An invalid line raises `ValueError` or `TypeError`, prefixed with
+    the file name and the line number.
+    """
+
+    with open_text(jsonl_file) as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                config = config_class._from_json_object(
+                    json.loads(
+                        line, object_hook=root_config_json_decode_object_hook
+                    ),
+                    validate, hooked=True,
+                )
+            except TypeError as e:
+                raise TypeError(f'{jsonl_file}:{line_number}: {e}') from e
+            except ValueError as e:
+                raise ValueError(f'{jsonl_file}:{line_number}: {e}') from e
+            yield config
+
+
+def write_jsonl(
+    jsonl_file: os.PathLike | str, configs: Iterable['RootConfig'],
+    append: bool = False,
+) -> int:
+    """Write instances to a JSON Lines file, one per line.
+
+    Return the number of written instances.
+    """
+
+    encoder = RootConfigJSONEncoder()
+    count = 0
+    with open_text(jsonl_file, 'a' if append else 'w') as f:
+        for config in configs:
+            f.write(encoder.encode(config.to_dict(copy='none')))
+            f.write('\n')
+            count += 1
+    return count
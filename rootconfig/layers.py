@@ -0,0 +1,231 @@
+"""
+Layered `RootConfig` sources, merged into one instance.
+
+Each source supplies the raw values of some fields, already converted
+to the field types, and later sources override earlier ones. The merged
+values are validated once, by creating the instance at the end, and the
+name of the source of each value is recorded. Values are passed along
+by reference, so large values are never copied by the merge.
+
+- `Values(mapping)`: values as they are, such as defaults of a project.
+- `JSONFile(path)`: the fields present in a JSON file, as `from_json`.
+- `Environment(prefix)`: `<prefix><FIELD_NAME>` environment variables,
+  converted like command-line arguments. `list` values are split on
+  whitespace.
+- `Arguments(arguments)`: the command-line arguments present, parsed
+  like `parse_args`, with `sys.argv[1:]` by default.
+"""
+
+import json
+import os
+import sys
+from argparse import SUPPRESS, ArgumentParser, ArgumentTypeError
+from dataclasses import MISSING
+from typing import (TYPE_CHECKING, Any, Iterable, Mapping, Protocol,
+                    Sequence, TypeVar)
+
+from .fastargs import FastArgumentParser
+
+if TYPE_CHECKING:
+    from .rootconfig import RootConfig, ValidationLevel
+
+C = TypeVar('C', bound='RootConfig')
+
+DEFAULT_SOURCE = 'default'
+"""The source name of fields that no source supplied."""
+
+
+class Source(Protocol):
+    """A layer of values. `read` returns values keyed by field names."""
+
+    name: str
+
+    def read(self, config_class: type['RootConfig']) -> dict[str, Any]:
+        ...
+
+
+class Values:
+    """Values from a mapping, taken as they are."""
+
+    def __init__(self, values: Mapping[str, Any], name: str = 'values'):
+        self.values = values
+        self.name = name
+
+    def read(self, config_class: type['RootConfig']) -> dict[str, Any]:
+        names = config_class._compiled_schema().by_name
+        return {k: v for k, v in self.values.items() if k in names}
+
+
+class JSONFile:
+    """Values of the fields present in a JSON file."""
+
+    def __init__(self, json_file: os.PathLike | str):
+        self.json_file = json_file
+        self.name = f'json:{os.fspath(json_file)}'
+
+    def read(self, config_class: type['RootConfig']) -> dict[str, Any]:
+        with open(self.json_file, 'r') as f:
+            data = json.load(f)
+        names = config_class._compiled_schema().by_name
+        return {
+            k: v for k, v in config_class._decode_json_object(data).items()
+            if k in names
+        }
+
+
+class Environment:
+    """Values of `<prefix><FIELD_NAME>` environment variables."""
+
+    def __init__(
+        self, prefix: str, environ: Mapping[str, str] | None = None,
+    ):
+        self.prefix = prefix
+        self.environ = os.environ if environ is None else environ
+        self.name = f'env:{prefix}'
+
+    def read(self, config_class: type['RootConfig']) -> dict[str, Any]:
+        values: dict[str, Any] = dict()
+        for (_, options), field_schema in zip(
+            config_class._option_spec(),
+            config_class._compiled_schema().fields,
+        ):
+            variable = self.prefix + field_schema.name.upper()
+            text = self.environ.get(variable)
+            if text is None:
+                continue
+            convert = options['type']
+            try:
+                if field_schema.kind == 'list':
+                    values[field_schema.name] = [
+                        convert(token) for token in text.split()
+                    ]
+                else:
+                    values[field_schema.name] = convert(text)
+            except (ArgumentTypeError, TypeError, ValueError) as e:
+                raise ValueError(
+                    f'`{variable}` cannot be converted to '
+                    f'`{field_schema.name}`: {e}'
+                ) from e
+        return values
+
+
+class Arguments:
+    """Values of the command-line arguments present."""
+
+    def __init__(self, arguments: Sequence[str] | None = None):
+        self.arguments = arguments
+        self.name = 'argv'
+
+    def read(self, config_class: type['RootConfig']) -> dict[str, Any]:
+        arguments = list(
+            sys.argv[1:] if self.arguments is None else self.arguments
+        )
+        fast_parser, parser = _layer_parsers(config_class)
+        values = fast_parser.parse(arguments)
+        if values is None:
+            values = vars(parser.parse_args(arguments))
+        return values
+
+
+def _layer_parsers(
+    config_class: type['RootConfig'],
+) -> tuple[FastArgumentParser, ArgumentParser]:
+    """Return parsers that only yield the arguments present.
+
+    They share the argument types of `parse_args`, but no argument is
+    required, and absent ones have no default.
+    """
+
+    from .rootconfig import _class_cache
+    cache = _class_cache(config_class)
+    try:
+        return cache['layer_parsers']
+    except KeyError:
+        named_options = tuple(
+            (arg_name, dict(arg_options, required=False, default=SUPPRESS))
+            for arg_name, arg_options in config_class._option_spec()
+        )
+        parser = ArgumentParser()
+        for arg_name, arg_options in named_options:
+            parser.add_argument(arg_name, **arg_options)
+        parsers = cache['layer_parsers'] = (
+            FastArgumentParser(named_options), parser,
+        )
+        return parsers
+
+
+def as_source(source: Any) -> Source:
+    """Interpret a shorthand source.
+
+    - A mapping is `Values`.
+    - A path is a `JSONFile`, and so is a string that ends with `.json`,
+      contains a path separator, or names an existing file.
+    - Another string is an `Environment` prefix, if it is an identifier
+      such as `APP_`. Otherwise, `ValueError` is raised, and the source
+      must be given explicitly as a `JSONFile` or an `Environment`.
+    - A `list` or a `tuple` of strings is `Arguments`.
+    - Objects with `name` and `read` are sources already.
+    """
+
+    if isinstance(source, Mapping):
+        return Values(source)
+    if isinstance(source, os.PathLike):
+        return JSONFile(source)
+    if isinstance(source, str):
+        separators = {os.sep, os.altsep, '/'} - {None}
+        if (
+            source.lower().endswith('.json')
+            or any(separator in source for separator in separators)
+            or os.path.exists(source)
+        ):
+            return JSONFile(source)
+        if source.isidentifier():
+            return Environment(source)
+        raise ValueError(
+            f'`{source}` is neither a JSON file nor an environment '
+            f'variable prefix. Use `JSONFile` or `Environment` instead.'
+        )
+    if isinstance(source, (list, tuple)):
+        return Arguments(source)
+    if hasattr(source, 'read') and hasattr(source, 'name'):
+        return source
+    raise TypeError(f'`{source!r}` is not a supported config source.')
+
+
+def load_with_sources(
+    config_class: type[C], sources: Iterable[Any],
+    validate: 'ValidationLevel | None' = None,
+) -> tuple[C, dict[str, str]]:
+    """Merge the sources, then create and validate one instance.
+
+    Return the instance, and the name of the source of each field.
+    Errors of a source are prefixed with its name.
+    """
+
+    merged: dict[str, Any] = dict()
+    provenance: dict[str, str] = dict()
+    for source in map(as_source, sources):
+        try:
+            values = source.read(config_class)
+        except TypeError as e:
+            raise TypeError(f'{source.name}: {e}') from e
+        except ValueError as e:
+            raise ValueError(f'{source.name}: {e}') from e
+        merged.update(values)
+        provenance.update(dict.fromkeys(values, source.name))
+
+    for field_schema in config_class._compiled_schema().fields:
+        field = field_schema.field
+        if (
+            field.init and field.default is MISSING
+            and field.default_factory is MISSING
+            and field.name not in merged
+        ):
+            raise TypeError(
+                f'`{field.name}` is not supplied by any source.'
+            )
+    config = config_class._create(merged, validate)
+    return config, {
+        name: provenance.get(name, DEFAULT_SOURCE)
+        for name in config_class._compiled_schema().names
+    }
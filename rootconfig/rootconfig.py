@@ -5,14 +5,28 @@ with command-line argument parsing and JSON import/export.
 
 import json
 import os
+import sys
 from abc import ABC
-from argparse import ArgumentParser
-from dataclasses import MISSING, asdict, dataclass, fields, is_dataclass
+from array import array
+from argparse import SUPPRESS, ArgumentParser
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from copy import copy as shallow_copy
+from dataclasses import (MISSING, Field, FrozenInstanceError, asdict,
+                         dataclass, fields, is_dataclass, replace)
 from decimal import Decimal
 from fractions import Fraction
-from itertools import pairwise
+from itertools import chain, islice, pairwise
+from operator import attrgetter, is_
 from pathlib import Path
-from typing import Any, Literal, get_args, get_origin
+from types import MemberDescriptorType
+from typing import (Any, Callable, ClassVar, Iterable, Literal, Mapping,
+                    Sequence, get_args, get_origin)
+
+from .fastargs import FastArgumentParser
+from .fingerprint import canonical_encoder, content_digest
+from .grid import ConfigGrid
 
 supported_string_covertable_types: set[type] = {
     int, Fraction, Decimal, float, complex,
@@ -44,6 +58,85 @@ supported_types: set[type] = {
 } | supported_singleton_types
 """All supported types in `RootConfig` class"""
 
+array_typecodes: dict[type, frozenset[str]] = {
+    int: frozenset('bBhHiIlLqQ'),
+    float: frozenset('fd'),
+}
+"""`array.array` typecodes accepted by `list` fields, by element type."""
+
+array_dtype_kinds: dict[type, frozenset[str]] = {
+    int: frozenset('iu'),
+    float: frozenset('f'),
+    bool: frozenset('b'),
+}
+"""NumPy `dtype.kind`s accepted by `list` fields, by element type."""
+
+array_storage_typecodes: dict[type, str] = {
+    int: 'q',
+    float: 'd',
+}
+"""`array.array` typecodes of fields with `'array'` storage."""
+
+_array_typecode_chars = frozenset('bBhHiIlLqQfd')
+
+
+def _array_fits(value: Any, value_type: type) -> bool | None:
+    """Whether a typed array holds elements of `value_type`.
+
+    Typed arrays are `array.array`s and one-dimensional NumPy arrays,
+    which are duck-typed, so that NumPy is not required.
+    Their element type is checked once, from the typecode or `dtype`.
+    Return `None` if `value` is not a typed array.
+    """
+
+    if isinstance(value, array):
+        return value.typecode in array_typecodes.get(value_type, ())
+    dtype = getattr(value, 'dtype', None)
+    if dtype is None or getattr(value, 'ndim', None) != 1:
+        return None
+    return getattr(dtype, 'kind', None) in array_dtype_kinds.get(
+        value_type, ()
+    )
+
+
+def _to_storage_array(value: Any, typecode: str, name: str) -> array:
+    """Convert a `list` or a typed array to an `array.array`.
+
+    Arrays of the given typecode are returned as they are.
+    Raise `ValueError` if an element does not fit the typecode.
+    """
+
+    if type(value) is array and value.typecode == typecode:
+        return value
+    try:
+        if isinstance(value, (list, array)):
+            return array(typecode, value)
+    except OverflowError as e:
+        raise ValueError(
+            f'`{name}` is stored as an array of typecode `{typecode}`, '
+            f'which cannot hold all its elements: {e}.'
+        ) from e
+    return array(typecode, value.astype(typecode).tobytes())
+
+
+def _from_numpy(value: Any) -> array | list:
+    """Copy a one-dimensional NumPy array out of NumPy.
+
+    The copy is an `array.array` of the same element type, or a `list`
+    if `array.array` has no typecode for it, such as for `bool`.
+    """
+
+    dtype = value.dtype
+    if dtype.char in _array_typecode_chars and dtype.isnative:
+        return array(dtype.char, value.tobytes())
+    return value.tolist()
+
+
+def _copy_list(value: Any) -> Any:
+    """Copy a `list` or a typed array, but not its elements."""
+
+    return list(value) if type(value) is list else shallow_copy(value)
+
 
 def parse_bool(literal: str):
     """Parse boolean literals.
@@ -67,57 +160,505 @@ _JSON_CUSTOM_TYPE_KEY = '__custom_type__'
 _JSON_CUSTOM_TYPE_VALUE = '__value__'
 
 
+_json_encoders: dict[type, tuple[str, Callable[[Any], Any]]] = dict()
+"""Registered JSON types, mapped to their names and encoding functions."""
+
+_json_decoders: dict[str, Callable[[Any], Any]] = dict()
+"""Registered JSON type names, mapped to their decoding functions."""
+
+_json_encoder_lookup: dict[type, tuple[str, Callable[[Any], Any]] | None] = (
+    dict()
+)
+"""Resolved encoders for concrete types, including subclasses of
+registered types such as `PosixPath`."""
+
+
+def register_json_type(
+    cls: type, name: str | None = None,
+    encode: Callable[[Any], Any] = str,
+    decode: Callable[[Any], Any] | None = None,
+):
+    """Register a non-standard type for JSON import/export.
+
+    Instances of the type and its subclasses are encoded by
+    `RootConfigJSONEncoder` as a special JSON `Object`,
+    `{"__custom_type__": name, "__value__": encode(o)}`,
+    which `root_config_json_decode_object_hook` decodes with
+    `decode(value)`. By default, the name is the class name,
+    the value is `str(o)`, and the class is called to decode it.
+
+    ```python
+    register_json_type(UUID)
+    ```
+    """
+
+    if name is None:
+        name = cls.__name__
+    _json_encoders[cls] = (name, encode)
+    _json_decoders[name] = cls if decode is None else decode
+    _json_encoder_lookup.clear()
+
+
+for _cls in (complex, Decimal, Fraction, Path):
+    register_json_type(_cls)
+del _cls
+
+
+def _lookup_json_encoder(cls: type):
+    try:
+        return _json_encoder_lookup[cls]
+    except KeyError:
+        handler = next(
+            (_json_encoders[base] for base in cls.__mro__
+             if base in _json_encoders),
+            None
+        )
+        _json_encoder_lookup[cls] = handler
+        return handler
+
+
 class RootConfigJSONEncoder(json.JSONEncoder):
     """Custom Python `json.JSONEncoder` to encode non-standard type
     such as `complex`, `Decimal`, `Fraction`, and `Path`.
+
+    Types are dispatched with one `dict` lookup.
+    Also see `register_json_type`.
     """
 
     def default(self, o: Any) -> Any:
-        if isinstance(o, complex):
-            return {
-                _JSON_CUSTOM_TYPE_KEY: 'complex',
-                _JSON_CUSTOM_TYPE_VALUE: str(o)
-            }
-        elif isinstance(o, Decimal):
-            return {
-                _JSON_CUSTOM_TYPE_KEY: 'Decimal',
-                _JSON_CUSTOM_TYPE_VALUE: str(o)
-            }
-        elif isinstance(o, Fraction):
-            return {
-                _JSON_CUSTOM_TYPE_KEY: 'Fraction',
-                _JSON_CUSTOM_TYPE_VALUE: str(o)
-            }
-        elif isinstance(o, Path):
-            return {
-                _JSON_CUSTOM_TYPE_KEY: 'Path',
-                _JSON_CUSTOM_TYPE_VALUE: str(o)
-            }
-        return super().default(o)
+        handler = _lookup_json_encoder(type(o))
+        if handler is None:
+            if isinstance(o, array) or _is_numpy_like(o):
+                return o.tolist()
+            return super().default(o)
+        name, encode = handler
+        return {
+            _JSON_CUSTOM_TYPE_KEY: name,
+            _JSON_CUSTOM_TYPE_VALUE: encode(o)
+        }
+
+
+def _is_numpy_like(value: Any) -> bool:
+    return hasattr(value, 'dtype') and hasattr(value, 'tolist')
 
 
 def root_config_json_decode_object_hook(dct: dict[str, Any]):
     """Custom Python object hook for JSON decoder to decode non-standard types
     such as `complex`, `Decimal`, `Fraction`, and `Path`.
+
+    Also see `register_json_type`.
     """
-    if (
-        _JSON_CUSTOM_TYPE_KEY in dct and
-        _JSON_CUSTOM_TYPE_VALUE in dct and
-        len(dct) == 2
-    ):
-        key = dct[_JSON_CUSTOM_TYPE_KEY]
-        value = dct[_JSON_CUSTOM_TYPE_VALUE]
-        if key == 'complex':
-            return complex(value)
-        elif key == 'Decimal':
-            return Decimal(value)
-        elif key == 'Fraction':
-            return Fraction(value)
-        elif key == 'Path':
-            return Path(value)
+    if len(dct) == 2 and _JSON_CUSTOM_TYPE_VALUE in dct:
+        name = dct.get(_JSON_CUSTOM_TYPE_KEY)
+        if type(name) is str and name in _json_decoders:
+            return _json_decoders[name](dct[_JSON_CUSTOM_TYPE_VALUE])
     return dct
 
 
+def _iterencode_json_object(
+    encoder: json.JSONEncoder, dct: dict[str, Any], chunk_size: int = 4096,
+):
+    """Encode a `dict` into chunks of the same string as `encoder.encode`.
+
+    Each value is encoded in one go by the C encoder, except long lists,
+    which are encoded `chunk_size` elements at a time to bound the size
+    of the chunks. The C encoder keeps one string per element until the
+    chunk is joined, so the peak memory grows with `chunk_size`.
+    """
+
+    encode = encoder.encode
+    yield '{'
+    for i, (key, value) in enumerate(dct.items()):
+        if i:
+            yield ', '
+        yield encode(key)
+        yield ': '
+        if (
+            type(value) is list or isinstance(value, array)
+            or getattr(value, 'ndim', None) == 1
+        ) and len(value) > chunk_size:
+            yield '['
+            for start in range(0, len(value), chunk_size):
+                if start:
+                    yield ', '
+                yield encode(value[start:start + chunk_size])[1:-1]
+            yield ']'
+        else:
+            yield encode(value)
+    yield '}'
+
+
+def _check_json_object(data: Any):
+    if type(data) is not dict:
+        raise TypeError(f'Expect a JSON `Object`, but got {type(data)}.')
+
+
+def _json_field_decoder(
+    schema: 'FieldSchema',
+) -> Callable[[Any], Any] | None:
+    """Create the function decoding the raw JSON value of a field.
+
+    Return `None` if the values of the field can never be
+    special JSON `Object`s, so that they are left untouched.
+    """
+
+    if _lookup_json_encoder(schema.value_type) is None:
+        return None
+
+    hook = root_config_json_decode_object_hook
+
+    def decode(value: Any):
+        return hook(value) if type(value) is dict else value
+
+    if schema.kind != 'list':
+        return decode
+
+    def decode_list(value: Any):
+        if type(value) is not list:
+            return decode(value)
+        return [hook(v) if type(v) is dict else v for v in value]
+    return decode_list
+
+
+def _named_options_of(schema: 'FieldSchema') -> tuple[str, dict[str, Any]]:
+    """Create the `ArgumentParser` argument name and options of a field."""
+
+    prefix_char = '-'
+    field = schema.field
+    arg_name = prefix_char * 2 + field.name.replace('_', prefix_char)
+
+    arg_options: dict[str, Any] = dict()
+    arg_options['required'] = (
+        field.default is MISSING and field.default_factory is MISSING
+    )
+    if field.default_factory is not MISSING:
+        arg_options['default'] = SUPPRESS
+    elif field.default is not MISSING:
+        arg_options['default'] = field.default
+
+    value_type = schema.value_type
+    if schema.kind == 'list':
+        arg_options['type'] = parse_bool if value_type is bool else value_type
+        arg_options['nargs'] = '*'
+    elif schema.kind == 'literal':
+        arg_options['type'] = parse_bool if value_type is bool else value_type
+        arg_options['choices'] = schema.choices
+    elif value_type is bool:
+        arg_options['type'] = parse_bool
+        arg_options['choices'] = [True, False]
+    else:
+        arg_options['type'] = value_type
+
+    return arg_name, arg_options
+
+
+ValidationLevel = Literal['full', 'values-only', 'none']
+"""How much `__post_init__` checks a new instance.
+
+- `'full'`: run `check_sanity`.
+- `'values-only'`: only check the field values against their types.
+- `'none'`: check nothing, for values that are already trusted.
+"""
+
+
+def _checked_validation_level(level: Any) -> ValidationLevel:
+    if level not in ('full', 'values-only', 'none'):
+        raise ValueError(
+            f'`{level}` is not one of `full`, `values-only`, or `none`.'
+        )
+    return level
+
+
+default_validation_level: ValidationLevel = _checked_validation_level(
+    os.environ.get('ROOTCONFIG_VALIDATION', 'full')
+)
+"""The validation level of classes which do not set one.
+
+Read from the `ROOTCONFIG_VALIDATION` environment variable at import,
+and `'full'` by default.
+"""
+
+_validation_level: ContextVar[ValidationLevel | None] = ContextVar(
+    'rootconfig_validation_level', default=None
+)
+"""The validation level overriding the class level, if any.
+
+Set by `validation_level`, by the `validate` argument of constructors,
+and by batch constructors which check the instances column by column
+once they are all built.
+"""
+
+
+@contextmanager
+def validation_level(level: ValidationLevel):
+    """Set the validation level of instances created within the block.
+
+    The level overrides the one of the classes, but not the `validate`
+    argument of constructors.
+
+    ```python
+    with validation_level('none'):
+        configs = [Config.from_json(path) for path in trusted_paths]
+    ```
+    """
+
+    token = _validation_level.set(_checked_validation_level(level))
+    try:
+        yield
+    finally:
+        _validation_level.reset(token)
+
+
+_CLASS_CACHE_ATTR = '__rootconfig_cache__'
+
+
+def _class_cache(cls: type) -> dict[str, Any]:
+    """Return the per-class cache `dict` of a `RootConfig` subclass.
+
+    The cache lives in the class's own `__dict__`, so that a subclass
+    never picks up what has been compiled for its parent.
+    """
+
+    try:
+        return cls.__dict__[_CLASS_CACHE_ATTR]
+    except KeyError:
+        cache: dict[str, Any] = dict()
+        setattr(cls, _CLASS_CACHE_ATTR, cache)
+        return cache
+
+
+class FieldSchema:
+    """The compiled form of a single `RootConfig` field.
+
+    `kind` is one of `'singleton'`, `'literal'`, or `'list'`.
+    `value_type` is the field type itself for singletons,
+    the type of the members for `Literal`,
+    and the element type for `list`.
+    `storage` is `'array'` for `list[int]` and `list[float]` fields
+    declared with `metadata={'storage': 'array'}`, which are stored as
+    `array.array`s, or `'list'` otherwise.
+    `check` raises a `TypeError` if a value does not fit the field.
+    """
+
+    __slots__ = ('field', 'name', 'type', 'kind', 'value_type', 'choices',
+                 'storage', 'check')
+
+    def __init__(self, field: Field):
+        self.field = field
+        self.name = field.name
+        self.type = field.type
+        self.choices: tuple[Any, ...] | None = None
+
+        field_name = field.name
+        field_type = field.type
+
+        if field_type in supported_singleton_types:
+            self.kind = 'singleton'
+            self.value_type = field_type
+        elif get_origin(field_type) is Literal:
+            literal_args = get_args(field_type)
+            literal_types = list(map(type, literal_args))
+
+            for literal_arg, literal_type in zip(literal_args, literal_types):
+                if literal_type not in supported_singleton_types:
+                    raise TypeError(
+                        f'Expectes all `Literal` value members to have '
+                        f'type {supported_singleton_types}, '
+                        f'but found {literal_arg} '
+                        f'with type {literal_type}.'
+                    )
+
+            for (prev_arg, prev_type), (curr_arg, curr_type) in pairwise(
+                zip(literal_args, literal_types)
+            ):
+                if prev_type is not curr_type:
+                    raise TypeError(
+                        f'Expects all choices in a `Literal` type to have '
+                        f'the same type, but found inconsistent members '
+                        f'`{prev_arg}` with type '
+                        f'`{prev_type}` and '
+                        f'`{curr_arg}` with type '
+                        f'`{curr_type}`.'
+                    )
+
+            self.kind = 'literal'
+            self.value_type = literal_types[0]
+            self.choices = literal_args
+        elif get_origin(field_type) is list:
+            list_args = get_args(field_type)
+            if len(list_args) != 1:
+                raise TypeError(
+                    f'Expect only one member type in list, '
+                    f'but found {list_args}.'
+                )
+
+            list_type = list_args[0]
+            if list_type not in supported_singleton_types:
+                raise TypeError(
+                    f'Expect the list to have one of '
+                    f'`{supported_singleton_types}` type '
+                    f'but found `{list_type}`.'
+                )
+
+            self.kind = 'list'
+            self.value_type = list_type
+        else:
+            raise TypeError(
+                f'`{field_type}` is not supported by `RootConfig`.'
+            )
+
+        self.storage = field.metadata.get('storage', 'list')
+        if self.storage == 'array':
+            if not (
+                self.kind == 'list'
+                and self.value_type in array_storage_typecodes
+            ):
+                raise TypeError(
+                    f'`{field_name}` cannot be stored as an array, '
+                    f'only `list[int]` and `list[float]` fields can.'
+                )
+        elif self.storage != 'list':
+            raise TypeError(
+                f'`{self.storage}` is not one of `list` or `array`.'
+            )
+
+        self.check = self._make_check(field_name)
+
+    def _make_check(self, field_name: str) -> Callable[[Any], None]:
+        value_type = self.value_type
+
+        if self.kind == 'singleton':
+            def check_singleton(value: Any):
+                if not isinstance(value, value_type):
+                    raise TypeError(
+                        f'`{field_name}` is expected to be a(n) `{value_type}`'
+                        f' but got {type(value)}.'
+                    )
+            return check_singleton
+
+        if self.kind == 'literal':
+            choices = self.choices
+
+            def check_literal(value: Any):
+                if value not in choices:  # type: ignore
+                    raise TypeError(
+                        f'`{value}` is not one of `{choices}`.'
+                    )
+            return check_literal
+
+        def check_list(value: Any):
+            if not isinstance(value, list):
+                fits = _array_fits(value, value_type)
+                if fits:
+                    return
+                if fits is None:
+                    raise TypeError(
+                        f'`{field_name}` is expected to be a list, '
+                        f'but got {type(value)}. '
+                    )
+                element_type = getattr(value, 'typecode', None) or getattr(
+                    value, 'dtype'
+                )
+                raise TypeError(
+                    f'`{field_name}` expects all elements to be '
+                    f'`{value_type}`, but got an array of `{element_type}`.'
+                )
+            # One `issubclass` per distinct element type
+            # instead of one `isinstance` per element.
+            for element_type in set(map(type, value)):
+                if not issubclass(element_type, value_type):
+                    raise TypeError(
+                        f'`{field_name}` expects all elements to be '
+                        f'`{value_type}`, but found {element_type}.'
+                    )
+        return check_list
+
+    def check_column(self, values: Sequence[Any]):
+        """Check a whole column of values for the field at once.
+
+        Valid columns are checked with one pass over the distinct types
+        (or values, for `Literal`) instead of one `check` call per value.
+        Otherwise, the error of the first invalid value is raised, with its
+        index stored in the `index` attribute of the exception.
+        """
+
+        if self._column_is_valid(values):
+            return
+        for index, value in enumerate(values):
+            try:
+                self.check(value)
+            except TypeError as e:
+                e.index = index  # type: ignore
+                raise
+
+    def _column_is_valid(self, values: Sequence[Any]) -> bool:
+        value_type = self.value_type
+
+        if self.kind == 'literal':
+            choices: tuple[Any, ...] = self.choices  # type: ignore
+            try:
+                return set(values).issubset(choices)
+            except TypeError:  # unhashable values
+                return all(value in choices for value in values)
+
+        container_type = list if self.kind == 'list' else value_type
+        if not all(
+            issubclass(t, container_type) for t in set(map(type, values))
+        ):
+            return False
+        if self.kind == 'list':
+            return all(
+                issubclass(t, value_type)
+                for t in set(map(type, chain.from_iterable(values)))
+            )
+        return True
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.name!r}, {self.type!r})'
+
+
+class ConfigSchema:
+    """The compiled schema of a `RootConfig` subclass.
+
+    Compiling walks the type annotations of all fields once,
+    raising `TypeError` for unsupported or malformed types,
+    and prepares one specialized checker per field.
+    Instances then only run the value checks.
+
+    Use `RootConfig._compiled_schema` to get the cached schema of a class.
+    """
+
+    def __init__(self, cls: type):
+        self.fields = tuple(FieldSchema(field) for field in fields(cls))
+        self.by_name = {schema.name: schema for schema in self.fields}
+        self.names = tuple(self.by_name)
+        self.checks = tuple(schema.check for schema in self.fields)
+        self.array_fields = tuple(
+            (schema.name, array_storage_typecodes[schema.value_type],
+             schema.check)
+            for schema in self.fields if schema.storage == 'array'
+        )
+        self.list_fields = tuple(
+            (schema.name, schema.check) for schema in self.fields
+            if schema.kind == 'list' and schema.storage == 'list'
+        )
+        # Fields held in `__slots__` rather than in the instance `__dict__`.
+        self.slot_names = tuple(
+            name for name in self.names
+            if isinstance(getattr(cls, name, None), MemberDescriptorType)
+        )
+
+        if len(self.names) == 1:
+            getter = attrgetter(self.names[0])
+            self.values_of: Callable[[Any], tuple[Any, ...]] = (
+                lambda instance: (getter(instance),)
+            )
+        elif self.names:
+            self.values_of = attrgetter(*self.names)
+        else:
+            self.values_of = lambda instance: ()
+
+
 @dataclass
 class RootConfig(ABC):
     """The `RootConfig` class.
@@ -134,37 +675,493 @@ class RootConfig(ABC):
         epoch: int
         lr: float
     ```
+
+    Also see `config_dataclass` decorator for compact instances.
+
+    Instances are validated when they are created. The validation level
+    can be set per class, such as `class Config(RootConfig,
+    validation='values-only')`, and overridden with `validation_level`
+    or the `validate` argument of constructors. See `ValidationLevel`.
     """
 
+    __slots__ = ('_fingerprint_cache',)
+    __rootconfig_validation__: ClassVar[ValidationLevel | None] = None
+
+    def __init_subclass__(
+        cls, validation: ValidationLevel | None = None, **kwargs: Any,
+    ):
+        super().__init_subclass__(**kwargs)
+        if validation is not None:
+            cls.__rootconfig_validation__ = _checked_validation_level(
+                validation
+            )
+
+    @classmethod
+    def _effective_validation(
+        cls, validate: ValidationLevel | None = None,
+    ) -> ValidationLevel:
+        """Resolve the validation level of instances created now."""
+
+        if validate is not None:
+            return _checked_validation_level(validate)
+        return (
+            _validation_level.get() or cls.__rootconfig_validation__
+            or default_validation_level
+        )
+
     @classmethod
-    def from_dict(cls, dic: dict[str, Any]):
+    def from_dict(
+        cls, dic: dict[str, Any], validate: ValidationLevel | None = None,
+    ):
         """Create an instance from a `dict`.
 
         Keys from the input `dict` that does not exist in the class
         will be filtered.
+        `validate` overrides the validation level, see `ValidationLevel`.
         """
 
-        names = {field.name for field in fields(cls)}
+        names = cls._compiled_schema().by_name
         filtered_dict = {k: v for k, v in dic.items() if k in names}
-        return cls(**filtered_dict)
+        return cls._create(filtered_dict, validate)
+
+    @classmethod
+    def from_records(
+        cls, records: Iterable[Mapping[str, Any]],
+        lazy: bool = False, chunk_size: int = 4096,
+        validate: ValidationLevel | None = None,
+    ):
+        """Create many instances from an iterable of `dict`s.
+
+        Keys are filtered the same way as `from_dict`, but types are
+        checked column by column across the records instead of
+        instance by instance. An invalid record raises the same error as
+        `from_dict` would, prefixed with the index of the record.
+
+        A `list` is returned by default. With `lazy=True`, an iterator is
+        returned instead, which consumes and checks `chunk_size`
+        records at a time.
+
+        `validate` overrides the validation level, see `ValidationLevel`.
+
+        ```python
+        configs = Config.from_records(sweep_rows)
+        ```
+        """
+
+        level = cls._effective_validation(validate)
+        if lazy:
+            return cls._iter_records(records, chunk_size, level)
+        return cls._from_record_chunk(list(records), 0, level)
+
+    @classmethod
+    def to_columns(
+        cls, configs: Iterable['RootConfig'],
+        backend: Literal['array', 'numpy', 'pandas'] = 'array',
+    ):
+        """Convert instances to one column per field, for analysis.
+
+        Numeric and `bool` fields become `array.array`s, and `str`,
+        `Path`, and `Literal` fields become `list`s of shared, interned
+        values. The instances are read in a single pass, without creating
+        a `dict` per instance, and values are not copied.
+        With `backend='numpy'`, columns are NumPy arrays instead, and
+        with `backend='pandas'`, a pandas `DataFrame` is returned.
+        See `rootconfig.columns` for details.
+        Also see `from_columns` class method.
+
+        ```python
+        columns = Config.to_columns(configs)
+        columns['learning_rate']  # array('d', [0.001, 0.0001, ...])
+        ```
+        """
+
+        from .columns import to_columns, to_numpy, to_pandas
+        match backend:
+            case 'array':
+                return to_columns(cls, configs)
+            case 'numpy':
+                return to_numpy(cls, configs)
+            case 'pandas':
+                return to_pandas(cls, configs)
+        raise ValueError(
+            f'`{backend}` is not one of `array`, `numpy`, or `pandas`.'
+        )
+
+    @classmethod
+    def from_columns(
+        cls, columns: Mapping[str, Any],
+        validate: ValidationLevel | None = None,
+    ):
+        """Create instances from one column per field.
+
+        Columns may be `list`s, `array.array`s, NumPy arrays, or pandas
+        `Series`, and may come from a pandas `DataFrame`. Keys that are
+        not fields are ignored, and missing fields take their defaults.
+        Types are checked column by column, like `from_records`.
+        `validate` overrides the validation level, see `ValidationLevel`.
+        Also see `to_columns` class method.
+        """
+
+        from .columns import from_columns
+        return from_columns(cls, columns, validate)
+
+    @classmethod
+    def grid(cls, *, shard: int = 0, num_shards: int = 1, **axes):
+        """Create a lazy grid over the given field values.
+
+        Each keyword argument is an axis, named after a field,
+        with a sequence of values to sweep. Fields that are not on any
+        axis keep their default values. The returned `ConfigGrid`
+        supports `len()`, indexing, and iteration, and only creates
+        instances on demand.
+
+        Every axis value is checked once, instead of once per combination.
+        Use `shard` and `num_shards` to only take one contiguous slice
+        of the grid, such as one per cluster node.
+
+        ```python
+        for config in Config.grid(lr=[1e-3, 1e-4], optimizer=['Adam', 'SGD']):
+            train(config)
+        ```
+        """
+
+        return ConfigGrid(cls, axes, shard=shard, num_shards=num_shards)
+
+    @classmethod
+    def _create(
+        cls, kwargs: Mapping[str, Any],
+        validate: ValidationLevel | None = None,
+    ):
+        """Create an instance, with the given validation level if any."""
+
+        if validate is None:
+            return cls(**kwargs)
+        token = _validation_level.set(_checked_validation_level(validate))
+        try:
+            return cls(**kwargs)
+        finally:
+            _validation_level.reset(token)
+
+    @classmethod
+    def _create_unchecked(cls, kwargs: Mapping[str, Any]):
+        """Create an instance without running `check_sanity`.
+
+        Only for values that have already been checked.
+        """
+
+        return cls._create(kwargs, 'none')
 
     @classmethod
-    def from_json(cls, json_file: os.PathLike):
+    def _iter_records(
+        cls, records: Iterable[Mapping[str, Any]], chunk_size: int,
+        level: ValidationLevel,
+    ):
+        if chunk_size < 1:
+            raise ValueError(
+                f'`chunk_size` should be positive, but got {chunk_size}.'
+            )
+        iterator = iter(records)
+        start = 0
+        while chunk := list(islice(iterator, chunk_size)):
+            yield from cls._from_record_chunk(chunk, start, level)
+            start += len(chunk)
+
+    @classmethod
+    def _from_record_chunk(
+        cls, records: list[Mapping[str, Any]], start: int,
+        level: ValidationLevel,
+    ) -> list:
+        schema = cls._compiled_schema()
+        names = schema.by_name
+
+        instances = []
+        token = _validation_level.set('none')
+        try:
+            for index, record in enumerate(records, start):
+                try:
+                    instances.append(cls(**{
+                        k: v for k, v in record.items() if k in names
+                    }))
+                except TypeError as e:
+                    raise TypeError(f'Record {index}: {e}') from e
+                except ValueError as e:
+                    raise ValueError(f'Record {index}: {e}') from e
+        finally:
+            _validation_level.reset(token)
+
+        if level == 'none':
+            return instances
+        if instances and level == 'full':
+            instances[0]._validate_instance_is_dataclass()
+        for field_schema in schema.fields:
+            getter = attrgetter(field_schema.name)
+            try:
+                column = list(map(getter, instances))
+            except AttributeError:
+                for index, instance in enumerate(instances, start):
+                    if not hasattr(instance, field_schema.name):
+                        raise ValueError(
+                            f'Record {index}: `{field_schema.name}` expects '
+                            f'a value, but nothing is provided.'
+                        )
+                raise
+            try:
+                field_schema.check_column(column)
+            except TypeError as e:
+                raise TypeError(
+                    f'Record {start + e.index}: {e}'  # type: ignore
+                ) from e
+        return instances
+
+    @classmethod
+    def from_json(
+        cls, json_file: os.PathLike,
+        validate: ValidationLevel | None = None, cached: bool = False,
+    ):
         """Create an instance from a JSON file.
 
-        Also see `to_json` instance method.
+        `validate` overrides the validation level, see `ValidationLevel`.
+        With `cached=True`, the instance is kept in a process-wide LRU
+        cache, `rootconfig.watch.json_file_cache`, and the same instance
+        is returned until the file's modification time or size changes.
+        Cached instances should not be mutated.
+        Also see `to_json` instance method and `watch_json` class method.
         """
 
+        if cached:
+            from .watch import json_file_cache
+            return json_file_cache.load(cls, json_file, validate)
         with open(json_file, 'r') as f:
             incoming_data = json.load(
                 f, object_hook=root_config_json_decode_object_hook
             )
-        return cls.from_dict(incoming_data)
+        return cls._from_json_object(incoming_data, validate, hooked=True)
+
+    @classmethod
+    def _from_json_object(
+        cls, data: Any, validate: ValidationLevel | None = None,
+        hooked: bool = False,
+    ):
+        """Create an instance from a decoded JSON `Object`.
+
+        With `hooked=True`, `data` was decoded with
+        `root_config_json_decode_object_hook` already, otherwise it is raw.
+        """
+
+        if hooked:
+            _check_json_object(data)
+            return cls.from_dict(data, validate)
+        return cls.from_dict(cls._decode_json_object(data), validate)
+
+    @classmethod
+    def _decode_json_object(cls, data: Any) -> dict[str, Any]:
+        """Decode the field values of a raw JSON `Object` in place.
+
+        Instead of running `root_config_json_decode_object_hook` on every
+        JSON `Object`, only the fields that can hold non-standard types
+        are decoded.
+        """
+
+        _check_json_object(data)
+        cache = _class_cache(cls)
+        try:
+            decoders = cache['json_decoders']
+        except KeyError:
+            decoders = cache['json_decoders'] = tuple(
+                (schema.name, decoder)
+                for schema in cls._compiled_schema().fields
+                if (decoder := _json_field_decoder(schema)) is not None
+            )
+        for name, decoder in decoders:
+            if name in data:
+                data[name] = decoder(data[name])
+        return data
+
+    @classmethod
+    def watch_json(
+        cls, json_file: os.PathLike | str, interval: float = 1.,
+        validate: ValidationLevel | None = None,
+    ):
+        """Return a `ConfigWatcher` polling a JSON file for changes.
+
+        The watcher yields a new instance only when the file's content
+        changed, and keeps the last good instance if a reload fails.
+        See `rootconfig.watch.ConfigWatcher`.
+        """
+
+        from .watch import ConfigWatcher
+        return ConfigWatcher(cls, json_file, interval, validate)
+
+    @classmethod
+    async def afrom_json(
+        cls, json_file: os.PathLike | str,
+        validate: ValidationLevel | None = None,
+        executor: Executor | None = None,
+    ):
+        """Create an instance from a JSON file, without blocking asyncio.
+
+        The file is read and decoded by `from_json` in `executor`, or in a
+        bounded thread pool shared by the process. Cancelling stops
+        waiting, but a file already being read is finished in the pool.
+        Also see `ato_json` instance method.
+        """
+
+        from .aio import afrom_json
+        return await afrom_json(cls, json_file, validate, executor)
+
+    @classmethod
+    async def afrom_json_many(
+        cls, json_files: Iterable[os.PathLike | str], limit: int = 32,
+        return_exceptions: bool = False,
+        validate: ValidationLevel | None = None,
+        executor: Executor | None = None,
+    ):
+        """Create instances from JSON files, `limit` files at a time.
+
+        Return the instances in order, like `asyncio.gather`. The first
+        error is raised and cancels the other files, unless
+        `return_exceptions` is `True`. Also see `afrom_json`.
+        """
+
+        from .aio import afrom_json_many
+        return await afrom_json_many(
+            cls, json_files, limit, return_exceptions, validate, executor
+        )
+
+    @classmethod
+    def iter_jsonl(
+        cls, jsonl_file: os.PathLike | str,
+        validate: ValidationLevel | None = None,
+    ):
+        """Lazily create instances from a JSON Lines file.
+
+        Each line is decoded the same way as `from_json`, and only one
+        line is held in memory at a time. Compressed files ending with
+        `.gz`, `.bz2`, `.xz`, or `.lzma` are supported.
+        Errors are prefixed with the file name and the line number.
+        `validate` overrides the validation level, see `ValidationLevel`.
+
+        Also see `write_jsonl` class method.
+
+        ```python
+        for config in Config.iter_jsonl('sweep.jsonl.gz'):
+            ...
+        ```
+        """
+
+        from .jsonl import iter_jsonl
+        return iter_jsonl(cls, jsonl_file, validate)
+
+    @classmethod
+    def write_jsonl(
+        cls, jsonl_file: os.PathLike | str, configs: Iterable['RootConfig'],
+        append: bool = False,
+    ) -> int:
+        """Write instances to a JSON Lines file, one per line.
+
+        Each line is encoded the same way as `to_json`. The file is
+        compressed based on its suffix, like `iter_jsonl`.
+        Return the number of written instances.
+        """
+
+        from .jsonl import write_jsonl
+        return write_jsonl(jsonl_file, configs, append=append)
+
+    @classmethod
+    def load_many(
+        cls, paths: os.PathLike | str | Iterable[os.PathLike | str],
+        workers: int | None = None,
+        executor: Literal['thread', 'process'] = 'thread',
+        stream: bool = False, chunk_size: int | None = None,
+        validate: ValidationLevel | None = None,
+    ):
+        """Load many JSON files in parallel, like `from_json`.
+
+        `paths` is a glob pattern, such as `'runs/**/config.json'`,
+        or an iterable of paths. Files are loaded in chunks of
+        `chunk_size` by `workers` threads or processes.
+
+        Return a `list` of `LoadResult(path, config, error)`, one per
+        file, in order. A file that fails to load has its `OSError`,
+        `TypeError`, or `ValueError` in `error` instead of aborting.
+        With `stream=True`, return an iterator that yields the results
+        as soon as they are loaded, in no particular order.
+        `validate` overrides the validation level, see `ValidationLevel`.
+
+        ```python
+        for path, config, error in Config.load_many(
+            'runs/**/config.json', executor='process', stream=True
+        ):
+            ...
+        ```
+        """
+
+        from .bulk import iter_load_many, load_many
+        if stream:
+            return iter_load_many(
+                cls, paths, workers, executor, False, chunk_size, validate
+            )
+        return load_many(cls, paths, workers, executor, chunk_size, validate)
+
+    @classmethod
+    def load(
+        cls, sources: Iterable[Any],
+        validate: ValidationLevel | None = None,
+    ):
+        """Create an instance from layered sources, validated once.
+
+        Later sources override earlier ones, field by field. Each source
+        is one of:
+
+        - a mapping of values, such as project defaults;
+        - a path of a JSON file, or a string that ends with `.json`,
+          contains a path separator, or names an existing file;
+        - another string, a prefix of `<prefix><FIELD_NAME>` environment
+          variables, converted like command-line arguments, if it is
+          an identifier such as `APP_`;
+        - a `list` of command-line arguments, parsed like `parse_args`;
+        - a source of `rootconfig.layers`, such as `Arguments()` for
+          `sys.argv[1:]`.
+
+        Only the fields present in a source are taken from it. The values
+        are merged without copying, and the instance is only created,
+        and validated, once. `validate` overrides the validation level,
+        see `ValidationLevel`. Also see `load_with_sources`.
+
+        ```python
+        config = Config.load([
+            {'epoch': 10}, 'config.json', 'MYAPP_', sys.argv[1:],
+        ])
+        ```
+        """
+
+        from .layers import load_with_sources
+        return load_with_sources(cls, sources, validate)[0]
+
+    @classmethod
+    def load_with_sources(
+        cls, sources: Iterable[Any],
+        validate: ValidationLevel | None = None,
+    ):
+        """Same as `load`, but also return the source of each field.
+
+        Sources are named `values`, `json:<path>`, `env:<prefix>`, and
+        `argv`, and fields no source supplied come from `default`.
+
+        ```python
+        config, sources = Config.load_with_sources(['config.json', argv])
+        sources  # {'epoch': 'argv', 'optimizer': 'json:config.json', ...}
+        ```
+        """
+
+        from .layers import load_with_sources
+        return load_with_sources(cls, sources, validate)
 
     @classmethod
     def parse_args(
         cls, arguments: list[str] | None = None,
         parser: ArgumentParser | None = None,
+        engine: Literal['argparse', 'fast'] = 'argparse',
     ):
         """Create an instance from a Python `ArgumentParser`
 
@@ -176,16 +1173,66 @@ class RootConfig(ABC):
         compared with `forge_parser` class method, as the latter would
         touch the provided parser.
 
+        With `engine='fast'`, the arguments are parsed by a
+        `FastArgumentParser` built from the same argument options,
+        which skips `ArgumentParser` entirely for well-formed arguments.
+        The resulting values and errors are the same for both engines.
+        The fast engine cannot be used with a provided parser.
+
         ```python
         config = Config.parse_args()
+        config = Config.parse_args(engine='fast')
         ```
         """
 
+        if engine == 'fast':
+            if parser is not None:
+                raise ValueError(
+                    'The fast engine cannot be used with a provided parser.'
+                )
+            if arguments is None:
+                arguments = sys.argv[1:]
+            values = cls._fast_parser().parse(list(arguments))
+            if values is not None:
+                return cls.from_dict(values)
+        elif engine != 'argparse':
+            raise ValueError(
+                f'`{engine}` is not one of `argparse` or `fast`.'
+            )
+
         if parser is None:
-            parser = cls.forge_parser(parser)
+            parser = cls.cached_parser()
         args = parser.parse_args(arguments)
         return cls.from_dict(vars(args))
 
+    @classmethod
+    def _fast_parser(cls) -> FastArgumentParser:
+        cache = _class_cache(cls)
+        try:
+            return cache['fast_parser']
+        except KeyError:
+            parser = cache['fast_parser'] = FastArgumentParser(
+                cls._option_spec()
+            )
+            return parser
+
+    @classmethod
+    def cached_parser(cls) -> ArgumentParser:
+        """Return the default `ArgumentParser` of the class.
+
+        The parser is forged on first use and reused by every
+        `parse_args` call afterwards. Do not attach extra arguments
+        to it; use `forge_parser` to get a parser of your own.
+        Call `clear_cache` to drop it.
+        """
+
+        cache = _class_cache(cls)
+        try:
+            return cache['parser']
+        except KeyError:
+            parser = cache['parser'] = cls.forge_parser()
+            return parser
+
     @classmethod
     def forge_parser(
         cls, parser: ArgumentParser | None = None,
@@ -211,6 +1258,9 @@ class RootConfig(ABC):
         All command-line arguments are keyword arguments.
         For those data class fields that do not have default values,
         those keyword arguments are not optional.
+        Fields with a `default_factory` get `argparse.SUPPRESS`
+        as their default, so that the factory is only called
+        by the class itself when the argument is absent.
 
         This method is used when forging the default `ArgumentParser`
         for the class.
@@ -221,54 +1271,370 @@ class RootConfig(ABC):
         ```
         """
 
-        prefix_char = '-'
-        for field in fields(cls):
-            arg_name = prefix_char * 2 + field.name.replace('_', prefix_char)
+        for arg_name, arg_options in cls._option_spec():
+            yield arg_name, dict(arg_options)
+
+    @classmethod
+    def _option_spec(cls) -> tuple[tuple[str, dict[str, Any]], ...]:
+        """Return the cached argument names and options of the class.
+
+        Also see `parser_named_options`, which yields copies of them.
+        """
 
-            arg_options: dict[str, Any] = dict()
-            arg_options['required'] = (
-                field.default == MISSING and field.default_factory == MISSING
+        cache = _class_cache(cls)
+        try:
+            return cache['options']
+        except KeyError:
+            options = cache['options'] = tuple(
+                _named_options_of(schema)
+                for schema in cls._compiled_schema().fields
             )
-            if field.default != MISSING or field.default_factory != MISSING:
-                assert not arg_options['required']
-                arg_options['default'] = (
-                    field.default_factory()
-                    if field.default_factory != MISSING else field.default
-                )
-            if get_origin(field.type) is list:
-                list_type = get_args(field.type)[0]
-                if list_type is bool:
-                    arg_options['type'] = parse_bool
-                else:
-                    arg_options['type'] = list_type
-                arg_options['nargs'] = '*'
-            elif get_origin(field.type) is Literal:
-                arg_options['type'] = type(get_args(field.type)[0])
-                arg_options['choices'] = get_args(field.type)
-            elif field.type is bool:
-                arg_options['type'] = parse_bool
-                arg_options['choices'] = [True, False]
-            else:
-                arg_options['type'] = field.type
-
-            yield arg_name, arg_options
+            return options
 
     def __post_init__(self):
-        self.check_sanity()
+        schema = type(self)._compiled_schema()
+        if schema.array_fields:
+            self._store_arrays()
+        for name, check in schema.list_fields:
+            value = getattr(self, name)
+            if type(value) is not list and _is_numpy_like(value):
+                self._store_numpy_array(name, value, check)
+        level = (
+            _validation_level.get() or self.__rootconfig_validation__
+            or default_validation_level
+        )
+        if level == 'full':
+            self.check_sanity()
+        elif level == 'values-only':
+            self._validate_instance_variable_types()
+
+    def __reduce__(self):
+        """Pickle the field values only, as a `tuple`.
+
+        Unpickling sets them back without running `__init__`, and so
+        without validation, the same as for any pickled object.
+        Attributes other than fields are kept too.
+        """
+
+        cls = type(self)
+        schema = cls._compiled_schema()
+        values = schema.values_of(self)
+        state = getattr(self, '__dict__', None)
+        if state and len(state) > len(schema.names) - len(schema.slot_names):
+            names = schema.by_name
+            return _rebuild_config, (cls, values, {
+                key: value for key, value in state.items()
+                if key not in names
+            })
+        return _rebuild_config, (cls, values)
+
+    def _store_arrays(self):
+        """Convert the values of `'array'` storage fields to arrays.
+
+        Values are checked before the conversion, even without
+        validation, so that `array.array` never coerces invalid elements.
+        """
+
+        for name, typecode, check in (
+            type(self)._compiled_schema().array_fields
+        ):
+            value = getattr(self, name)
+            if type(value) is array and value.typecode == typecode:
+                continue
+            check(value)
+            object.__setattr__(
+                self, name, _to_storage_array(value, typecode, name)
+            )
+
+    def _store_numpy_array(
+        self, name: str, value: Any, check: Callable[[Any], None],
+    ):
+        """Copy the NumPy array of a `'list'` storage field out of NumPy.
+
+        NumPy arrays compare element-wise, so that instances holding them
+        could not be compared. The array is checked before the copy, like
+        in `_store_arrays`, and copied by `_from_numpy`.
+        """
+
+        check(value)
+        object.__setattr__(self, name, _from_numpy(value))
+
+    def evolve(self, **changes: Any):
+        """Return a copy of the instance with some fields changed.
+
+        Same as `dataclasses.replace`, but only the changed values are
+        checked, and the unchanged values are shared with the instance
+        rather than passed through `__init__` and checked again.
+
+        If the class overrides `__post_init__`, the copy is created with
+        `dataclasses.replace` instead, so that `__post_init__` still runs,
+        but without checking the unchanged values either.
+
+        Also see `evolve_many` instance method.
+        """
+
+        schema = type(self)._compiled_schema()
+        for name, value in changes.items():
+            self._changed_field(schema, name).check(value)
+        return self._evolved(schema, changes)
+
+    def evolve_many(self, changes: Iterable[Mapping[str, Any]]) -> list:
+        """Return one copy of the instance per `dict` of changed fields.
+
+        Same as calling `evolve` for each `dict`, but changed values are
+        checked field by field, in bulk, like `from_records`.
+        Errors report the index of the invalid `dict`.
+
+        ```python
+        variants = config.evolve_many(
+            {'learning_rate': lr} for lr in learning_rates
+        )
+        ```
+        """
+
+        schema = type(self)._compiled_schema()
+        changes = list(changes)
+        columns: dict[str, tuple[list[int], list[Any]]] = {}
+        for index, change in enumerate(changes):
+            for name, value in change.items():
+                try:
+                    indices, values = columns[name]
+                except KeyError:
+                    try:
+                        self._changed_field(schema, name)
+                    except TypeError as e:
+                        raise TypeError(f'Changes {index}: {e}') from e
+                    except ValueError as e:
+                        raise ValueError(f'Changes {index}: {e}') from e
+                    indices, values = columns[name] = ([], [])
+                indices.append(index)
+                values.append(value)
+        for name, (indices, values) in columns.items():
+            try:
+                schema.by_name[name].check_column(values)
+            except TypeError as e:
+                raise TypeError(
+                    f'Changes {indices[e.index]}: {e}'  # type: ignore
+                ) from e
+        return [self._evolved(schema, change) for change in changes]
+
+    def _changed_field(self, schema: 'ConfigSchema', name: str):
+        try:
+            field_schema = schema.by_name[name]
+        except KeyError:
+            raise TypeError(
+                f'`{name}` is not a field of `{type(self).__name__}`.'
+            ) from None
+        if not field_schema.field.init:
+            raise ValueError(
+                f'`{name}` is declared with `init=False`, '
+                f'so it cannot be changed.'
+            )
+        return field_schema
+
+    def _evolved(self, schema: 'ConfigSchema', changes: Mapping[str, Any]):
+        """Copy the instance with checked changes, without validation."""
+
+        cls = type(self)
+        if cls.__post_init__ is not RootConfig.__post_init__:
+            token = _validation_level.set('none')
+            try:
+                return replace(self, **changes)
+            finally:
+                _validation_level.reset(token)
+
+        set_attribute = object.__setattr__
+        instance = object.__new__(cls)
+        state = getattr(self, '__dict__', None)
+        if state is not None:
+            instance.__dict__.update(state)
+        for name in schema.slot_names:
+            set_attribute(instance, name, getattr(self, name))
+        for name, value in changes.items():
+            field_schema = schema.by_name[name]
+            if field_schema.storage == 'array':
+                value = _to_storage_array(
+                    value, array_storage_typecodes[field_schema.value_type],
+                    name,
+                )
+            elif (
+                field_schema.kind == 'list' and type(value) is not list
+                and _is_numpy_like(value)
+            ):
+                value = _from_numpy(value)
+            set_attribute(instance, name, value)
+        return instance
+
+    def to_dict(self, copy: Literal['deep', 'shallow', 'none'] = 'deep'):
+        """Convert the instance to a Python `dict`.
+
+        - `'deep'`: values are deep-copied by `dataclasses.asdict`.
+        - `'shallow'`: `list` and array values are copied,
+          but not their elements.
+          Since all supported element types are immutable, this is
+          as safe as a deep copy, and much cheaper for long lists.
+        - `'none'`: values are not copied at all.
+          Mutating the `dict` values mutates the instance.
+
+        Also see `as_mapping` for a read-only view without any copy.
+        """
+
+        if copy == 'deep':
+            return asdict(self)
+        schema = type(self)._compiled_schema()
+        values = schema.values_of(self)
+        if copy == 'none':
+            return dict(zip(schema.names, values))
+        if copy == 'shallow':
+            return {
+                field_schema.name:
+                    _copy_list(value) if field_schema.kind == 'list'
+                    else value
+                for field_schema, value in zip(schema.fields, values)
+            }
+        raise ValueError(
+            f'`{copy}` is not one of `deep`, `shallow`, or `none`.'
+        )
 
-    def to_dict(self):
-        """Convert the instance to a Python `dict`."""
+    def as_mapping(self) -> 'RootConfigMapping':
+        """Return a read-only `Mapping` view over the fields.
+
+        Nothing is copied, and later changes to the instance
+        are visible through the view.
+        """
 
-        return asdict(self)
+        return RootConfigMapping(self)
 
     def to_json(self, json_file: os.PathLike):
         """Textualize the instance to a JSON file.
 
+        Values are encoded straight from the fields, without copying.
         Also see `from_json` class method.
         """
 
+        chunks = _iterencode_json_object(
+            RootConfigJSONEncoder(), self.to_dict(copy='none')
+        )
         with open(json_file, 'w') as f:
-            json.dump(self.to_dict(), f, cls=RootConfigJSONEncoder)
+            f.writelines(chunks)
+
+    async def ato_json(
+        self, json_file: os.PathLike | str,
+        executor: Executor | None = None,
+    ):
+        """Textualize the instance to a JSON file, without blocking asyncio.
+
+        See `afrom_json` class method.
+        """
+
+        from .aio import ato_json
+        await ato_json(self, json_file, executor)
+
+    @staticmethod
+    async def ato_json_many(
+        items: Iterable[tuple['RootConfig', os.PathLike | str]],
+        limit: int = 32, return_exceptions: bool = False,
+        executor: Executor | None = None,
+    ):
+        """Textualize `(instance, path)` pairs, `limit` files at a time.
+
+        See `afrom_json_many` class method.
+        """
+
+        from .aio import ato_json_many
+        return await ato_json_many(
+            items, limit, return_exceptions, executor
+        )
+
+    def to_bytes(self) -> bytes:
+        """Encode the instance in the compact binary format.
+
+        `list`s of `int`, `float`, and `bool` are packed as raw arrays,
+        and all supported types, including `nan` and `inf`, round-trip
+        exactly. See `rootconfig.binary` for the layout.
+        Also see `from_bytes` class method.
+        """
+
+        from .binary import encode
+        return encode(self)
+
+    @classmethod
+    def from_bytes(
+        cls, data: bytes | bytearray | memoryview,
+        validate: ValidationLevel | None = None,
+    ):
+        """Create an instance from the compact binary format.
+
+        Raise `ValueError` if the data is not in the binary format.
+        `validate` overrides the validation level, see `ValidationLevel`.
+        Also see `to_bytes` instance method.
+        """
+
+        from .binary import decode
+        return decode(cls, data, validate)
+
+    def to_binary(self, binary_file: os.PathLike | str):
+        """Export the instance to a file in the compact binary format.
+
+        Also see `from_binary` class method.
+        """
+
+        from .binary import write
+        write(binary_file, self)
+
+    @classmethod
+    def from_binary(
+        cls, binary_file: os.PathLike | str,
+        validate: ValidationLevel | None = None,
+    ):
+        """Create an instance from a file in the compact binary format.
+
+        The file is memory-mapped, and packed arrays are read in place.
+        `validate` overrides the validation level, see `ValidationLevel`.
+        Also see `to_binary` instance method.
+        """
+
+        from .binary import read
+        return read(cls, binary_file, validate)
+
+    def fingerprint(self, fields: Iterable[str] | None = None) -> str:
+        """Return a stable content digest of the instance.
+
+        The digest is the hexadecimal SHA-256 of a canonical encoding
+        of the field names and values, described in
+        `rootconfig.fingerprint`. It does not depend on the process,
+        the platform, or the field order, and equal instances always
+        share the same digest. The class name does not take part in it.
+
+        The digest of all fields is cached on the instance, and computed
+        again once any field has been assigned another value.
+        Mutating a `list` value in place is not detected.
+
+        With `fields`, only the given fields are digested, uncached.
+        """
+
+        cls = type(self)
+        encoders = cls._canonical_encoders()
+        if fields is not None:
+            by_name = dict(encoders)
+            selected = []
+            for name in fields:
+                if name not in by_name:
+                    raise TypeError(
+                        f'`{name}` is not a field of `{cls.__name__}`.'
+                    )
+                selected.append((name, by_name[name]))
+            return content_digest(
+                selected, (getattr(self, name) for name, _ in selected)
+            )
+
+        values = cls._compiled_schema().values_of(self)
+        cached = getattr(self, '_fingerprint_cache', None)
+        if cached is not None and all(map(is_, values, cached[1])):
+            return cached[0]
+        digest = content_digest(encoders, values)
+        object.__setattr__(self, '_fingerprint_cache', (digest, values))
+        return digest
 
     def check_sanity(self):
         """Validate whether the instance is a proper `RootConfig` instance.
@@ -289,80 +1655,191 @@ class RootConfig(ABC):
             )
 
     def _validate_instance_variable_types(self):
-        for field in fields(self):
-            field_name = field.name
-            field_type = field.type
+        schema = type(self)._compiled_schema()
+        try:
+            values = schema.values_of(self)
+        except AttributeError:
+            for name in schema.names:
+                if not hasattr(self, name):
+                    raise ValueError(
+                        f'`{name}` expects a value, but nothing is provided.'
+                    )
+            raise
+        for check, value in zip(schema.checks, values):
+            check(value)
 
-            try:
-                field_val = getattr(self, field_name)
-            except AttributeError:
-                raise ValueError(
-                    f'`{field_name}` expects a value, but nothing is provided.'
-                )
+    @classmethod
+    def _compiled_schema(cls) -> 'ConfigSchema':
+        """Return the compiled `ConfigSchema` of the class.
 
-            if field_type in supported_singleton_types:
-                if not isinstance(field_val, field_type):
-                    raise TypeError(
-                        f'`{field_name}` is expected to be a(n) `{field_type}`'
-                        f' but got {type(field_val)}.'
-                    )
-            elif get_origin(field_type) is Literal:
-                literal_args = get_args(field_type)
-                literal_types = list(map(type, get_args(field_type)))
-
-                for literal_arg, literal_type in zip(
-                    literal_args, literal_types
-                ):
-                    if literal_type not in supported_singleton_types:
-                        raise TypeError(
-                            f'Expectes all `Literal` value members to have '
-                            f'type {supported_singleton_types}, '
-                            f'but found {literal_arg} '
-                            f'with type {literal_type}.'
-                        )
+        The schema is compiled on first use and cached on the class,
+        so that the type annotations are only walked once.
+        Call `clear_cache` to force a recompilation.
+        """
 
-                for (prev_arg, prev_type), (curr_arg, curr_type) in pairwise(
-                    zip(literal_args, literal_types)
-                ):
-                    if prev_type is not curr_type:
-                        raise TypeError(
-                            f'Expects all choices in a `Literal` type to have '
-                            f'the same type, but found inconsistent members '
-                            f'`{prev_arg}` with type '
-                            f'`{prev_type}` and '
-                            f'`{curr_arg}` with type '
-                            f'`{curr_type}`.'
-                        )
+        cache = _class_cache(cls)
+        try:
+            return cache['schema']
+        except KeyError:
+            schema = cache['schema'] = ConfigSchema(cls)
+            return schema
 
-                if field_val not in literal_args:
-                    raise TypeError(
-                        f'`{field_val}` is not one of `{literal_args}`.'
-                    )
-            elif get_origin(field_type) is list:
-                list_args = get_args(field_type)
-                if len(list_args) != 1:
-                    raise TypeError(
-                        f'Expect only one member type in list, '
-                        f'but found {list_args}.'
-                    )
+    @classmethod
+    def _canonical_encoders(
+        cls,
+    ) -> tuple[tuple[str, Callable[[Any], Any]], ...]:
+        """Return the field names paired with their canonical encoders."""
 
-                list_type = list_args[0]
-                if list_type not in supported_singleton_types:
-                    raise TypeError(
-                        f'Expect the list to have one of '
-                        f'`{supported_singleton_types}` type '
-                        f'but found `{list_type}`.'
-                    )
+        cache = _class_cache(cls)
+        try:
+            return cache['canonical_encoders']
+        except KeyError:
+            encoders = cache['canonical_encoders'] = tuple(
+                (schema.name, canonical_encoder(schema))
+                for schema in cls._compiled_schema().fields
+            )
+            return encoders
+
+    @classmethod
+    def clear_cache(cls):
+        """Drop everything compiled and cached for the class."""
+
+        _class_cache(cls).clear()
+
+
+def _rebuild_config(
+    cls: type[RootConfig], values: tuple[Any, ...],
+    state: dict[str, Any] | None = None,
+) -> RootConfig:
+    """Unpickle a `RootConfig` instance pickled by `__reduce__`."""
+
+    instance = object.__new__(cls)
+    schema = cls._compiled_schema()
+    if schema.slot_names:
+        set_attribute = object.__setattr__
+        for name, value in zip(schema.names, values):
+            set_attribute(instance, name, value)
+    else:
+        instance.__dict__.update(zip(schema.names, values))
+    if state:
+        instance.__dict__.update(state)
+    return instance
+
+
+class RootConfigMapping(Mapping[str, Any]):
+    """A read-only `Mapping` view over the fields of a `RootConfig` instance.
+
+    Also see `RootConfig.as_mapping` instance method.
+    """
+
+    __slots__ = ('_config', '_names')
+
+    def __init__(self, config: RootConfig):
+        self._config = config
+        self._names = type(config)._compiled_schema().by_name
 
-                if not isinstance(field_val, list):
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._names:
+            raise KeyError(key)
+        return getattr(self._config, key)
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, key: object):
+        return key in self._names
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self._config!r})'
+
+
+def _holds_value(instance: Any, name: str) -> bool:
+    """Whether an attribute has been assigned on the instance itself."""
+
+    if name in getattr(instance, '__dict__', ()):
+        return True
+    descriptor = getattr(type(instance), name, None)
+    if isinstance(descriptor, MemberDescriptorType):
+        try:
+            descriptor.__get__(instance)
+        except AttributeError:
+            return False
+        return True
+    return False
+
+
+def _frozen_setattr(self: Any, name: str, value: Any):
+    if name in self.__dataclass_fields__ and _holds_value(self, name):
+        raise FrozenInstanceError(f'cannot assign to field {name!r}')
+    object.__setattr__(self, name, value)
+
+
+def _frozen_delattr(self: Any, name: str):
+    if name in self.__dataclass_fields__:
+        raise FrozenInstanceError(f'cannot delete field {name!r}')
+    object.__delattr__(self, name)
+
+
+def _fingerprint_hash(self: RootConfig) -> int:
+    return int(self.fingerprint()[:16], 16)
+
+
+def config_dataclass(
+    cls: type | None = None, /, *, compact: bool = False,
+    hashable: bool = False, **kwargs: Any,
+):
+    """Python `dataclass` decorator with `RootConfig` specific options.
+
+    Without options, this is the same as `dataclass`. Other keyword
+    arguments are passed to `dataclass` as they are.
+
+    With `compact=True`, the class is built with `__slots__` instead of
+    a per-instance `__dict__`, which takes much less memory when keeping
+    many instances around. All base classes must define `__slots__` too,
+    which `RootConfig` does, or a `TypeError` is raised.
+    Same as any slotted `dataclass`, methods of the class cannot call
+    `super()` without arguments.
+
+    With `hashable=True`, instances are frozen: every field can only be
+    assigned once, when the instance is created, and assigning it again
+    raises `dataclasses.FrozenInstanceError`. `__hash__` then uses the
+    cached `fingerprint`, so that instances are cheap `dict` keys.
+    (`dataclass(frozen=True)` cannot be used, since `RootConfig` is not
+    a frozen `dataclass`.)
+
+    ```python
+    @config_dataclass(compact=True)
+    class Config(RootConfig):
+        epoch: int
+        lr: float
+    ```
+    """
+
+    def wrap(cls: type):
+        cls = dataclass(**(dict(kwargs, slots=True) if compact else kwargs))(
+            cls
+        )
+        if compact:
+            for base in cls.__mro__[:-1]:
+                if '__slots__' not in base.__dict__:
                     raise TypeError(
-                        f'`{field_name}` is expected to be a list, '
-                        f'but got {type(field_val)}. '
+                        f'`{base.__name__}` does not define `__slots__`, '
+                        f'so `{cls.__name__}` instances cannot be compact.'
                     )
-                for v in field_val:
-                    if not isinstance(v, list_type):
-                        raise TypeError()
-            else:
+        if hashable:
+            if not issubclass(cls, RootConfig):
                 raise TypeError(
-                    f'`{field_type}` is not supported by `RootConfig`.'
+                    f'`{cls.__name__}` is not a `RootConfig` subclass, '
+                    f'so it cannot be hashable.'
                 )
+            cls.__setattr__ = _frozen_setattr  # type: ignore
+            cls.__delattr__ = _frozen_delattr  # type: ignore
+            cls.__hash__ = _fingerprint_hash  # type: ignore
+        return cls
+
+    if cls is None:
+        return wrap
+    return wrap(cls)
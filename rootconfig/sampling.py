@@ -0,0 +1,408 @@
+"""
+`ConfigSampler`: random and quasi-random search over `RootConfig` fields.
+
+Values are drawn in bulk, column by column, with NumPy when it is
+installed, or with the Python standard library otherwise.
+"""
+
+import math
+import random
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+from copy import copy
+from itertools import islice
+from typing import (TYPE_CHECKING, Any, Generic, Iterator, Literal, Mapping,
+                    Sequence, TypeVar)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+if TYPE_CHECKING:
+    from .rootconfig import FieldSchema, RootConfig
+
+C = TypeVar('C', bound='RootConfig')
+
+SamplingMethod = Literal['random', 'lhs', 'halton', 'sobol']
+SamplingBackend = Literal['auto', 'numpy', 'python']
+
+
+class Distribution(ABC):
+    """The distribution of the values of one field.
+
+    A distribution maps uniform draws in `[0, 1)` to field values,
+    a whole column at a time, so that it works the same for random
+    and quasi-random samplers.
+    """
+
+    value_type: type = object
+
+    def check(self, field_schema: 'FieldSchema'):
+        """Raise `TypeError` if the distribution cannot fill the field."""
+
+        if not (
+            field_schema.kind == 'singleton'
+            and field_schema.value_type is self.value_type
+        ):
+            raise TypeError(
+                f'`{type(self).__name__}` samples `{self.value_type}` values, '
+                f'but `{field_schema.name}` has type `{field_schema.type}`.'
+            )
+
+    @abstractmethod
+    def transform(self, uniforms: list[float]) -> list[Any]:
+        """Map uniform draws to values with the standard library."""
+
+    @abstractmethod
+    def transform_array(self, uniforms: Any) -> list[Any]:
+        """Map a NumPy array of uniform draws to values."""
+
+
+class Uniform(Distribution):
+    """`float` values uniformly distributed in `[low, high)`."""
+
+    value_type = float
+
+    def __init__(self, low: float, high: float):
+        if not low < high:
+            raise ValueError(
+                f'Expect `low` < `high`, but got {low} and {high}.'
+            )
+        self.low = float(low)
+        self.high = float(high)
+
+    def transform(self, uniforms: list[float]) -> list[Any]:
+        low, scale = self.low, self.high - self.low
+        return [low + scale * u for u in uniforms]
+
+    def transform_array(self, uniforms: Any) -> list[Any]:
+        return (self.low + (self.high - self.low) * uniforms).tolist()
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.low}, {self.high})'
+
+
+class LogUniform(Uniform):
+    """`float` values whose logarithm is uniform in `[log(low), log(high))`.
+
+    Commonly used for learning rates.
+    """
+
+    def __init__(self, low: float, high: float):
+        if not 0 < low:
+            raise ValueError(f'Expect `low` > 0, but got {low}.')
+        super().__init__(low, high)
+
+    def transform(self, uniforms: list[float]) -> list[Any]:
+        log_low = math.log(self.low)
+        log_scale = math.log(self.high) - log_low
+        return [math.exp(log_low + log_scale * u) for u in uniforms]
+
+    def transform_array(self, uniforms: Any) -> list[Any]:
+        log_low = math.log(self.low)
+        log_scale = math.log(self.high) - log_low
+        return np.exp(log_low + log_scale * uniforms).tolist()
+
+
+class IntUniform(Distribution):
+    """`int` values uniformly distributed in `[low, high]`."""
+
+    value_type = int
+
+    def __init__(self, low: int, high: int):
+        if not low <= high:
+            raise ValueError(
+                f'Expect `low` <= `high`, but got {low} and {high}.'
+            )
+        self.low = int(low)
+        self.high = int(high)
+
+    def transform(self, uniforms: list[float]) -> list[Any]:
+        low, high = self.low, self.high
+        size = high - low + 1
+        return [min(low + int(u * size), high) for u in uniforms]
+
+    def transform_array(self, uniforms: Any) -> list[Any]:
+        size = self.high - self.low + 1
+        values = self.low + np.floor(uniforms * size).astype(np.int64)
+        return np.minimum(values, self.high).tolist()
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.low}, {self.high})'
+
+
+class Choice(Distribution):
+    """Values chosen from a sequence, optionally with weights.
+
+    Works with any field type, including `Literal` and `bool`,
+    as long as every choice is a valid value of the field.
+    """
+
+    def __init__(
+        self, values: Sequence[Any], weights: Sequence[float] | None = None,
+    ):
+        self.values = tuple(values)
+        if not self.values:
+            raise ValueError('Expect at least one value to choose from.')
+        if weights is None:
+            self.cumulative_weights = None
+        else:
+            if len(weights) != len(self.values):
+                raise ValueError(
+                    f'Expect {len(self.values)} weights, '
+                    f'but got {len(weights)}.'
+                )
+            total = math.fsum(weights)
+            accumulated = 0.
+            self.cumulative_weights = []
+            for weight in weights:
+                accumulated += weight
+                self.cumulative_weights.append(accumulated / total)
+
+    def check(self, field_schema: 'FieldSchema'):
+        try:
+            field_schema.check_column(self.values)
+        except TypeError as e:
+            raise TypeError(
+                f'Invalid choice for `{field_schema.name}`: {e}'
+            ) from e
+
+    def _positions(self, uniforms: list[float]) -> list[int]:
+        last = len(self.values) - 1
+        if self.cumulative_weights is None:
+            size = len(self.values)
+            return [min(int(u * size), last) for u in uniforms]
+        weights = self.cumulative_weights
+        return [min(bisect_right(weights, u), last) for u in uniforms]
+
+    def transform(self, uniforms: list[float]) -> list[Any]:
+        values = self.values
+        return [values[position] for position in self._positions(uniforms)]
+
+    def transform_array(self, uniforms: Any) -> list[Any]:
+        last = len(self.values) - 1
+        if self.cumulative_weights is None:
+            positions = np.floor(uniforms * len(self.values)).astype(np.int64)
+        else:
+            positions = np.searchsorted(
+                self.cumulative_weights, uniforms, side='right'
+            )
+        values = self.values
+        return [values[i] for i in np.minimum(positions, last).tolist()]
+
+    def __repr__(self):
+        return f'{type(self).__name__}({list(self.values)})'
+
+
+class ConfigSampler(Generic[C]):
+    """Draw `RootConfig` instances with fields sampled from distributions.
+
+    `method` is one of:
+
+    - `'random'`: independent uniform draws.
+    - `'lhs'`: Latin hypercube, stratified within each drawn batch.
+    - `'halton'`: the Halton low-discrepancy sequence, randomly shifted.
+    - `'sobol'`: the scrambled Sobol sequence, which requires SciPy.
+
+    Draws are reproducible for a given `seed`, `method`, and backend.
+    `backend='auto'` uses NumPy when it is installed.
+
+    Every distribution is checked against its field once, and so is
+    the first instance as a whole, which covers the fields that are not
+    sampled. Instances are then created without running `check_sanity`.
+
+    ```python
+    sampler = ConfigSampler(Config, {
+        'learning_rate': LogUniform(1e-5, 1e-1),
+        'optimizer': Choice(['Adam', 'SGD']),
+    }, seed=0)
+    configs = sampler.sample(1000)
+    ```
+    """
+
+    def __init__(
+        self, config_class: type[C],
+        distributions: Mapping[str, Distribution],
+        method: SamplingMethod = 'random', seed: int | None = 0,
+        backend: SamplingBackend = 'auto',
+    ):
+        if method not in ('random', 'lhs', 'halton', 'sobol'):
+            raise ValueError(f'`{method}` is not a sampling method.')
+        if backend == 'auto':
+            backend = 'python' if np is None else 'numpy'
+        if backend == 'numpy' and np is None:
+            raise ImportError('The `numpy` backend requires NumPy.')
+        if backend not in ('numpy', 'python'):
+            raise ValueError(f'`{backend}` is not a sampling backend.')
+
+        schema = config_class._compiled_schema()
+        for name, distribution in distributions.items():
+            if name not in schema.by_name:
+                raise TypeError(
+                    f'`{name}` is not a field of `{config_class.__name__}`.'
+                )
+            distribution.check(schema.by_name[name])
+
+        self.config_class = config_class
+        self.names = tuple(distributions)
+        self.distributions = tuple(distributions.values())
+        self._copied = tuple(
+            schema.by_name[name].kind == 'list' for name in self.names
+        )
+        self.method = method
+        self.backend = backend
+        self.seed = seed
+        self.drawn = 0
+        self._validated = False
+        self._sobol: Any = None
+        self._rng: Any = (
+            random.Random(seed) if backend == 'python'
+            else np.random.default_rng(seed)
+        )
+        # A random shift of the Halton sequence, modulo 1.
+        self._shift: Any = []
+        if method == 'halton':
+            self._shift = (
+                [self._rng.random() for _ in self.names]
+                if backend == 'python' else self._rng.random(len(self.names))
+            )
+
+    def sample_columns(self, n: int) -> dict[str, list[Any]]:
+        """Draw `n` values for every sampled field, as columns."""
+
+        dimensions = len(self.names)
+        if self.backend == 'numpy':
+            uniforms = self._uniform_array(n, dimensions)
+            columns = [
+                distribution.transform_array(uniforms[:, j])
+                for j, distribution in enumerate(self.distributions)
+            ]
+        else:
+            rows = self._uniforms(n, dimensions)
+            columns = [
+                distribution.transform([row[j] for row in rows])
+                for j, distribution in enumerate(self.distributions)
+            ]
+        # `Choice` values of `list` fields would otherwise be shared.
+        columns = [
+            [
+                list(value) if type(value) is list else copy(value)
+                for value in column
+            ] if copied else column
+            for column, copied in zip(columns, self._copied)
+        ]
+        self.drawn += n
+        return dict(zip(self.names, columns))
+
+    def sample(self, n: int) -> list[C]:
+        """Draw the next `n` instances."""
+
+        columns = self.sample_columns(n)
+        names = tuple(columns)
+        rows = zip(*columns.values())
+
+        instances = []
+        if not self._validated:
+            for values in islice(rows, 1):
+                instances.append(self.config_class(**dict(zip(names, values))))
+                self._validated = True
+        create = self.config_class._create_unchecked
+        instances.extend(create(dict(zip(names, values))) for values in rows)
+        return instances
+
+    def batches(self, n: int, batch_size: int = 4096) -> Iterator[list[C]]:
+        """Draw `n` instances, `batch_size` at a time."""
+
+        while n > 0:
+            size = min(n, batch_size)
+            yield self.sample(size)
+            n -= size
+
+    def _uniforms(self, n: int, dimensions: int) -> list[list[float]]:
+        """Draw an `n` by `dimensions` matrix of uniforms in `[0, 1)`."""
+
+        if self.method == 'sobol':
+            return self._uniform_array(n, dimensions).tolist()
+
+        rng: random.Random = self._rng
+        draw = rng.random
+        if self.method == 'lhs':
+            columns = []
+            for _ in range(dimensions):
+                strata = list(range(n))
+                rng.shuffle(strata)
+                columns.append([(s + draw()) / n for s in strata])
+            return [list(row) for row in zip(*columns)]
+        if self.method == 'halton':
+            shift = self._shift
+            bases = _primes(dimensions)
+            return [
+                [
+                    (_radical_inverse(index, base) + offset) % 1.
+                    for base, offset in zip(bases, shift)
+                ]
+                for index in range(self.drawn + 1, self.drawn + n + 1)
+            ]
+        return [[draw() for _ in range(dimensions)] for _ in range(n)]
+
+    def _uniform_array(self, n: int, dimensions: int) -> Any:
+        if self.method == 'sobol':
+            if self._sobol is None:
+                try:
+                    from scipy.stats import qmc
+                except ImportError:
+                    raise ImportError(
+                        'The `sobol` sampling method requires SciPy.'
+                    ) from None
+                self._sobol = qmc.Sobol(
+                    dimensions, scramble=True, seed=self.seed
+                )
+            return np.asarray(self._sobol.random(n))
+
+        rng = self._rng
+        if self.method == 'lhs':
+            strata = rng.permuted(
+                np.tile(np.arange(n), (dimensions, 1)), axis=1
+            ).T
+            return (strata + rng.random((n, dimensions))) / n
+        if self.method == 'halton':
+            indices = np.arange(self.drawn + 1, self.drawn + n + 1)
+            columns = [
+                _radical_inverse_array(indices, base)
+                for base in _primes(dimensions)
+            ]
+            return (np.stack(columns, axis=1) + self._shift) % 1.
+        return rng.random((n, dimensions))
+
+
+def _primes(n: int) -> list[int]:
+    """The first `n` prime numbers, used as Halton bases."""
+
+    primes: list[int] = []
+    candidate = 2
+    while len(primes) < n:
+        if all(candidate % prime for prime in primes):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+def _radical_inverse(index: int, base: int) -> float:
+    result, fraction = 0., 1. / base
+    while index:
+        index, digit = divmod(index, base)
+        result += digit * fraction
+        fraction /= base
+    return result
+
+
+def _radical_inverse_array(indices: Any, base: int) -> Any:
+    result = np.zeros(len(indices))
+    fraction = 1. / base
+    indices = indices.copy()
+    while indices.any():
+        indices, digits = np.divmod(indices, base)
+        result += digits * fraction
+        fraction /= base
+    return result
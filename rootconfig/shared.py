@@ -0,0 +1,155 @@
+"""
+`SharedConfig`: one `RootConfig` instance broadcast through shared memory.
+
+The publishing process writes the binary encoding of the instance
+(see `rootconfig.binary`) into a `multiprocessing.shared_memory` block
+once. The `SharedConfig` object itself pickles as the name of the block,
+so that sending it to hundreds of workers, such as `DataLoader` workers,
+costs the same as sending a short string. Each worker decodes the
+instance from the block on first use, without validation.
+"""
+
+import sys
+from multiprocessing import resource_tracker, shared_memory
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from .rootconfig import RootConfig
+
+C = TypeVar('C', bound='RootConfig')
+
+
+def _tracker_pid() -> int | None:
+    """Return the pid of the resource tracker of this process, if any."""
+
+    return getattr(resource_tracker._resource_tracker, '_pid', None)
+
+
+def _shares_tracker(owner_tracker: int | None) -> bool:
+    """Whether this process reports to the resource tracker of the owner.
+
+    The publisher itself and its `fork` children know the pid of the
+    tracker. `spawn` and `forkserver` children inherit only the file
+    descriptor of their parent's tracker, and no pid, whereas a process
+    that had to start its own tracker to attach knows its pid.
+    """
+
+    tracker = resource_tracker._resource_tracker
+    pid = getattr(tracker, '_pid', None)
+    if pid is not None:
+        return pid == owner_tracker
+    return getattr(tracker, '_fd', None) is not None
+
+
+def _attach(
+    name: str, owner_tracker: int | None,
+) -> shared_memory.SharedMemory:
+    """Attach to an existing block without tracking it.
+
+    Before Python 3.13, attaching registers the block to the resource
+    tracker of the attaching process, which unlinks it when the process
+    exits, even though the publisher still owns it. The registration is
+    withdrawn, unless the tracker is the publisher's own, which
+    processes started by `multiprocessing` share, and in which the block
+    is registered once.
+    """
+
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, track=False)
+    block = shared_memory.SharedMemory(name)
+    if sys.platform != 'win32' and not _shares_tracker(owner_tracker):
+        resource_tracker.unregister(
+            block._name, 'shared_memory'  # type: ignore
+        )
+    return block
+
+
+class SharedConfig(Generic[C]):
+    """A `RootConfig` instance published in shared memory.
+
+    Create it in the publishing process, which owns the block and should
+    `close` it, or use it as a context manager, once the workers are
+    done. Pass it to the workers, and call `get` there.
+
+    ```python
+    with SharedConfig(config) as shared:
+        with Pool(64) as pool:
+            pool.map(work, [shared] * 64)
+
+    def work(shared: SharedConfig[Config]):
+        config = shared.get()
+    ```
+    """
+
+    def __init__(self, config: C):
+        data = config.to_bytes()
+        self.config_class: type[C] = type(config)
+        self.size = len(data)
+        self._block: shared_memory.SharedMemory | None = (
+            shared_memory.SharedMemory(create=True, size=max(self.size, 1))
+        )
+        self._block.buf[:self.size] = data
+        self.name = self._block.name
+        self._tracker = _tracker_pid()
+        self._owner = True
+        self._config: C | None = config
+
+    @classmethod
+    def attach(
+        cls, config_class: type[C], name: str, size: int,
+        tracker: int | None = None,
+    ):
+        """Refer to a block published by another process.
+
+        `tracker` is the pid of the resource tracker of the publisher.
+        """
+
+        shared = cls.__new__(cls)
+        shared.config_class = config_class
+        shared.name = name
+        shared.size = size
+        shared._tracker = tracker
+        shared._block = None
+        shared._owner = False
+        shared._config = None
+        return shared
+
+    def get(self) -> C:
+        """Return the instance, decoded from the block on first use."""
+
+        if self._config is None:
+            block = _attach(self.name, self._tracker)
+            try:
+                with block.buf[:self.size] as data:
+                    self._config = self.config_class.from_bytes(
+                        data, validate='none'
+                    )
+            finally:
+                block.close()
+        return self._config
+
+    def close(self):
+        """Release the block, and remove it if this process owns it."""
+
+        if self._block is not None:
+            self._block.close()
+            if self._owner:
+                self._block.unlink()
+            self._block = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __reduce__(self):
+        return type(self).attach, (
+            self.config_class, self.name, self.size, self._tracker,
+        )
+
+    def __repr__(self):
+        return (
+            f'{type(self).__name__}({self.config_class.__name__}, '
+            f'name={self.name!r}, size={self.size})'
+        )
@@ -0,0 +1,241 @@
+"""
+`run_sweep`: a resumable, parallel sweep over `RootConfig` instances.
+
+Each config is run by `fn` in a process or thread pool, and its outcome
+is appended to a JSON Lines results file as one record:
+
+```json
+{"fingerprint": "...", "config": {...}, "result": ..., "error": null}
+```
+
+The fingerprints of the successful records are also kept in an SQLite
+index next to the results file, so that a restarted sweep skips them
+without reading the results file again. The index remembers how much of
+the results file it covers. On start, only the records written after
+that, such as those of an interrupted sweep, are read and indexed, and a
+partially written last record is cut off.
+
+Configs are consumed lazily, with at most `max_pending` of them in
+flight, so that memory use does not grow with the size of the sweep.
+"""
+
+import json
+import os
+import sqlite3
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import (TYPE_CHECKING, Any, Callable, Iterable, Iterator,
+                    NamedTuple, TypeVar)
+
+from .bulk import ExecutorKind, _make_executor
+from .rootconfig import RootConfigJSONEncoder
+
+if TYPE_CHECKING:
+    from .rootconfig import RootConfig
+
+C = TypeVar('C', bound='RootConfig')
+
+_COMMIT_INTERVAL = 64
+
+
+class SweepSummary(NamedTuple):
+    """The number of configs of each outcome of `run_sweep`."""
+
+    completed: int
+    skipped: int
+    failed: int
+
+
+class SweepRecord(NamedTuple):
+    """One record of a results file, see `iter_sweep_results`."""
+
+    fingerprint: str
+    config: Any
+    result: Any
+    error: str | None
+
+
+def _run_one(
+    fn: Callable[[Any], Any], config: 'RootConfig', fingerprint: str,
+) -> tuple[str, bool]:
+    """Run `fn` and encode its record, in the worker."""
+
+    try:
+        result, error = fn(config), None
+    except Exception as e:
+        result, error = None, f'{type(e).__name__}: {e}'
+    record = {
+        'fingerprint': fingerprint, 'config': config.to_dict(copy='none'),
+        'result': result, 'error': error,
+    }
+    encoder = RootConfigJSONEncoder(ensure_ascii=False)
+    try:
+        line = encoder.encode(record)
+    except (TypeError, ValueError) as e:
+        record['result'] = None
+        record['error'] = error = f'{type(e).__name__}: {e}'
+        line = encoder.encode(record)
+    return line, error is None
+
+
+class _DoneIndex:
+    """The fingerprints of the successful records of a results file."""
+
+    def __init__(self, index_path: str, results_path: str):
+        self.results_path = results_path
+        self.connection = sqlite3.connect(index_path)
+        with self.connection as connection:
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS done '
+                '(fingerprint TEXT PRIMARY KEY)'
+            )
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS meta '
+                '(key TEXT PRIMARY KEY, value INTEGER)'
+            )
+
+    def covered(self) -> int:
+        row = self.connection.execute(
+            "SELECT value FROM meta WHERE key = 'covered'"
+        ).fetchone()
+        return 0 if row is None else row[0]
+
+    def set_covered(self, covered: int):
+        self.connection.execute(
+            "INSERT OR REPLACE INTO meta VALUES ('covered', ?)", (covered,)
+        )
+
+    def add(self, fingerprint: str, covered: int):
+        self.connection.execute(
+            'INSERT OR IGNORE INTO done VALUES (?)', (fingerprint,)
+        )
+        self.set_covered(covered)
+
+    def __contains__(self, fingerprint: str) -> bool:
+        return self.connection.execute(
+            'SELECT 1 FROM done WHERE fingerprint = ?', (fingerprint,)
+        ).fetchone() is not None
+
+    def catch_up(self):
+        """Index the records written after the covered part of the file."""
+
+        try:
+            size = os.path.getsize(self.results_path)
+        except FileNotFoundError:
+            size = 0
+        covered = self.covered()
+        with self.connection as connection:
+            if covered > size:  # The results file was replaced.
+                connection.execute('DELETE FROM done')
+                covered = 0
+            if covered == size:
+                self.set_covered(covered)
+                return
+            with open(self.results_path, 'rb+') as f:
+                f.seek(covered)
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        f.truncate(covered)
+                        break
+                    covered += len(line)
+                    record = json.loads(line)
+                    if record.get('error') is None:
+                        self.add(record['fingerprint'], covered)
+                self.set_covered(covered)
+
+    def close(self):
+        self.connection.commit()
+        self.connection.close()
+
+
+def run_sweep(
+    fn: Callable[[C], Any], configs: Iterable[C],
+    results_path: os.PathLike | str, workers: int | None = None,
+    executor: ExecutorKind = 'process', max_pending: int | None = None,
+    index_path: os.PathLike | str | None = None,
+) -> SweepSummary:
+    """Run `fn` on every config that has no successful result yet.
+
+    `fn` and the configs must be picklable for the `process` executor,
+    and the results of `fn` must be JSON-serializable by
+    `RootConfigJSONEncoder`. An exception raised by `fn`, or a result
+    that cannot be serialized, is recorded as the `error` of the record,
+    and the config is run again by the next sweep.
+
+    At most `max_pending` configs, twice the number of workers by
+    default, are submitted at a time. The index is `<results_path>.index`
+    unless `index_path` is given. Return the number of completed,
+    skipped, and failed configs.
+    """
+
+    results_path = os.fspath(results_path)
+    index = _DoneIndex(
+        os.fspath(index_path) if index_path is not None
+        else results_path + '.index',
+        results_path,
+    )
+    completed = skipped = failed = 0
+    try:
+        index.catch_up()
+        pool = _make_executor(executor, workers)
+        if max_pending is None:
+            max_pending = 2 * (getattr(pool, '_max_workers', None) or 1)
+        pending: dict[Future[tuple[str, bool]], str] = dict()
+        in_flight: set[str] = set()
+
+        with pool, open(results_path, 'ab') as results:
+            covered = results.tell()
+
+            def drain():
+                nonlocal completed, failed, covered
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    fingerprint = pending.pop(future)
+                    in_flight.discard(fingerprint)
+                    line, ok = future.result()
+                    data = line.encode() + b'\n'
+                    results.write(data)
+                    covered += len(data)
+                    if ok:
+                        completed += 1
+                        index.add(fingerprint, covered)
+                    else:
+                        failed += 1
+                        index.set_covered(covered)
+                    if (completed + failed) % _COMMIT_INTERVAL == 0:
+                        results.flush()
+                        index.connection.commit()
+
+            for config in configs:
+                fingerprint = config.fingerprint()
+                if fingerprint in in_flight or fingerprint in index:
+                    skipped += 1
+                    continue
+                if len(pending) >= max_pending:
+                    drain()
+                pending[pool.submit(_run_one, fn, config, fingerprint)] = (
+                    fingerprint
+                )
+                in_flight.add(fingerprint)
+            while pending:
+                drain()
+            results.flush()
+    finally:
+        index.close()
+    return SweepSummary(completed, skipped, failed)
+
+
+def iter_sweep_results(
+    config_class: type[C], results_path: os.PathLike | str,
+) -> Iterator[SweepRecord]:
+    """Lazily read the records of a results file, decoding the configs."""
+
+    with open(results_path, 'rb') as f:
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            record = json.loads(line)
+            yield SweepRecord(
+                record['fingerprint'],
+                config_class._from_json_object(record['config'], 'none'),
+                record['result'], record['error'],
+            )
@@ -0,0 +1,202 @@
+"""
+Reloading `RootConfig` JSON files only when they change.
+
+The version of a file is its `(st_mtime_ns, st_size)`. A file is only
+read and validated again once its version changes, either through the
+process-wide `json_file_cache` behind `RootConfig.from_json(cached=True)`,
+or by polling with a `ConfigWatcher`.
+
+A file modified while it is being read is not trusted to match its
+version, so that it is read again next time.
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Generic, Iterator, TypeVar
+
+from .rootconfig import root_config_json_decode_object_hook
+
+if TYPE_CHECKING:
+    from .rootconfig import RootConfig, ValidationLevel
+
+C = TypeVar('C', bound='RootConfig')
+
+Version = tuple[int, int]
+
+
+def _version(stat: os.stat_result) -> Version:
+    return stat.st_mtime_ns, stat.st_size
+
+
+def load_versioned(
+    config_class: type[C], json_file: os.PathLike | str,
+    validate: 'ValidationLevel | None' = None,
+) -> tuple[Version | None, C]:
+    """Create an instance from a JSON file, like `from_json`.
+
+    Also return the version of the file that was read, or `None` if the
+    file changed while it was being read.
+    """
+
+    with open(json_file, 'r') as f:
+        version = _version(os.fstat(f.fileno()))
+        data = json.load(f, object_hook=root_config_json_decode_object_hook)
+    config = config_class._from_json_object(data, validate, hooked=True)
+    try:
+        if _version(os.stat(json_file)) != version:
+            return None, config
+    except OSError:
+        return None, config
+    return version, config
+
+
+class JSONFileCache:
+    """A thread-safe LRU cache of instances loaded from JSON files.
+
+    Entries are keyed by the class, the real path of the file, and the
+    validation level, and are valid as long as the file keeps its
+    version. At most `maxsize` entries are kept.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        if maxsize < 0:
+            raise ValueError(
+                f'`maxsize` should not be negative, but got {maxsize}.'
+            )
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Any, tuple[Version, 'RootConfig']] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def load(
+        self, config_class: type[C], json_file: os.PathLike | str,
+        validate: 'ValidationLevel | None' = None,
+    ) -> C:
+        """Return the cached instance, or load the file if it changed.
+
+        The same instance is returned until the file changes, so it
+        should not be mutated. Use `evolve` to derive variants.
+        """
+
+        level = config_class._effective_validation(validate)
+        path = os.path.realpath(json_file)
+        key = (config_class, path, level)
+        version = _version(os.stat(path))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]  # type: ignore
+            self.misses += 1
+
+        loaded_version, config = load_versioned(config_class, path, level)
+        if loaded_version is not None and self.maxsize:
+            with self._lock:
+                self._entries[key] = (loaded_version, config)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return config
+
+    def clear(self):
+        """Remove all entries."""
+
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return the `hits` and `misses` counters and the `size`."""
+
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self)}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f'{type(self).__name__}(maxsize={self.maxsize})'
+
+
+json_file_cache = JSONFileCache()
+"""The cache of `RootConfig.from_json(cached=True)`."""
+
+
+class ConfigWatcher(Generic[C]):
+    """Poll a JSON file for a new instance whenever its content changes.
+
+    The file is loaded once when the watcher is created, which raises
+    any error. Afterwards, `config` is always the last good instance:
+    a reload that fails leaves it untouched, and its error is kept in
+    `error` until a reload succeeds. A failed version is not retried.
+
+    ```python
+    watcher = Config.watch_json('config.json', interval=5.)
+    for config in watcher:  # blocks, call `watcher.stop()` to end
+        apply(config)
+    ```
+    """
+
+    def __init__(
+        self, config_class: type[C], json_file: os.PathLike | str,
+        interval: float = 1., validate: 'ValidationLevel | None' = None,
+    ):
+        self.config_class = config_class
+        self.json_file = json_file
+        self.interval = interval
+        self.validate = validate
+        self.error: Exception | None = None
+        self._seen, self.config = load_versioned(
+            config_class, json_file, validate
+        )
+        self._stopped = threading.Event()
+
+    def poll(self) -> C | None:
+        """Reload the file if its version changed.
+
+        Return the new instance if it differs from `config`, or `None`.
+        """
+
+        try:
+            version = _version(os.stat(self.json_file))
+        except OSError as e:
+            self.error = e
+            return None
+        if version == self._seen:
+            return None
+        try:
+            self._seen, config = load_versioned(
+                self.config_class, self.json_file, self.validate
+            )
+        except (OSError, TypeError, ValueError) as e:
+            self._seen = version
+            self.error = e
+            return None
+        self.error = None
+        if config == self.config:
+            return None
+        self.config = config
+        return config
+
+    def __iter__(self) -> Iterator[C]:
+        """Poll every `interval` seconds, yielding new instances."""
+
+        while not self._stopped.wait(self.interval):
+            config = self.poll()
+            if config is not None:
+                yield config
+
+    def stop(self):
+        """End the iteration, from any thread."""
+
+        self._stopped.set()
+
+    def __repr__(self):
+        return (
+            f'{type(self).__name__}({self.config_class.__name__}, '
+            f'{os.fspath(self.json_file)!r}, interval={self.interval})'
+        )
@@ -0,0 +1,118 @@
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from fractions import Fraction
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Literal
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+from rootconfig import RootConfig
+
+
+@dataclass
+class Config(RootConfig):
+    epoch: int
+    optimizer: Literal['Adam', 'SGD'] = 'Adam'
+    ratios: list[Fraction] = field(default_factory=lambda: [Fraction(1, 3)])
+    schedule: list[float] = field(default_factory=list)
+
+
+class AsyncIOTest(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.path = Path(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    async def test_round_trip(self):
+        config = Config(1, 'SGD')
+        await config.ato_json(self.path / 'config.json')
+        self.assertEqual(
+            await Config.afrom_json(self.path / 'config.json'), config,
+            'Should import and export JSON files.'
+        )
+
+        configs = [Config(i) for i in range(20)]
+        paths = [self.path / f'{i}.json' for i in range(20)]
+        await Config.ato_json_many(zip(configs, paths), limit=4)
+        self.assertEqual(
+            await Config.afrom_json_many(paths, limit=4), configs,
+            'Should import and export JSON files in order.'
+        )
+
+        paths[1].write_text(json.dumps({'epoch': 1.5}))
+        with self.assertRaises(TypeError, msg='Should raise errors.'):
+            await Config.afrom_json_many(paths)
+        results = await Config.afrom_json_many(
+            paths[:3], return_exceptions=True
+        )
+        self.assertEqual(
+            [type(result) for result in results], [Config, TypeError, Config],
+            'Should return errors in place.'
+        )
+        with self.assertRaises(ValueError, msg='Should check the limit.'):
+            await Config.afrom_json_many(paths, limit=0)
+
+    async def test_responsiveness(self):
+        paths = [self.path / f'{i}.json' for i in range(100)]
+        await Config.ato_json_many(
+            (Config(i, schedule=[0.1] * 20000), path)
+            for i, path in enumerate(paths)
+        )
+
+        gaps = []
+        done = asyncio.Event()
+
+        async def tick():
+            last = time.perf_counter()
+            while not done.is_set():
+                await asyncio.sleep(0.001)
+                now = time.perf_counter()
+                gaps.append(now - last)
+                last = now
+
+        ticker = asyncio.create_task(tick())
+        await asyncio.sleep(0)
+        start = time.perf_counter()
+        await Config.afrom_json_many(paths, limit=8)
+        elapsed = time.perf_counter() - start
+        done.set()
+        await ticker
+        self.assertGreater(
+            len(gaps), 5, 'The event loop should keep running.'
+        )
+        self.assertLess(
+            max(gaps), max(0.1, elapsed / 4),
+            'The event loop should never stall for long.'
+        )
+
+    async def test_cancellation(self):
+        paths = [self.path / f'{i}.json' for i in range(50)]
+        for path in paths:
+            Config(1).to_json(path)
+        calls = []
+        from_json = Config.from_json
+
+        def slow_from_json(json_file, validate=None):
+            calls.append(json_file)
+            time.sleep(0.02)
+            return from_json(json_file, validate)
+
+        with patch.object(Config, 'from_json', slow_from_json):
+            task = asyncio.create_task(
+                Config.afrom_json_many(paths, limit=2)
+            )
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            started = len(calls)
+            await asyncio.sleep(0.1)
+        self.assertLess(started, len(paths), 'Should stop early.')
+        self.assertEqual(
+            len(calls), started, 'Should not start files after cancelling.'
+        )
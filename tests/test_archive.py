@@ -0,0 +1,134 @@
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from rootconfig import RootConfig
+from rootconfig.archive import _RECORD, ConfigArchive
+
+
+@dataclass
+class Config(RootConfig):
+    seed: int
+    learning_rate: float = 1e-3
+    output_path: Path = Path('outputs')
+    layers: list[int] = field(default_factory=lambda: [64] * 32)
+
+
+class ArchiveTest(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'configs.rcar')
+        self.configs = [Config(seed) for seed in range(5)]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_add_and_get(self):
+        for compression in (None, 'zlib', 'lzma'):
+            path = f'{self.path}.{compression}'
+            with ConfigArchive(Config, path, compression) as archive:
+                digests = archive.add_many(self.configs + self.configs)
+                self.assertEqual(
+                    len(archive), 5, 'Should store each config once.'
+                )
+                self.assertEqual(
+                    digests[:5], [config.fingerprint()
+                                  for config in self.configs]
+                )
+                self.assertEqual(digests[5:], digests[:5])
+                self.assertEqual(archive[digests[2]], self.configs[2])
+                self.assertEqual(
+                    archive.add(Config(5)), Config(5).fingerprint()
+                )
+                self.assertEqual(
+                    archive.get(Config(5).fingerprint()), Config(5),
+                    'Should read configs added after mapping the file.'
+                )
+                self.assertIn(digests[0], archive)
+                self.assertNotIn('00' * 32, archive)
+                self.assertNotIn('not a digest', archive)
+                with self.assertRaises(KeyError):
+                    archive['00' * 32]
+            if compression is not None:
+                self.assertLess(
+                    os.path.getsize(path),
+                    os.path.getsize(f'{self.path}.None'),
+                    'Should compress.'
+                )
+
+        with self.assertRaises(ValueError, msg='Should check compression.'):
+            ConfigArchive(Config, self.path, 'gzip')  # type: ignore
+
+    def test_reopen(self):
+        with ConfigArchive(Config, self.path, 'zlib') as archive:
+            digests = archive.add_many(self.configs)
+        with ConfigArchive(Config, self.path, readonly=True) as archive:
+            self.assertEqual(list(archive), digests, 'Should keep the order.')
+            self.assertEqual(
+                [config for _, config in archive.items()], self.configs
+            )
+            with self.assertRaises(ValueError, msg='Should be read-only.'):
+                archive.add(Config(5))
+        with ConfigArchive(Config, self.path) as archive:
+            self.assertEqual(
+                archive.add(self.configs[0]), digests[0],
+                'Should deduplicate across sessions.'
+            )
+            self.assertEqual(len(archive), 5)
+
+        with open(self.path + '.index', 'wb') as f:
+            f.write(b'RCFG\x01\x00\x00\x00')
+        with self.assertRaises(ValueError, msg='Should check the magic.'):
+            ConfigArchive(Config, self.path)
+
+    def test_recovery(self):
+        with ConfigArchive(Config, self.path) as archive:
+            digests = archive.add_many(self.configs)
+        os.remove(self.path + '.index')
+        with ConfigArchive(Config, self.path, readonly=True) as archive:
+            self.assertEqual(
+                list(archive), digests, 'Should scan without an index.'
+            )
+        with open(self.path, 'ab') as f:
+            f.write(_RECORD.pack(b'\x01' * 32, 0, 100) + b'\x00' * 10)
+        with ConfigArchive(Config, self.path) as archive:
+            self.assertEqual(list(archive), digests, 'Should rebuild.')
+            archive.add(Config(5))
+            self.assertEqual(archive[Config(5).fingerprint()], Config(5))
+        with ConfigArchive(Config, self.path) as archive:
+            self.assertEqual(len(archive), 6, 'Should cut partial records.')
+
+        with ConfigArchive(Config, self.path) as archive:
+            archive.compact([])
+        with open(self.path + '.index', 'wb') as f:
+            f.write(b'RCAI\x01\x00\x00\x00' + b'\x01' * 40)
+        with ConfigArchive(Config, self.path) as archive:
+            self.assertEqual(
+                len(archive), 0, 'Should drop a mismatching index.'
+            )
+
+    def test_compact(self):
+        with ConfigArchive(Config, self.path) as archive:
+            digests = archive.add_many(self.configs)
+            size = os.path.getsize(self.path)
+            self.assertEqual(
+                archive.compact([digests[3], digests[1], 'unknown']), 3
+            )
+            self.assertEqual(list(archive), [digests[1], digests[3]])
+            self.assertEqual(archive[digests[3]], self.configs[3])
+            self.assertLess(os.path.getsize(self.path), size)
+            archive.add(self.configs[0])
+            archive.close()
+        with ConfigArchive(Config, self.path) as archive:
+            self.assertEqual(
+                list(archive), [digests[1], digests[3], digests[0]],
+                'Should flush on closing.'
+            )
+        archive.close()  # Closing again does nothing.
+        self.assertFalse(
+            any(name.endswith('.compact')
+                for name in os.listdir(self.directory.name)),
+            'Should not leave temporary files.'
+        )
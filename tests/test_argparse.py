@@ -1,4 +1,4 @@
-from argparse import ArgumentError
+from argparse import SUPPRESS, ArgumentError
 from dataclasses import dataclass, field
 from decimal import Decimal
 from fractions import Fraction
@@ -75,9 +75,9 @@ class ArgumentParsingTest(TestCase):
                     arg_options['type'], Fraction,
                     'Should have correct types.'
                 )
-                self.assertEqual(
-                    arg_options['default'], [Fraction('1/3')],
-                    'Should have correct default values.'
+                self.assertIs(
+                    arg_options['default'], SUPPRESS,
+                    '`default_factory` should not be called when forging.'
                 )
             elif arg_name == '--model-version':
                 count += 1
@@ -281,3 +281,73 @@ class ArgumentParsingTest(TestCase):
             'Provided values should override default values, '
             'including `lists.'
         )
+
+    def test_cached_parser(self):
+        factory_calls = []
+
+        def make_ratios():
+            factory_calls.append(None)
+            return [Fraction(1, 2)]
+
+        @dataclass
+        class FactoryConfig(RootConfig):
+            epoch: int
+            ratios: list[Fraction] = field(default_factory=make_ratios)
+
+        parser = FactoryConfig.cached_parser()
+        self.assertIs(
+            FactoryConfig.cached_parser(), parser,
+            'The default parser should be forged once per class.'
+        )
+        self.assertEqual(
+            len(factory_calls), 0,
+            'Forging should not call `default_factory`.'
+        )
+
+        config1 = FactoryConfig.parse_args(['--epoch', '1'])
+        config2 = FactoryConfig.parse_args(['--epoch', '2'])
+        self.assertEqual(
+            config1.ratios, [Fraction(1, 2)],
+            '`default_factory` should be used when no value is provided.'
+        )
+        self.assertIsNot(
+            config1.ratios, config2.ratios,
+            'Parsed configs should not share default values.'
+        )
+        config3 = FactoryConfig.parse_args(['--epoch', '3', '--ratios', '1'])
+        self.assertEqual(
+            config3.ratios, [Fraction(1)],
+            'Provided values should override default values.'
+        )
+        self.assertEqual(
+            len(factory_calls), 2,
+            '`default_factory` should only be called when needed.'
+        )
+
+        FactoryConfig.clear_cache()
+        self.assertIsNot(
+            FactoryConfig.cached_parser(), parser,
+            'Clearing the cache should forge a new parser.'
+        )
+
+    def test_parse_bool_literals(self):
+        @dataclass
+        class LiteralConfig(RootConfig):
+            flag: Literal[True, False] = True
+
+        self.assertIs(
+            LiteralConfig.parse_args(['--flag', 'False']).flag, False,
+            '`bool` literals should parse `False` like `bool` fields.'
+        )
+        self.assertIs(
+            LiteralConfig.parse_args(['--flag', 'True']).flag, True
+        )
+        self.assertIs(
+            LiteralConfig.forge_parser().parse_args(['--flag', 'False']).flag,
+            False,
+            'The `ArgumentParser` should parse `bool` literals too.'
+        )
+        with self.assertRaises(
+            SystemExit, msg='Should reject other `bool` literal values.'
+        ):
+            LiteralConfig.parse_args(['--flag', 'yes'])
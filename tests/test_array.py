@@ -0,0 +1,246 @@
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from typing import Any
+from unittest import TestCase, skipUnless
+
+from rootconfig import RootConfig
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class FakeNDArray:
+    """A minimal stand-in for a one-dimensional NumPy array."""
+
+    chars = {'b': '?', 'i': 'q', 'u': 'Q', 'f': 'd'}
+
+    def __init__(self, values: list[Any], kind: str):
+        self.values = values
+        self.ndim = 1
+        self.dtype = SimpleNamespace(
+            kind=kind, char=self.chars[kind], isnative=True
+        )
+
+    def __eq__(self, other):
+        raise ValueError('The truth value of an array is ambiguous.')
+
+    __hash__ = None  # type: ignore
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __getitem__(self, index):
+        return FakeNDArray(self.values[index], self.dtype.kind)
+
+    def tolist(self):
+        return list(self.values)
+
+    def astype(self, typecode: str):
+        return array(typecode, self.values)
+
+    def tobytes(self):
+        return array(self.dtype.char, self.values).tobytes()
+
+
+@dataclass
+class Config(RootConfig):
+    steps: list[int] = field(default_factory=list)
+    schedule: list[float] = field(default_factory=list)
+    masks: list[bool] = field(default_factory=list)
+
+
+@dataclass
+class ArrayConfig(RootConfig):
+    steps: list[int] = field(
+        default_factory=list, metadata={'storage': 'array'}
+    )
+    schedule: list[float] = field(
+        default_factory=lambda: [0.5], metadata={'storage': 'array'}
+    )
+
+
+class ArrayTest(TestCase):
+    def test_typed_arrays(self):
+        config = Config(
+            array('i', [1, 2]), array('d', [0.5]),
+            FakeNDArray([True], 'b'),  # type: ignore
+        )
+        self.assertEqual(
+            config.to_dict(copy='shallow')['steps'], array('i', [1, 2]),
+            'Should copy arrays as arrays.'
+        )
+        self.assertEqual(
+            config.masks, [True],
+            'Should copy NumPy arrays without a typecode to lists.'
+        )
+        config_with_numpy = Config(
+            FakeNDArray([1, 2], 'i'), FakeNDArray([0.5], 'f'),  # type: ignore
+        )
+        self.assertEqual(
+            (config_with_numpy.steps, config_with_numpy.schedule),
+            (array('q', [1, 2]), array('d', [0.5])),
+            'Should copy NumPy arrays to arrays.'
+        )
+        self.assertEqual(
+            config_with_numpy, Config(array('q', [1, 2]), array('d', [0.5])),
+            'Should compare instances created from NumPy arrays.'
+        )
+        self.assertEqual(
+            config_with_numpy.evolve(
+                masks=FakeNDArray([False], 'b')  # type: ignore
+            ).masks,
+            [False],
+            'Should copy changed NumPy arrays.'
+        )
+
+        invalid_values = [
+            {'steps': array('d', [1.])},
+            {'schedule': array('q', [1])},
+            {'masks': array('b', [1])},
+            {'schedule': FakeNDArray([1], 'i')},
+            {'steps': FakeNDArray([1.], 'f')},
+        ]
+        for values in invalid_values:
+            with self.assertRaises(
+                TypeError, msg=f'Should reject {values}.'
+            ):
+                Config(**values)
+
+        configs = Config.from_records([
+            {'steps': [1]}, {'steps': array('q', [2])},
+        ])
+        self.assertEqual(
+            configs[1].steps, array('q', [2]),
+            'Should accept arrays in records.'
+        )
+        with self.assertRaises(TypeError, msg='Should check records.'):
+            Config.from_records([{'steps': [1]}, {'steps': array('d')}])
+
+        with TemporaryDirectory() as directory:
+            json_file = Path(directory) / 'config.json'
+            config.to_json(json_file)
+            self.assertEqual(
+                Config.from_json(json_file),
+                Config([1, 2], [0.5], [True]),
+                'Should export arrays to JSON.'
+            )
+        self.assertEqual(
+            config.fingerprint(), Config([1, 2], [0.5], [True]).fingerprint(),
+            'Arrays and lists should share fingerprints.'
+        )
+        self.assertEqual(
+            Config.from_bytes(config.to_bytes()),
+            Config([1, 2], [0.5], [True]),
+            'Should export arrays to the binary format.'
+        )
+
+    def test_array_storage(self):
+        config = ArrayConfig([1, 2])
+        self.assertEqual(
+            (config.steps, config.schedule),
+            (array('q', [1, 2]), array('d', [0.5])),
+            'Should store lists as arrays.'
+        )
+        steps = array('q', [3])
+        self.assertIs(
+            ArrayConfig(steps).steps, steps,
+            'Should not copy arrays of the storage typecode.'
+        )
+        self.assertEqual(
+            ArrayConfig(array('i', [3])).steps, steps,
+            'Should convert other arrays.'
+        )
+        self.assertEqual(
+            ArrayConfig(FakeNDArray([3], 'i')).steps,  # type: ignore
+            steps,
+            'Should convert NumPy-like arrays.'
+        )
+
+        with self.assertRaises(TypeError, msg='Should check lists.'):
+            ArrayConfig([1.5])  # type: ignore
+        with self.assertRaises(TypeError, msg='Should check lists.'):
+            ArrayConfig(schedule=[1])  # type: ignore
+        with self.assertRaises(
+            TypeError, msg='Should check lists even without validation.'
+        ):
+            ArrayConfig._create_unchecked({'steps': [True, 'a']})
+        with self.assertRaisesRegex(
+            ValueError, '^`steps` ',
+            msg='Should name the field that does not fit its array.'
+        ):
+            ArrayConfig([2 ** 63])
+        with self.assertRaisesRegex(ValueError, '^`steps` '):
+            config.evolve(steps=[-2 ** 64])
+
+        self.assertEqual(
+            ArrayConfig.parse_args(['--steps', '1', '2']), config,
+            'Should parse arguments.'
+        )
+        self.assertEqual(
+            ArrayConfig.parse_args(['--steps', '1', '2'], engine='fast'),
+            config,
+            'Should parse arguments.'
+        )
+        with TemporaryDirectory() as directory:
+            json_file = Path(directory) / 'config.json'
+            config.to_json(json_file)
+            self.assertEqual(
+                ArrayConfig.from_json(json_file), config,
+                'Should import and export JSON files.'
+            )
+        self.assertEqual(
+            ArrayConfig.from_bytes(config.to_bytes()), config,
+            'Should import and export the binary format.'
+        )
+        self.assertEqual(
+            list(ArrayConfig.grid(steps=[[1], [2]])),
+            [ArrayConfig([1]), ArrayConfig([2])],
+            'Should create grids.'
+        )
+
+        with self.assertRaises(
+            TypeError, msg='Should only store numeric lists as arrays.'
+        ):
+            @dataclass
+            class InvalidConfig(RootConfig):
+                masks: list[bool] = field(
+                    default_factory=list, metadata={'storage': 'array'}
+                )
+            InvalidConfig()
+
+    @skipUnless(np, 'NumPy is not installed.')
+    def test_numpy(self):
+        config = Config(
+            np.arange(3), np.linspace(0, 1, 5), np.array([True, False]),
+        )
+        self.assertEqual(
+            config.to_dict(copy='none')['steps'].tolist(), [0, 1, 2],
+            'Should accept NumPy arrays.'
+        )
+        with self.assertRaises(TypeError, msg='Should check the dtype.'):
+            Config(np.linspace(0, 1, 5))
+        with self.assertRaises(TypeError, msg='Should be one-dimensional.'):
+            Config(np.zeros((2, 2), dtype=int))
+        self.assertEqual(
+            config,
+            Config(
+                np.arange(3), np.linspace(0, 1, 5), np.array([True, False])
+            ),
+            'Should compare instances created from NumPy arrays.'
+        )
+        self.assertEqual(
+            Config(np.arange(3, dtype='>i8')).steps, [0, 1, 2],
+            'Should copy non-native byte orders to lists.'
+        )
+        self.assertEqual(
+            ArrayConfig(np.arange(3)).steps, array('q', [0, 1, 2]),
+            'Should convert NumPy arrays.'
+        )
@@ -0,0 +1,117 @@
+import math
+from array import array
+from dataclasses import dataclass, field
+from decimal import Decimal
+from fractions import Fraction
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Literal
+from unittest import TestCase
+from unittest.mock import patch
+
+from rootconfig import RootConfig
+from rootconfig.binary import _Reader
+
+
+@dataclass
+class Config(RootConfig):
+    epoch: int = 10 ** 30
+    learning_rate: float = math.inf
+    margin: Decimal = Decimal('-0.500')
+    ratio: Fraction = Fraction(-2, 3)
+    pole: complex = complex(math.nan, -math.inf)
+    path: Path = Path('data/train')
+    name: str = 'ユニコード'
+    optimizer: Literal['Adam', 'SGD'] = 'SGD'
+    debug: bool = True
+    schedule: list[float] = field(
+        default_factory=lambda: [0.1, -0., math.inf, -math.inf]
+    )
+    steps: list[int] = field(default_factory=lambda: [1, -2, 2 ** 63 - 1])
+    big_steps: list[int] = field(default_factory=lambda: [1, 2 ** 64])
+    flags: list[bool] = field(default_factory=lambda: [True, False, True])
+    ratios: list[Fraction] = field(
+        default_factory=lambda: [Fraction(1, 3), Fraction(5)]
+    )
+    paths: list[Path] = field(default_factory=list)
+
+
+class BinaryTest(TestCase):
+    def assertSameValues(self, decoded: Config, config: Config):
+        for name in Config._compiled_schema().names:
+            value = getattr(config, name)
+            decoded_value = getattr(decoded, name)
+            self.assertEqual(
+                repr(decoded_value), repr(value),
+                f'`{name}` should round-trip exactly.'
+            )
+            self.assertIs(
+                type(decoded_value), type(value),
+                f'`{name}` should keep its type.'
+            )
+
+    def test_round_trip(self):
+        config = Config()
+        data = config.to_bytes()
+        self.assertTrue(data.startswith(b'RCFG'), 'Should start with magic.')
+        self.assertEqual(len(data) % 8, 0, 'Should be aligned to 8 bytes.')
+        self.assertSameValues(Config.from_bytes(data), config)
+        self.assertSameValues(Config.from_bytes(bytearray(data)), config)
+
+        config = Config(schedule=[float(i) for i in range(1000)])
+        self.assertSameValues(Config.from_bytes(config.to_bytes()), config)
+        self.assertLess(
+            len(config.to_bytes()), 8 * 1000 + 1024,
+            'Should pack `float` lists.'
+        )
+
+        with TemporaryDirectory() as directory:
+            binary_file = Path(directory) / 'config.rcfg'
+            config.to_binary(binary_file)
+            self.assertSameValues(Config.from_binary(binary_file), config)
+
+    def test_invalid_data(self):
+        data = Config().to_bytes()
+        with self.assertRaises(ValueError, msg='Should check the magic.'):
+            Config.from_bytes(b'JSON' + data[4:])
+        with self.assertRaises(ValueError, msg='Should check the version.'):
+            Config.from_bytes(data[:4] + b'\xff' + data[5:])
+        with self.assertRaises(ValueError, msg='Should detect truncation.'):
+            Config.from_bytes(data[:-8])
+        with self.assertRaises(ValueError, msg='Should detect truncation.'):
+            Config.from_bytes(data[:6])
+
+        @dataclass
+        class IntConfig(RootConfig):
+            path: int
+
+        with self.assertRaises(TypeError, msg='Should check types.'):
+            IntConfig.from_bytes(data)
+
+    def test_array_storage(self):
+        @dataclass
+        class ArrayConfig(RootConfig):
+            schedule: list[float] = field(
+                default_factory=lambda: [0.5] * 100,
+                metadata={'storage': 'array'},
+            )
+            steps: list[int] = field(
+                default_factory=lambda: [1, 2 ** 63 - 1],
+                metadata={'storage': 'array'},
+            )
+
+        config = ArrayConfig()
+        data = config.to_bytes()
+        with patch.object(
+            _Reader, 'array', side_effect=AssertionError
+        ), TemporaryDirectory() as directory:
+            decoded = ArrayConfig.from_bytes(data)
+            binary_file = Path(directory) / 'config.rcfg'
+            config.to_binary(binary_file)
+            from_file = ArrayConfig.from_binary(binary_file)
+        for instance in (decoded, from_file):
+            self.assertEqual(
+                instance.schedule, array('d', [0.5] * 100),
+                'Should decode packed arrays straight into arrays.'
+            )
+            self.assertEqual(instance.steps, array('q', [1, 2 ** 63 - 1]))
@@ -0,0 +1,86 @@
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Literal
+from unittest import TestCase
+
+from rootconfig import RootConfig
+from rootconfig.bulk import LoadResult
+
+
+@dataclass
+class Config(RootConfig):
+    epoch: int
+    optimizer: Literal['Adam', 'SGD'] = 'Adam'
+
+
+class LoadManyTest(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.path = Path(self.directory.name)
+        self.paths = []
+        for i in range(50):
+            run = self.path / f'run_{i:02}'
+            run.mkdir()
+            Config(i).to_json(run / 'config.json')
+            self.paths.append(str(run / 'config.json'))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_load_many(self):
+        expected = [
+            LoadResult(path, Config(i), None)
+            for i, path in enumerate(self.paths)
+        ]
+        for executor in ('thread', 'process'):
+            self.assertEqual(
+                Config.load_many(
+                    self.path / '*' / 'config.json', workers=2,
+                    executor=executor,  # type: ignore
+                ),
+                expected,
+                f'Should load with a {executor} pool in order.'
+            )
+        self.assertEqual(
+            Config.load_many(reversed(self.paths), chunk_size=3),
+            expected[::-1],
+            'Should load paths in order.'
+        )
+        self.assertEqual(
+            sorted(Config.load_many(self.paths, stream=True, chunk_size=3)),
+            expected,
+            'Should stream all the results.'
+        )
+        self.assertEqual(
+            Config.load_many(self.path / '**' / 'missing.json'), [],
+            'Should load nothing when nothing matches.'
+        )
+
+        with self.assertRaises(ValueError, msg='Should check the executor.'):
+            Config.load_many(self.paths, executor='fiber')  # type: ignore
+
+    def test_errors(self):
+        Path(self.paths[1]).write_text('{')
+        Path(self.paths[2]).write_text(json.dumps({'epoch': 1.5}))
+        Path(self.paths[3]).unlink()
+        for executor in ('thread', 'process'):
+            results = Config.load_many(
+                self.paths[:5], executor=executor  # type: ignore
+            )
+            self.assertEqual(
+                [result.path for result in results], self.paths[:5],
+                'Should keep a result for every file.'
+            )
+            self.assertEqual(
+                [type(result.error) for result in results],
+                [type(None), json.JSONDecodeError, TypeError,
+                 FileNotFoundError, type(None)],
+                'Should collect the errors of each file.'
+            )
+            self.assertEqual(
+                [result.config for result in results],
+                [Config(0), None, None, None, Config(4)],
+                'Should load the other files.'
+            )
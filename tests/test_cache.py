@@ -0,0 +1,158 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Literal
+from unittest import TestCase
+from unittest.mock import patch
+
+from rootconfig import RootConfig
+from rootconfig.cache import ConfigCache, memoize_on_config
+
+
+@dataclass
+class Config(RootConfig):
+    vocab_size: int
+    tokenizer: Literal['bpe', 'char'] = 'bpe'
+    learning_rate: float = 1e-3
+
+
+def store_many(directory: str, worker: int):
+    cache = ConfigCache(directory, max_entries=8)
+    for i in range(20):
+        key = cache.key(Config(i % 12))
+        value = cache.get(key)
+        assert value in (None, i % 12), value
+        cache.store(key, i % 12)
+    return worker
+
+
+class ConfigCacheTest(TestCase):
+    def test_memoize(self):
+        with TemporaryDirectory() as directory:
+            cache = ConfigCache(directory)
+            calls = []
+
+            @memoize_on_config(cache, fields=['vocab_size', 'tokenizer'])
+            def preprocess(config: Config):
+                calls.append(config)
+                return list(range(config.vocab_size))
+
+            self.assertEqual(
+                preprocess(Config(3)), [0, 1, 2], 'Should return results.'
+            )
+            self.assertEqual(
+                preprocess(Config(3, learning_rate=1.)), [0, 1, 2],
+                'Should return cached results.'
+            )
+            self.assertEqual(
+                len(calls), 1, 'Should ignore fields not in `fields`.'
+            )
+            preprocess(Config(3, 'char'))
+            self.assertEqual(len(calls), 2, 'Should key on `fields`.')
+
+            self.assertEqual(
+                ConfigCache(directory).load(
+                    cache.key(
+                        Config(3), ['vocab_size', 'tokenizer'],
+                        f'{__name__}.{preprocess.__qualname__}',
+                    )
+                ),
+                [0, 1, 2],
+                'Should persist results on disk.'
+            )
+            self.assertEqual(
+                cache.stats(), {'hits': 1, 'misses': 2, 'evictions': 0},
+                'Should count hits and misses.'
+            )
+            self.assertEqual(
+                [
+                    name for name in os.listdir(directory)
+                    if name.startswith('.tmp-')
+                ],
+                [],
+                'Should not leave temporary files.'
+            )
+
+    def test_eviction(self):
+        with TemporaryDirectory() as directory:
+            cache = ConfigCache(directory, max_entries=2)
+            keys = [cache.key(Config(i)) for i in range(3)]
+            cache.store(keys[0], 0)
+            cache.store(keys[1], 1)
+            os.utime(cache._path(keys[0]), ns=(0, 0))
+            os.utime(cache._path(keys[1]), ns=(10 ** 9, 10 ** 9))
+            cache.load(keys[0])
+            cache.store(keys[2], 2)
+            self.assertEqual(
+                [cache.get(key) for key in keys], [0, None, 2],
+                'Should evict the least recently used entry.'
+            )
+            self.assertEqual(cache.evictions, 1, 'Should count evictions.')
+
+            cache = ConfigCache(directory, max_bytes=0)
+            cache.store(keys[0], 0)
+            self.assertEqual(
+                list(cache._entry_paths()), [],
+                'Should evict everything over the size limit.'
+            )
+
+            with self.assertRaises(KeyError, msg='Should miss.'):
+                cache.load(keys[1])
+            Path(cache._path(keys[1])).parent.mkdir(exist_ok=True)
+            Path(cache._path(keys[1])).write_bytes(b'')
+            with self.assertRaises(
+                KeyError, msg='Should miss on corrupted entries.'
+            ):
+                cache.load(keys[1])
+
+            with self.assertRaises(
+                ValueError, msg='Should reject negative limits.'
+            ):
+                ConfigCache(directory, max_entries=-1)
+
+    def test_usage(self):
+        with TemporaryDirectory() as directory:
+            cache = ConfigCache(directory, max_entries=20)
+            with patch.object(
+                ConfigCache, '_entry_paths', autospec=True,
+                side_effect=ConfigCache._entry_paths,
+            ) as entry_paths:
+                for i in range(21):
+                    cache.store(cache.key(Config(i)), i)
+                self.assertEqual(
+                    entry_paths.call_count, 2,
+                    'Should only scan to create the usage and to evict.'
+                )
+                cache.store(cache.key(Config(0)), 0)
+                cache.store(cache.key(Config(21)), 21)
+                self.assertEqual(
+                    entry_paths.call_count, 2, 'Should not scan under limits.'
+                )
+            self.assertEqual(
+                cache.evictions, 3, 'Should evict down to 90% of the limit.'
+            )
+            self.assertEqual(len(list(cache._entry_paths())), 20)
+            self.assertEqual(cache._read_usage()[1], 20)
+
+            os.remove(os.path.join(directory, '.usage'))
+            cache.store(cache.key(Config(22)), 22)
+            self.assertEqual(
+                cache._read_usage()[1], len(list(cache._entry_paths())),
+                'Should recount a lost usage.'
+            )
+            cache.clear()
+            self.assertEqual(cache._read_usage(), (0, 0))
+
+    def test_processes(self):
+        with TemporaryDirectory() as directory:
+            with ProcessPoolExecutor(4) as executor:
+                workers = list(
+                    executor.map(store_many, [directory] * 4, range(4))
+                )
+            self.assertEqual(workers, [0, 1, 2, 3], 'Should not fail.')
+            self.assertLessEqual(
+                len(list(ConfigCache(directory)._entry_paths())), 8,
+                'Should enforce limits across processes.'
+            )
@@ -0,0 +1,172 @@
+from array import array
+from dataclasses import dataclass, field
+from fractions import Fraction
+from pathlib import Path
+from typing import Literal
+from unittest import TestCase, skipUnless
+
+from rootconfig import RootConfig
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+@dataclass
+class Config(RootConfig):
+    epoch: int
+    learning_rate: float = 1e-3
+    optimizer: Literal['Adam', 'SGD'] = 'Adam'
+    debug: bool = False
+    name: str = 'run'
+    output_path: Path = Path('outputs')
+    ratio: Fraction = Fraction(1, 3)
+    layers: list[int] = field(default_factory=lambda: [64])
+
+
+class ColumnsTest(TestCase):
+    def setUp(self):
+        self.configs = [
+            Config(
+                i, 10. ** -i, 'SGD' if i % 2 else 'Adam', i % 2 == 1,
+                ''.join(['run', '-', str(i % 2)]), Path('outputs', str(i % 2)),
+                Fraction(i, 7), [64] * i,
+            )
+            for i in range(6)
+        ]
+
+    def test_to_columns(self):
+        columns = Config.to_columns(iter(self.configs))
+        self.assertEqual(list(columns), list(Config._compiled_schema().names))
+        self.assertEqual(
+            columns['epoch'], array('q', range(6)), 'Should use arrays.'
+        )
+        self.assertEqual(
+            columns['learning_rate'],
+            array('d', [10. ** -i for i in range(6)]),
+            'Should use arrays.'
+        )
+        self.assertEqual(
+            columns['debug'], array('b', [0, 1] * 3), 'Should use arrays.'
+        )
+        self.assertEqual(
+            columns['optimizer'], ['Adam', 'SGD'] * 3, 'Should use lists.'
+        )
+        self.assertIs(
+            columns['name'][0], columns['name'][2], 'Should intern strings.'
+        )
+        self.assertIs(
+            columns['output_path'][1], columns['output_path'][3],
+            'Should share equal paths.'
+        )
+        self.assertIs(
+            columns['layers'][2], self.configs[2].layers,
+            'Should not copy values.'
+        )
+        self.assertEqual(
+            Config.to_columns([Config(2 ** 70)])['epoch'], [2 ** 70],
+            'Should keep large integers.'
+        )
+        self.assertEqual(
+            Config.to_columns([])['epoch'], array('q'),
+            'Should convert no instances.'
+        )
+        with self.assertRaises(ValueError, msg='Should check the backend.'):
+            Config.to_columns(self.configs, backend='arrow')  # type: ignore
+
+    def test_from_columns(self):
+        columns = Config.to_columns(self.configs)
+        self.assertEqual(
+            Config.from_columns(columns), self.configs,
+            'Should round-trip.'
+        )
+        self.assertEqual(
+            Config.from_columns({'epoch': [1, 2], 'unknown': [0, 0]}),
+            [Config(1), Config(2)],
+            'Should use default values.'
+        )
+        self.assertEqual(
+            Config.from_columns({'epoch': array('i', [1]), 'debug': [True]}),
+            [Config(1, debug=True)],
+            'Should accept arrays.'
+        )
+        self.assertEqual(Config.from_columns({}), [], 'Should accept none.')
+
+        with self.assertRaisesRegex(
+            TypeError, '^Row 1: ', msg='Should report the row.'
+        ):
+            Config.from_columns({'epoch': [1, 2], 'optimizer': ['SGD', 'x']})
+        with self.assertRaisesRegex(
+            TypeError, '^Row 0: ', msg='Should check required columns.'
+        ):
+            Config.from_columns({'learning_rate': [1.]})
+        with self.assertRaises(ValueError, msg='Should check the lengths.'):
+            Config.from_columns({'epoch': [1, 2], 'debug': [True]})
+        self.assertEqual(
+            Config.from_columns(
+                {'epoch': [1], 'optimizer': ['x']}, validate='none'
+            )[0].optimizer,
+            'x',
+            'Should use the validation level.'
+        )
+
+    def test_invalid_defaults(self):
+        @dataclass
+        class Invalid(RootConfig):
+            learning_rate: float = 1e-3
+            epoch: int = 'bad'  # type: ignore
+
+        with self.assertRaisesRegex(
+            TypeError, '^Row 0: ', msg='Should check default values.'
+        ):
+            Invalid.from_columns({'learning_rate': [0.1, 0.2]})
+        with self.assertRaisesRegex(TypeError, '^Record 0: '):
+            Invalid.from_records([{'learning_rate': 0.1}])
+        self.assertEqual(
+            len(Invalid.from_columns(
+                {'learning_rate': [0.1, 0.2]}, validate='none'
+            )),
+            2
+        )
+
+    def test_post_init_error(self):
+        @dataclass
+        class Ascii(RootConfig):
+            name: str
+
+            def __post_init__(self):
+                super().__post_init__()
+                self.name.encode('ascii')
+
+        with self.assertRaisesRegex(
+            ValueError, '^Row 1: ',
+            msg='Should report errors whose constructor takes other arguments.'
+        ) as context:
+            Ascii.from_columns({'name': ['a', 'é']})
+        self.assertIsInstance(context.exception.__cause__, UnicodeEncodeError)
+
+    @skipUnless(np, 'NumPy is not installed.')
+    def test_numpy(self):
+        columns = Config.to_columns(self.configs, backend='numpy')
+        self.assertEqual(columns['epoch'].dtype, np.int64)
+        self.assertEqual(columns['debug'].dtype, np.bool_)
+        self.assertEqual(columns['layers'][2], [64, 64])
+        self.assertEqual(
+            Config.from_columns(columns), self.configs, 'Should round-trip.'
+        )
+
+    @skipUnless(pd, 'pandas is not installed.')
+    def test_pandas(self):
+        frame = Config.to_columns(self.configs, backend='pandas')
+        self.assertEqual(
+            list(frame['optimizer'].cat.categories), ['Adam', 'SGD']
+        )
+        self.assertEqual(
+            Config.from_columns(frame), self.configs, 'Should round-trip.'
+        )
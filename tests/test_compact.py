@@ -0,0 +1,84 @@
+import pickle
+from dataclasses import dataclass, field
+from fractions import Fraction
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Literal
+from unittest import TestCase
+
+from rootconfig import RootConfig, config_dataclass
+
+
+@config_dataclass(compact=True)
+class Config(RootConfig):
+    epoch: int
+    optimizer: Literal['Adam', 'SGD'] = 'Adam'
+    ratios: list[Fraction] = field(default_factory=lambda: [Fraction(1, 3)])
+
+
+class CompactTest(TestCase):
+    def test_compact(self):
+        config = Config(1)
+        self.assertFalse(
+            hasattr(config, '__dict__'),
+            'Compact instances should not have a `__dict__`.'
+        )
+        with self.assertRaises(
+            AttributeError, msg='Should not accept attributes of no field.'
+        ):
+            config.learning_rate = 1.  # type: ignore
+
+        with self.assertRaises(TypeError, msg='Should check types.'):
+            Config(1.5)  # type: ignore
+        with self.assertRaises(TypeError, msg='Should check types.'):
+            Config(1, 'RMSProp')  # type: ignore
+
+        self.assertEqual(
+            config.to_dict(),
+            {'epoch': 1, 'optimizer': 'Adam', 'ratios': [Fraction(1, 3)]},
+            'Should convert to `dict`.'
+        )
+        self.assertEqual(
+            Config.from_dict({'epoch': 1, 'unknown': 2}), config,
+            'Should create from `dict`.'
+        )
+        self.assertEqual(
+            Config.parse_args(['--epoch', '1']), config,
+            'Should parse arguments.'
+        )
+        self.assertEqual(
+            Config.parse_args(['--epoch', '1'], engine='fast'), config,
+            'Should parse arguments.'
+        )
+        with TemporaryDirectory() as directory:
+            json_file = Path(directory) / 'config.json'
+            config.to_json(json_file)
+            self.assertEqual(
+                Config.from_json(json_file), config,
+                'Should import and export JSON files.'
+            )
+        self.assertEqual(
+            pickle.loads(pickle.dumps(config)), config,
+            'Should be pickled.'
+        )
+
+    def test_compact_exception(self):
+        @dataclass
+        class Config2(RootConfig):
+            epoch: int
+
+        with self.assertRaises(
+            TypeError, msg='All bases should define `__slots__`.'
+        ):
+            @config_dataclass(compact=True)
+            class Config3(Config2):
+                optimizer: str = 'Adam'
+
+        @config_dataclass
+        class Config4(RootConfig):
+            epoch: int
+
+        self.assertTrue(
+            hasattr(Config4(1), '__dict__'),
+            'Should be a plain `dataclass` without options.'
+        )
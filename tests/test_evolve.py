@@ -0,0 +1,104 @@
+from array import array
+from dataclasses import FrozenInstanceError, dataclass, field
+from fractions import Fraction
+from typing import Literal
+from unittest import TestCase
+
+from rootconfig import RootConfig, config_dataclass
+
+
+@dataclass
+class Config(RootConfig):
+    learning_rate: float
+    optimizer: Literal['Adam', 'SGD'] = 'Adam'
+    ratios: list[Fraction] = field(default_factory=lambda: [Fraction(1, 3)])
+    schedule: list[float] = field(
+        default_factory=list, metadata={'storage': 'array'}
+    )
+    steps: int = field(default=0, init=False)
+
+
+@config_dataclass(compact=True, hashable=True)
+class CompactConfig(RootConfig):
+    learning_rate: float
+    optimizer: Literal['Adam', 'SGD'] = 'Adam'
+
+
+@dataclass
+class PostInitConfig(RootConfig):
+    learning_rate: float
+    warmup_rate: float = 0.
+
+    def __post_init__(self):
+        super().__post_init__()
+        self.warmup_rate = self.learning_rate / 10
+
+
+class EvolveTest(TestCase):
+    def test_evolve(self):
+        config = Config(1e-3)
+        evolved = config.evolve(optimizer='SGD', schedule=[0.5])
+        self.assertEqual(
+            (evolved.learning_rate, evolved.optimizer, evolved.schedule),
+            (1e-3, 'SGD', array('d', [0.5])),
+            'Should change the fields.'
+        )
+        self.assertEqual(config.optimizer, 'Adam', 'Should copy.')
+        self.assertIs(
+            evolved.ratios, config.ratios, 'Should share unchanged values.'
+        )
+        self.assertEqual(
+            evolved, Config(1e-3, 'SGD', schedule=[0.5]),
+            'Should be the same as creating an instance.'
+        )
+
+        with self.assertRaises(TypeError, msg='Should check changes.'):
+            config.evolve(optimizer='RMSProp')
+        with self.assertRaises(TypeError, msg='Should check changes.'):
+            config.evolve(schedule=[1])
+        with self.assertRaises(TypeError, msg='Should check field names.'):
+            config.evolve(epoch=1)
+        with self.assertRaises(
+            ValueError, msg='Should not change `init=False` fields.'
+        ):
+            config.evolve(steps=1)
+
+        compact = CompactConfig(1e-3)
+        evolved_compact = compact.evolve(learning_rate=1e-4)
+        self.assertEqual(
+            evolved_compact, CompactConfig(1e-4),
+            'Should evolve compact instances.'
+        )
+        self.assertEqual(
+            hash(evolved_compact), hash(CompactConfig(1e-4)),
+            'Should hash evolved instances by their new values.'
+        )
+        with self.assertRaises(
+            FrozenInstanceError, msg='Should keep instances frozen.'
+        ):
+            evolved_compact.learning_rate = 1.
+
+        self.assertEqual(
+            PostInitConfig(1.).evolve(learning_rate=2.).warmup_rate, .2,
+            'Should run overridden `__post_init__`.'
+        )
+
+    def test_evolve_many(self):
+        config = Config(1e-3)
+        changes = [
+            {'learning_rate': 1e-4}, {}, {'optimizer': 'SGD', 'ratios': []},
+        ]
+        self.assertEqual(
+            config.evolve_many(iter(changes)),
+            [config.evolve(**change) for change in changes],
+            'Should be the same as `evolve`.'
+        )
+
+        with self.assertRaisesRegex(
+            TypeError, 'Changes 2: ', msg='Should report the index.'
+        ):
+            config.evolve_many([{}, {'learning_rate': 1.}, {'ratios': [1]}])
+        with self.assertRaisesRegex(
+            TypeError, 'Changes 1: ', msg='Should report the index.'
+        ):
+            config.evolve_many([{}, {'epoch': 1}])
@@ -0,0 +1,150 @@
+import io
+import random
+from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import dataclass, field
+from decimal import Decimal
+from fractions import Fraction
+from pathlib import Path
+from typing import Literal
+from unittest import TestCase
+
+from rootconfig import RootConfig
+
+
+@dataclass
+class Config(RootConfig):
+    batch_size: int
+    lpf_pole: complex
+    learning_rates: list[Decimal]
+    optimizer: Literal['Adam', 'AdamW', 'RMSProp']
+    debug: bool = False
+    random_seed: int = 1
+    margin: float = 0.5
+    model_version: Literal[1, 2, 3] = 2
+    run_name: str = 'baseline'
+    dataset_path: Path = Path('datasets')
+    ratios: list[Fraction] = field(
+        default_factory=lambda: [Fraction(1, 3)]
+    )
+    flags: list[bool] = field(default_factory=list)
+
+
+@dataclass
+class StringDefaultConfig(RootConfig):
+    output_path: Path = 'outputs'  # type: ignore
+
+
+def parse(config_class: type[RootConfig], arguments: list[str], engine: str):
+    """Parse the arguments and describe the outcome in a comparable way."""
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            config = config_class.parse_args(arguments, engine=engine)
+        except SystemExit as e:
+            return 'exit', e.code, stdout.getvalue(), stderr.getvalue()
+        except Exception as e:
+            return 'error', type(e), str(e)
+    return 'ok', repr(config)
+
+
+class FastParserTest(TestCase):
+    def assertSameOutcome(self, config_class, arguments):
+        self.assertEqual(
+            parse(config_class, arguments, 'fast'),
+            parse(config_class, arguments, 'argparse'),
+            f'Both engines should agree on {arguments}.'
+        )
+
+    def test_same_values(self):
+        required = [
+            '--batch-size', '128', '--lpf-pole', '0+1j',
+            '--learning-rates', '1e-2', '1e-3', '--optimizer', 'Adam',
+        ]
+        cases = [
+            required,
+            required + ['--debug', 'True', '--random-seed', '-3'],
+            required + ['--margin', '-.5', '--model-version', '3'],
+            required + ['--ratios', '2/3', '-1', '--flags', 'true', 'False'],
+            required + ['--ratios', '--flags'],
+            required + ['--run-name', '', '--dataset-path', '-'],
+            required + ['--random-seed', '1', '--random-seed', '2'],
+            required + ['--batch', '64', '--optimizer=AdamW'],
+            ['--optimizer', 'RMSProp', '--learning-rates',
+             '--lpf-pole', '1j', '--batch-size', '0'],
+        ]
+        for arguments in cases:
+            self.assertEqual(
+                parse(Config, arguments, 'fast')[0], 'ok',
+                f'{arguments} should be parsed.'
+            )
+            self.assertSameOutcome(Config, arguments)
+
+        self.assertSameOutcome(StringDefaultConfig, [])
+        self.assertEqual(
+            StringDefaultConfig.parse_args([], engine='fast').output_path,
+            Path('outputs'),
+            'String defaults should be converted like `ArgumentParser` does.'
+        )
+
+    def test_same_errors(self):
+        required = [
+            '--batch-size', '128', '--lpf-pole', '0+1j',
+            '--learning-rates', '0.1', '--optimizer', 'Adam',
+        ]
+        cases = [
+            [],
+            required[:-2],
+            ['--batch_size'] + required[1:],
+            required[:-1] + ['SGD'],
+            ['--batch-size', '0+0j'] + required[2:],
+            ['--batch-size'] + required[2:],
+            required + ['--debug', 'FFalse'],
+            required + ['--debug'],
+            required + ['--ratios', '3/4', 'inf'],
+            required + ['--learning-rates', 'abc'],
+            required + ['--i-am-an-imposter', 'whatever'],
+            required + ['whatever'],
+            required + ['--margin', '-1e-3'],
+            required + ['--', '--debug', 'True'],
+            required + ['-h'],
+            required + ['--help'],
+        ]
+        for arguments in cases:
+            self.assertNotEqual(
+                parse(Config, arguments, 'argparse')[0], 'ok',
+                f'{arguments} should not be parsed.'
+            )
+            self.assertSameOutcome(Config, arguments)
+
+    def test_random_arguments(self):
+        flags = [
+            '--batch-size', '--lpf-pole', '--learning-rates', '--optimizer',
+            '--debug', '--random-seed', '--margin', '--model-version',
+            '--run-name', '--dataset-path', '--ratios', '--flags',
+            '--batch', '--optimizer=Adam', '--bogus', '--', '-x',
+        ]
+        values = [
+            '128', '-1', '-0.5', '1e-3', '-1e-3', 'inf', 'nan', '0+1j',
+            '1/3', 'Adam', 'AdamW', 'SGD', 'True', 'false', '2', '',
+            '-', 'a b', '-a b', 'x',
+        ]
+        rng = random.Random(0)
+        for _ in range(500):
+            arguments = []
+            for _ in range(rng.randrange(16)):
+                pool = flags if rng.random() < 0.4 else values
+                arguments.append(rng.choice(pool))
+            self.assertSameOutcome(Config, arguments)
+
+    def test_engine_options(self):
+        with self.assertRaises(
+            ValueError, msg='Should reject unknown engines.'
+        ):
+            Config.parse_args([], engine='slow')  # type: ignore
+
+        with self.assertRaises(
+            ValueError,
+            msg='The fast engine should not accept a provided parser.'
+        ):
+            Config.parse_args([], Config.forge_parser(), engine='fast')
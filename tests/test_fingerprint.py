@@ -0,0 +1,157 @@
+import copy
+import hashlib
+import pickle
+from dataclasses import FrozenInstanceError, dataclass, field, replace
+from decimal import Decimal
+from fractions import Fraction
+from pathlib import Path
+from typing import Literal
+from unittest import TestCase
+
+from rootconfig import RootConfig, config_dataclass
+
+
+@dataclass
+class Config(RootConfig):
+    learning_rate: float
+    margin: Decimal = Decimal('0.50')
+    ratio: Fraction = Fraction(2, 4)
+    pole: complex = -0.j
+    path: Path = Path('data//train')
+    seed: int = 0
+    optimizer: Literal['Adam', 'SGD'] = 'Adam'
+    rates: list[float] = field(default_factory=lambda: [0., 1.])
+
+
+@dataclass
+class ReorderedConfig(RootConfig):
+    rates: list[float]
+    optimizer: Literal['Adam', 'SGD']
+    seed: int
+    path: Path
+    pole: complex
+    ratio: Fraction
+    margin: Decimal
+    learning_rate: float
+
+
+@config_dataclass(hashable=True)
+class HashableConfig(RootConfig):
+    epoch: int
+    learning_rate: float = 1e-3
+    ratios: list[Fraction] = field(default_factory=lambda: [Fraction(1, 3)])
+
+
+@config_dataclass(compact=True, hashable=True)
+class CompactHashableConfig(RootConfig):
+    epoch: int
+    learning_rate: float = 1e-3
+
+
+class FingerprintTest(TestCase):
+    def test_canonical(self):
+        config = Config(float('nan'))
+        self.assertEqual(
+            config.fingerprint(),
+            Config(-float('nan')).fingerprint(),
+            'All NaNs should share a fingerprint.'
+        )
+        self.assertEqual(
+            Config(
+                0., Decimal('5E-1'), Fraction(1, 2), 0j, Path('data/train'),
+                False, 'Adam', [-0., 1.],  # type: ignore
+            ).fingerprint(),
+            Config(-0.).fingerprint(),
+            'Equal values should share a fingerprint.'
+        )
+        self.assertEqual(
+            ReorderedConfig(
+                [0., 1.], 'Adam', 0, Path('data/train'), 0j,
+                Fraction(1, 2), Decimal('0.5'), 0.1,
+            ).fingerprint(),
+            Config(0.1).fingerprint(),
+            'The field order should not matter.'
+        )
+        self.assertEqual(
+            Config(0.1).fingerprint(),
+            hashlib.sha256(
+                b'{"learning_rate":"0.1","margin":"5e-1","optimizer":"Adam",'
+                b'"path":"data/train","pole":["0.0","0.0"],'
+                b'"rates":["0.0","1.0"],"ratio":"1/2","seed":0}'
+            ).hexdigest(),
+            'The fingerprint should not depend on the process.'
+        )
+
+        self.assertNotEqual(
+            Config(0.1).fingerprint(), Config(0.1, seed=1).fingerprint(),
+            'Different values should have different fingerprints.'
+        )
+        self.assertNotEqual(
+            Config(0.1).fingerprint(),
+            Config(0.1, rates=[0., 1., 0.]).fingerprint(),
+            'Different values should have different fingerprints.'
+        )
+
+    def test_cache(self):
+        config = Config(0.1)
+        fingerprint = config.fingerprint()
+        self.assertIs(
+            config.fingerprint(), fingerprint, 'Should cache the fingerprint.'
+        )
+        config.seed = 1
+        self.assertEqual(
+            config.fingerprint(), Config(0.1, seed=1).fingerprint(),
+            'Should compute the fingerprint again after a mutation.'
+        )
+        self.assertEqual(
+            copy.deepcopy(config).fingerprint(), config.fingerprint(),
+            'Copies should share the fingerprint.'
+        )
+
+        self.assertEqual(
+            config.fingerprint(['seed', 'optimizer']),
+            Config(0.2, seed=1).fingerprint(('optimizer', 'seed')),
+            'Should only digest the given fields.'
+        )
+        with self.assertRaises(TypeError, msg='Should reject unknown fields.'):
+            config.fingerprint(['epoch'])
+
+    def test_hashable(self):
+        for config_class in (HashableConfig, CompactHashableConfig):
+            config = config_class(1)
+            self.assertEqual(
+                hash(config), hash(config_class(1)),
+                'Equal instances should have equal hashes.'
+            )
+            self.assertEqual(
+                {config: 'value'}[config_class(1)], 'value',
+                'Should work as `dict` keys.'
+            )
+            with self.assertRaises(
+                FrozenInstanceError, msg='Should not assign fields.'
+            ):
+                config.epoch = 2
+            with self.assertRaises(
+                FrozenInstanceError, msg='Should not delete fields.'
+            ):
+                del config.epoch
+            self.assertEqual(
+                replace(config, epoch=2), config_class(2),
+                'Should be replaced with new values.'
+            )
+            for copied in (
+                copy.copy(config), pickle.loads(pickle.dumps(config)),
+            ):
+                self.assertEqual(copied, config, 'Should be copied.')
+                self.assertEqual(
+                    hash(copied), hash(config), 'Should be copied.'
+                )
+            with self.assertRaises(TypeError, msg='Should check types.'):
+                config_class(1.5)  # type: ignore
+
+        with self.assertRaises(
+            TypeError, msg='Should only make `RootConfig` hashable.'
+        ):
+            @config_dataclass(hashable=True)
+            class NotConfig:
+                epoch: int
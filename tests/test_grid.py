@@ -0,0 +1,110 @@
+from dataclasses import dataclass, field
+from itertools import product
+from typing import Literal
+from unittest import TestCase
+
+from rootconfig import RootConfig
+
+
+@dataclass
+class Config(RootConfig):
+    learning_rate: float
+    optimizer: Literal['Adam', 'AdamW', 'SGD'] = 'Adam'
+    layers: list[int] = field(default_factory=lambda: [64])
+    epoch: int = 10
+
+
+class GridTest(TestCase):
+    def test_grid(self):
+        learning_rates = [1e-2, 1e-3, 1e-4]
+        optimizers = ['Adam', 'SGD']
+        layers = [[32], [64, 64]]
+        grid = Config.grid(
+            learning_rate=learning_rates, optimizer=optimizers, layers=layers
+        )
+        expected = [
+            Config(learning_rate, optimizer, list(layer))
+            for learning_rate, optimizer, layer in product(
+                learning_rates, optimizers, layers
+            )
+        ]
+
+        self.assertEqual(len(grid), 12, 'Should have the product length.')
+        self.assertListEqual(
+            list(grid), expected,
+            'Should iterate in the order of `itertools.product`.'
+        )
+        self.assertListEqual(
+            [grid[i] for i in range(len(grid))], expected,
+            'Random access should match iteration.'
+        )
+        self.assertEqual(
+            grid[-1], expected[-1], 'Should support negative indices.'
+        )
+        self.assertListEqual(
+            grid[2:6], expected[2:6], 'Should support slices.'
+        )
+        self.assertIsNot(
+            grid[0].layers, grid[0].layers,
+            'Instances should not share `list` values.'
+        )
+        with self.assertRaises(IndexError, msg='Should check the index.'):
+            grid[12]
+
+    def test_grid_shards(self):
+        grid = Config.grid(learning_rate=[0.1 * i for i in range(10)])
+        num_shards = 3
+        shards = [
+            Config.grid(
+                learning_rate=[0.1 * i for i in range(10)],
+                shard=shard, num_shards=num_shards,
+            )
+            for shard in range(num_shards)
+        ]
+        self.assertListEqual(
+            [len(shard) for shard in shards], [3, 3, 4],
+            'Shards should have balanced lengths.'
+        )
+        self.assertListEqual(
+            [config for shard in shards for config in shard], list(grid),
+            'Shards together should cover the whole grid, in order.'
+        )
+        self.assertEqual(
+            shards[1][0], grid[3],
+            'Random access should be relative to the shard.'
+        )
+
+        with self.assertRaises(ValueError, msg='Should check the shard.'):
+            Config.grid(learning_rate=[0.1], shard=2, num_shards=2)
+
+    def test_grid_exception(self):
+        with self.assertRaisesRegex(
+            TypeError, '`learning_rate` value 1',
+            msg='Should check every axis value.'
+        ):
+            Config.grid(learning_rate=[0.1, 1], optimizer=['Adam'])
+
+        with self.assertRaises(
+            TypeError, msg='Should reject values not in `Literal`.'
+        ):
+            Config.grid(learning_rate=[0.1], optimizer=['RMSProp'])
+
+        with self.assertRaises(
+            TypeError, msg='Should reject unknown fields.'
+        ):
+            Config.grid(learning_rate=[0.1], momentum=[0.9])
+
+        with self.assertRaises(
+            TypeError, msg='Should require fields without default values.'
+        ):
+            Config.grid(optimizer=['Adam'])
+
+        @dataclass
+        class Config2(RootConfig):
+            learning_rate: float
+            epoch: int = 1.5  # type: ignore
+
+        with self.assertRaises(
+            TypeError, msg='Should check fields not on any axis.'
+        ):
+            Config2.grid(learning_rate=[0.1])
@@ -0,0 +1,143 @@
+import os
+from dataclasses import dataclass, field, make_dataclass
+from decimal import Decimal
+from fractions import Fraction
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Literal
+from unittest import TestCase
+from unittest.mock import patch
+
+from rootconfig import RootConfig
+from rootconfig.index import ConfigIndex, ScanResult
+
+
+@dataclass
+class Config(RootConfig):
+    learning_rate: float
+    optimizer: Literal['Adam', 'AdamW', 'SGD'] = 'Adam'
+    margin: Decimal = Decimal('0.5')
+    debug: bool = False
+    output_path: Path = Path('outputs')
+    pole: complex = 1j
+    layers: list[int] = field(default_factory=lambda: [64, 64])
+    epoch: int = 0
+
+
+class ConfigIndexTest(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.root = Path(self.directory.name, 'runs')
+        self.configs = {}
+        for i, (learning_rate, optimizer) in enumerate([
+            (1e-2, 'Adam'), (1e-3, 'AdamW'), (1e-4, 'AdamW'), (1e-4, 'SGD'),
+        ]):
+            self.write(f'run_{i}', Config(
+                learning_rate, optimizer, margin=Decimal(i), debug=i % 2 == 1,
+                output_path=Path(f'outputs/{i}'), layers=[64] * (i + 1),
+                epoch=i,
+            ))
+        self.database = Path(self.directory.name, 'index.sqlite')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name: str, config: Config):
+        (self.root / name).mkdir(parents=True, exist_ok=True)
+        path = str(self.root / name / 'config.json')
+        config.to_json(path)  # type: ignore
+        self.configs[name] = path
+
+    def test_query(self):
+        with ConfigIndex(Config, self.database) as index:
+            self.assertEqual(
+                index.scan(self.root), ScanResult(4, 0, 0, 0, 0),
+                'Should add all files.'
+            )
+            paths = [self.configs[f'run_{i}'] for i in range(4)]
+            with patch.object(Config, 'from_json', side_effect=OSError):
+                queries = [
+                    ({'optimizer': 'AdamW'}, paths[1:3]),
+                    ({'optimizer': 'AdamW', 'learning_rate__lt': 1e-3},
+                     paths[2:3]),
+                    ({'optimizer__in': ['Adam', 'SGD']}, paths[::3]),
+                    ({'optimizer__ne': 'AdamW'}, paths[::3]),
+                    ({'margin__ge': 1, 'margin__le': Decimal('2.5')},
+                     paths[1:3]),
+                    ({'debug': True}, paths[1::2]),
+                    ({'output_path': Path('outputs/2')}, paths[2:3]),
+                    ({'output_path': 'outputs/2'}, paths[2:3]),
+                    ({'pole': 1j}, paths),
+                    ({'layers': [64, 64]}, paths[1:2]),
+                    ({'epoch__lt': 2.5}, paths[:3]),
+                    ({'epoch': 1.7}, []),
+                    ({'epoch__in': [1, 2.5]}, paths[1:2]),
+                    ({'epoch__gt': Fraction(1, 2)}, paths[1:]),
+                    ({}, paths),
+                ]
+                for conditions, expected in queries:
+                    self.assertEqual(
+                        index.query(**conditions), expected,
+                        f'Should query {conditions} without loading.'
+                    )
+                    self.assertEqual(
+                        index.count(**conditions), len(expected),
+                        f'Should count {conditions}.'
+                    )
+            self.assertEqual(
+                index.configs(optimizer='SGD'),
+                [Config.from_json(paths[3])],  # type: ignore
+                'Should load the matching files.'
+            )
+            with self.assertRaises(TypeError, msg='Should check fields.'):
+                index.query(seed=1)
+
+    def test_incremental_scan(self):
+        with ConfigIndex(Config, self.database) as index:
+            index.scan(self.root)
+        with ConfigIndex(Config, self.database) as index:
+            self.assertEqual(len(index), 4, 'Should persist the index.')
+            self.assertEqual(
+                index.scan(self.root), ScanResult(0, 0, 0, 4, 0),
+                'Should skip unchanged files.'
+            )
+
+            self.write('run_0', Config(1e-3, 'SGD'))
+            os.utime(self.configs['run_0'], ns=(0, 1))
+            os.remove(self.configs['run_1'])
+            self.write('run_4', Config(1e-5, 'AdamW'))
+            (self.root / 'run_5').mkdir()
+            (self.root / 'run_5' / 'config.json').write_text('{')
+            with patch.object(
+                Config, 'from_json', autospec=True,
+                side_effect=Config.from_json,
+            ) as from_json:
+                self.assertEqual(
+                    index.scan(self.root), ScanResult(2, 1, 1, 2, 1),
+                    'Should only load new and changed files.'
+                )
+            self.assertEqual(
+                from_json.call_count, 3, 'Should only load changed files.'
+            )
+            self.assertEqual(
+                index.query(optimizer='SGD'),
+                [self.configs['run_0'], self.configs['run_3']],
+                'Should update changed files.'
+            )
+            self.assertEqual(
+                list(index.errors()),
+                [str(self.root / 'run_5' / 'config.json')],
+                'Should keep failed files apart.'
+            )
+            self.assertEqual(
+                index.count(), 4, 'Failed files should never match.'
+            )
+
+        OtherConfig = make_dataclass(
+            'Config', [('learning_rate', float)], bases=(RootConfig,)
+        )
+        with ConfigIndex(OtherConfig, self.database) as index:
+            self.assertEqual(
+                len(index), 0, 'Should rebuild for other fields.'
+            )
+            self.assertEqual(index.scan(self.root).added, 5)
@@ -0,0 +1,165 @@
+import json
+import math
+from dataclasses import dataclass, field
+from decimal import Decimal
+from fractions import Fraction
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Literal
+from unittest import TestCase
+from unittest.mock import patch
+from uuid import UUID
+
+from rootconfig import RootConfig, register_json_type
+from rootconfig.rootconfig import (RootConfigJSONEncoder,
+                                   _iterencode_json_object, _json_decoders,
+                                   _json_encoder_lookup, _json_encoders,
+                                   root_config_json_decode_object_hook)
+
+
+@dataclass
+class Config(RootConfig):
+    epoch: int
+    optimizer: Literal['Adam', 'SGD'] = 'Adam'
+    learning_rate: Decimal = Decimal('1e-3')
+    pole: complex = complex('nan+1j')
+    margin: Fraction = Fraction(3, 4)
+    output_path: Path = Path('outputs')
+    epsilon: float = float('-inf')
+    poles: list[complex] = field(default_factory=lambda: [1j, -1 + 0j])
+    ratios: list[Fraction] = field(default_factory=lambda: [Fraction(1, 3)])
+    names: list[str] = field(default_factory=lambda: ['a', 'b'])
+
+
+class JSONTest(TestCase):
+    def test_round_trip(self):
+        config = Config(10, 'SGD')
+        with TemporaryDirectory() as directory:
+            json_file = Path(directory) / 'config.json'
+            config.to_json(json_file)
+            loaded = Config.from_json(json_file)
+
+        self.assertEqual(
+            loaded.learning_rate, Decimal('1e-3'), 'Should decode `Decimal`.'
+        )
+        self.assertIsInstance(
+            loaded.output_path, Path, 'Should decode `Path`.'
+        )
+        self.assertTrue(
+            math.isnan(loaded.pole.real), 'Should decode `complex`.'
+        )
+        self.assertEqual(
+            loaded.epsilon, float('-inf'), 'Should decode infinity.'
+        )
+        self.assertListEqual(
+            loaded.poles, [1j, -1 + 0j], 'Should decode lists.'
+        )
+        self.assertListEqual(
+            loaded.ratios, [Fraction(1, 3)], 'Should decode lists.'
+        )
+        self.assertEqual(
+            (loaded.epoch, loaded.optimizer, loaded.margin, loaded.names),
+            (config.epoch, config.optimizer, config.margin, config.names),
+            'Should keep other values.'
+        )
+
+    def test_schema_aware_decoding(self):
+        encoded = json.dumps(
+            {'epoch': 1, 'names': [{'__custom_type__': 'Path',
+                                    '__value__': 'a'}]},
+        )
+        with self.assertRaises(
+            TypeError,
+            msg='Should not decode special objects for other field types.'
+        ):
+            Config._from_json_object(json.loads(encoded))
+
+        with self.assertRaises(
+            TypeError, msg='Should reject JSON that is not an `Object`.'
+        ):
+            Config._from_json_object([1, 2])
+
+    def test_register_json_type(self):
+        for registry in (_json_encoders, _json_decoders, _json_encoder_lookup):
+            patcher = patch.dict(registry)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        object_hook = root_config_json_decode_object_hook
+        encoded = json.dumps(Path('/a'), cls=RootConfigJSONEncoder)
+        self.assertEqual(
+            json.loads(encoded, object_hook=object_hook),
+            Path('/a'),
+            'Should encode subclasses of registered types.'
+        )
+
+        with self.assertRaises(
+            TypeError, msg='Should not encode unregistered types.'
+        ):
+            json.dumps(UUID(int=1), cls=RootConfigJSONEncoder)
+
+        register_json_type(UUID)
+        encoded = json.dumps([UUID(int=1)], cls=RootConfigJSONEncoder)
+        self.assertEqual(
+            json.loads(encoded)[0],
+            {'__custom_type__': 'UUID', '__value__': str(UUID(int=1))},
+            'Should encode registered types as special objects.'
+        )
+        self.assertEqual(
+            json.loads(encoded, object_hook=object_hook),
+            [UUID(int=1)],
+            'Should decode registered types.'
+        )
+        self.assertEqual(
+            root_config_json_decode_object_hook(
+                {'__custom_type__': 'Unknown', '__value__': 1}
+            ),
+            {'__custom_type__': 'Unknown', '__value__': 1},
+            'Should leave unknown objects untouched.'
+        )
+
+    def test_to_dict(self):
+        config = Config(1)
+        deep = config.to_dict()
+        shallow = config.to_dict(copy='shallow')
+        no_copy = config.to_dict(copy='none')
+
+        self.assertTrue(
+            deep == shallow == no_copy,
+            'All copy modes should have the same content.'
+        )
+        self.assertIsNot(
+            shallow['ratios'], config.ratios,
+            'A shallow copy should copy `list` values.'
+        )
+        self.assertIs(
+            no_copy['ratios'], config.ratios,
+            'No copy should keep `list` values as they are.'
+        )
+        with self.assertRaises(ValueError, msg='Should check the copy mode.'):
+            config.to_dict(copy='half')  # type: ignore
+
+        mapping = config.as_mapping()
+        self.assertEqual(
+            dict(mapping), no_copy,
+            'The mapping view should have the same content.'
+        )
+        self.assertEqual(len(mapping), 10, 'Should have one key per field.')
+        self.assertNotIn('to_dict', mapping, 'Should only contain fields.')
+        with self.assertRaises(KeyError, msg='Should only contain fields.'):
+            mapping['to_dict']
+        with self.assertRaises(TypeError, msg='Should be read-only.'):
+            mapping['epoch'] = 2  # type: ignore
+        config.epoch = 2
+        self.assertEqual(
+            mapping['epoch'], 2, 'Should reflect changes of the instance.'
+        )
+
+    def test_chunked_encoding(self):
+        dct = {'a': list(range(10)), 'b': [], 'c': 'd', 'e': [Fraction(1, 2)]}
+        encoder = RootConfigJSONEncoder()
+        for chunk_size in (1, 3, 10, 100):
+            self.assertEqual(
+                ''.join(_iterencode_json_object(encoder, dct, chunk_size)),
+                json.dumps(dct, cls=RootConfigJSONEncoder),
+                'Chunked encoding should match `json.dumps`.'
+            )
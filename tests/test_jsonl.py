@@ -0,0 +1,88 @@
+import gzip
+import lzma
+from dataclasses import dataclass, field
+from decimal import Decimal
+from fractions import Fraction
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Literal
+from unittest import TestCase
+
+from rootconfig import RootConfig
+
+
+@dataclass
+class Config(RootConfig):
+    epoch: int
+    optimizer: Literal['Adam', 'SGD'] = 'Adam'
+    learning_rate: Decimal = Decimal('1e-3')
+    pole: complex = 1j
+    output_path: Path = Path('outputs')
+    ratios: list[Fraction] = field(default_factory=lambda: [Fraction(1, 3)])
+    epsilon: float = float('inf')
+
+
+class JSONLinesTest(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.path = Path(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        configs = [
+            Config(i, 'SGD' if i % 2 else 'Adam', Decimal(i) / 7)
+            for i in range(100)
+        ]
+        for name in ('sweep.jsonl', 'sweep.jsonl.gz', 'sweep.jsonl.xz'):
+            jsonl_file = self.path / name
+            self.assertEqual(
+                Config.write_jsonl(jsonl_file, configs), 100,
+                'Should return the number of written configs.'
+            )
+            self.assertListEqual(
+                list(Config.iter_jsonl(jsonl_file)), configs,
+                'Should read back the same configs.'
+            )
+
+        with open(self.path / 'sweep.jsonl') as f:
+            first_line = f.readline()
+        with gzip.open(self.path / 'sweep.jsonl.gz', 'rt') as f:
+            self.assertEqual(
+                f.readline(), first_line,
+                'Should compress files ending with `.gz`.'
+            )
+        with lzma.open(self.path / 'sweep.jsonl.xz', 'rt') as f:
+            self.assertEqual(
+                f.readline(), first_line,
+                'Should compress files ending with `.xz`.'
+            )
+
+        Config.write_jsonl(self.path / 'sweep.jsonl', configs, append=True)
+        self.assertEqual(
+            len(list(Config.iter_jsonl(self.path / 'sweep.jsonl'))), 200,
+            'Should append to an existing file.'
+        )
+
+    def test_lazy_reading(self):
+        jsonl_file = self.path / 'sweep.jsonl'
+        Config.write_jsonl(jsonl_file, [Config(1), Config(2)])
+        with jsonl_file.open('a') as f:
+            f.write('\n{"epoch": "3"}\n')
+
+        configs = Config.iter_jsonl(jsonl_file)
+        self.assertEqual(next(configs), Config(1), 'Should read lazily.')
+        self.assertEqual(next(configs), Config(2), 'Should read lazily.')
+        with self.assertRaisesRegex(
+            TypeError, r'sweep\.jsonl:4: ',
+            msg='Should report the line number of an invalid config.'
+        ):
+            next(configs)
+
+        jsonl_file.write_text('{"epoch": 1}\n{"epoch": \n')
+        with self.assertRaisesRegex(
+            ValueError, r'sweep\.jsonl:2: ',
+            msg='Should report the line number of malformed JSON.'
+        ):
+            list(Config.iter_jsonl(jsonl_file))
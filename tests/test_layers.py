@@ -0,0 +1,140 @@
+import json
+from dataclasses import dataclass, field
+from decimal import Decimal
+from fractions import Fraction
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Literal
+from unittest import TestCase
+from unittest.mock import patch
+
+from rootconfig import RootConfig
+from rootconfig.layers import Arguments, Environment, Values
+
+
+@dataclass
+class Config(RootConfig):
+    epoch: int
+    optimizer: Literal['Adam', 'SGD'] = 'Adam'
+    learning_rate: Decimal = Decimal('1e-3')
+    ratios: list[Fraction] = field(default_factory=lambda: [Fraction(1, 3)])
+    debug: bool = False
+    output_path: Path = Path('outputs')
+
+
+class LayersTest(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.json_file = Path(self.directory.name) / 'config.json'
+        self.json_file.write_text(json.dumps({
+            'epoch': 3, 'optimizer': 'SGD',
+            'learning_rate': {
+                '__custom_type__': 'Decimal', '__value__': '0.1',
+            },
+        }))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_load(self):
+        ratios = [Fraction(1, 2)] * 1000
+        environ = {
+            'APP_DEBUG': 'True', 'APP_RATIOS': '1/4 3/4', 'APP_EPOCH': '5',
+            'OTHER_EPOCH': '6',
+        }
+        config, sources = Config.load_with_sources([
+            {'epoch': 1, 'ratios': ratios, 'unknown': None},
+            self.json_file,
+            Environment('APP_', environ),
+            ['--epoch', '7'],
+        ])
+        self.assertEqual(
+            config,
+            Config(7, 'SGD', Decimal('0.1'), [Fraction(1, 4), Fraction(3, 4)],
+                   True),
+            'Later sources should override earlier ones.'
+        )
+        self.assertEqual(
+            sources,
+            {
+                'epoch': 'argv',
+                'optimizer': f'json:{self.json_file}',
+                'learning_rate': f'json:{self.json_file}',
+                'ratios': 'env:APP_',
+                'debug': 'env:APP_',
+                'output_path': 'default',
+            },
+            'Should record the source of each field.'
+        )
+
+        config = Config.load([
+            Values({'epoch': 1, 'ratios': ratios}, 'defaults'),
+        ])
+        self.assertIs(config.ratios, ratios, 'Should not copy values.')
+        self.assertEqual(
+            Config.load([str(self.json_file)]),
+            Config.from_json(self.json_file),
+            'Should read JSON files like `from_json`.'
+        )
+        config_file = Path(self.directory.name) / 'config'
+        config_file.write_text(self.json_file.read_text())
+        self.assertEqual(
+            Config.load_with_sources([str(config_file)])[1]['epoch'],
+            f'json:{config_file}',
+            'Should read JSON files without the `.json` suffix.'
+        )
+        self.assertEqual(
+            Config.load([{'epoch': 1}, 'APP_']), Config(1),
+            'Should read identifiers as environment variable prefixes.'
+        )
+        with self.assertRaises(ValueError, msg='Should reject ambiguity.'):
+            Config.load([{'epoch': 1}, 'config.cfg'])
+        for arguments in (['--epoch', '2', '--ratios'], ['--epoch=2']):
+            self.assertEqual(
+                Config.load([{'ratios': ratios}, Arguments(arguments)]),
+                Config(2, ratios=[] if '--ratios' in arguments else ratios),
+                f'Should parse {arguments} like `parse_args`.'
+            )
+        with patch('sys.argv', ['main.py', '--epoch', '4']):
+            self.assertEqual(
+                Config.load([Arguments()]), Config(4),
+                'Should parse `sys.argv[1:]` by default.'
+            )
+
+    def test_validation(self):
+        with patch.object(
+            Config, 'check_sanity', autospec=True,
+            side_effect=Config.check_sanity,
+        ) as check_sanity:
+            Config.load([
+                {'epoch': 1}, self.json_file, ['--debug', 'True'],
+            ])
+        self.assertEqual(check_sanity.call_count, 1, 'Should validate once.')
+
+        with self.assertRaisesRegex(
+            TypeError, 'epoch', msg='Should check required fields.'
+        ):
+            Config.load([{'optimizer': 'SGD'}])
+        with self.assertRaises(TypeError, msg='Should validate the result.'):
+            Config.load([{'epoch': 1, 'optimizer': 'RMSProp'}])
+        with self.assertRaisesRegex(
+            ValueError, '^env:APP_: `APP_EPOCH`',
+            msg='Should prefix errors with the source.'
+        ):
+            Config.load([Environment('APP_', {'APP_EPOCH': 'one'})])
+        self.json_file.write_text(json.dumps([1]))
+        with self.assertRaisesRegex(
+            TypeError, '^json:', msg='Should prefix errors with the source.'
+        ):
+            Config.load([self.json_file])
+        with self.assertRaises(SystemExit, msg='Should reject arguments.'):
+            Config.load([['--epoch', 'one']])
+        with self.assertRaises(TypeError, msg='Should check sources.'):
+            Config.load([1])
+        self.assertEqual(
+            Config.load(
+                [{'epoch': 1, 'optimizer': 'RMSProp'}], validate='none'
+            ).optimizer,
+            'RMSProp',
+            'Should use the validation level.'
+        )
@@ -0,0 +1,142 @@
+import pickle
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy, deepcopy
+from dataclasses import FrozenInstanceError, dataclass, field
+from fractions import Fraction
+from multiprocessing import get_all_start_methods, shared_memory
+from typing import Literal
+from unittest import TestCase
+from unittest.mock import patch
+
+from rootconfig import RootConfig, config_dataclass
+from rootconfig.shared import SharedConfig
+
+
+@dataclass
+class Config(RootConfig):
+    learning_rate: float
+    optimizer: Literal['Adam', 'SGD'] = 'Adam'
+    ratios: list[Fraction] = field(default_factory=lambda: [Fraction(1, 3)])
+    schedule: list[float] = field(
+        default_factory=lambda: [0.5], metadata={'storage': 'array'}
+    )
+
+
+@config_dataclass(compact=True, hashable=True)
+class CompactConfig(RootConfig):
+    learning_rate: float
+    optimizer: Literal['Adam', 'SGD'] = 'Adam'
+
+
+def get_learning_rate(shared: SharedConfig[Config]):
+    return shared.get().learning_rate
+
+
+class PickleTest(TestCase):
+    def test_pickle(self):
+        configs = [Config(1e-3, 'SGD'), CompactConfig(1e-3, 'SGD')]
+        for config in configs:
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                self.assertEqual(
+                    pickle.loads(pickle.dumps(config, protocol)), config,
+                    f'Should pickle {config} with protocol {protocol}.'
+                )
+            self.assertEqual(copy(config), config, 'Should copy.')
+            self.assertEqual(deepcopy(config), config, 'Should copy.')
+
+        unpickled = pickle.loads(pickle.dumps(configs[1]))
+        self.assertEqual(
+            hash(unpickled), hash(configs[1]), 'Should keep hashes.'
+        )
+        with self.assertRaises(
+            FrozenInstanceError, msg='Should keep instances frozen.'
+        ):
+            unpickled.learning_rate = 1.
+
+        config = Config(1e-3)
+        config.note = 'baseline'  # type: ignore
+        self.assertEqual(
+            pickle.loads(pickle.dumps(config)).note, 'baseline',
+            'Should keep attributes other than fields.'
+        )
+
+        data = pickle.dumps(Config(1e-3))
+        with patch.object(
+            Config, 'check_sanity', side_effect=AssertionError
+        ):
+            pickle.loads(data)
+
+    def test_shared_config(self):
+        config = Config(1e-3, 'SGD', schedule=[0.1] * 1000)
+        with SharedConfig(config) as shared:
+            self.assertIs(
+                shared.get(), config, 'Should return the published instance.'
+            )
+            data = pickle.dumps(shared)
+            self.assertLess(
+                len(data), len(pickle.dumps(config)),
+                'Should pickle only the name of the block.'
+            )
+            self.assertEqual(
+                pickle.loads(data).get(), config,
+                'Should decode the instance.'
+            )
+            with ProcessPoolExecutor(2) as executor:
+                self.assertEqual(
+                    list(executor.map(get_learning_rate, [shared] * 4)),
+                    [1e-3] * 4,
+                    'Should share the instance with workers.'
+                )
+            name = shared.name
+        with self.assertRaises(
+            FileNotFoundError, msg='Should remove the block when closed.'
+        ):
+            shared_memory.SharedMemory(name)
+
+    def test_attach_does_not_unlink(self):
+        config = Config(1e-3)
+        with SharedConfig(config) as shared:
+            result = subprocess.run(
+                [sys.executable, '-c',
+                 'import pickle, sys; '
+                 'print(pickle.loads(sys.stdin.buffer.read()).get())'],
+                input=pickle.dumps(shared), capture_output=True,
+            )
+            self.assertEqual(
+                result.returncode, 0, result.stderr.decode()
+            )
+            self.assertEqual(
+                pickle.loads(pickle.dumps(shared)).get(), config,
+                'Workers exiting should not remove the block.'
+            )
+            self.assertNotIn(
+                b'leaked', result.stderr, 'Should not track attached blocks.'
+            )
+
+    def test_attach_keeps_owner_tracked(self):
+        for method in get_all_start_methods():
+            result = subprocess.run(
+                [sys.executable, '-c',
+                 'import pickle\n'
+                 'from concurrent.futures import ProcessPoolExecutor\n'
+                 'from multiprocessing import get_context\n'
+                 'from rootconfig.shared import SharedConfig\n'
+                 'from tests.test_pickle import Config, get_learning_rate\n'
+                 'with SharedConfig(Config(1e-3)) as shared:\n'
+                 '    pickle.loads(pickle.dumps(shared)).get()\n'
+                 '    with ProcessPoolExecutor(\n'
+                 f'        1, mp_context=get_context({method!r})\n'
+                 '    ) as executor:\n'
+                 '        executor.submit(\n'
+                 '            get_learning_rate, shared\n'
+                 '        ).result()\n'],
+                capture_output=True,
+            )
+            self.assertEqual(result.returncode, 0, result.stderr.decode())
+            self.assertEqual(
+                result.stderr, b'',
+                f'Attaching with {method!r} workers should not withdraw '
+                f'the registration of the owner.'
+            )
@@ -0,0 +1,101 @@
+from dataclasses import dataclass, field
+from fractions import Fraction
+from typing import Literal
+from unittest import TestCase
+
+from rootconfig import RootConfig
+
+
+@dataclass
+class Config(RootConfig):
+    epoch: int
+    optimizer: Literal['Adam', 'SGD'] = 'Adam'
+    ratios: list[Fraction] = field(default_factory=lambda: [Fraction(1, 3)])
+
+
+class RecordsTest(TestCase):
+    def test_from_records(self):
+        records = [
+            {'epoch': 1},
+            {'epoch': 2, 'optimizer': 'SGD', 'unknown': None},
+            {'epoch': 3, 'ratios': [Fraction(1, 2), Fraction(2)]},
+        ]
+        configs = Config.from_records(records)
+        self.assertIsInstance(
+            configs, list, 'Should return a list by default.'
+        )
+        self.assertListEqual(
+            configs, [Config.from_dict(record) for record in records],
+            'Should create the same instances as `from_dict`.'
+        )
+        self.assertIsNot(
+            configs[0].ratios, configs[1].ratios,
+            '`default_factory` should be called for each record.'
+        )
+
+        lazy_configs = Config.from_records(
+            iter(records), lazy=True, chunk_size=2
+        )
+        self.assertNotIsInstance(
+            lazy_configs, list, 'Should return an iterator if lazy.'
+        )
+        self.assertListEqual(
+            list(lazy_configs), configs,
+            'Lazy creation should create the same instances.'
+        )
+        self.assertListEqual(
+            Config.from_records([]), [], 'Should accept no records.'
+        )
+
+    def test_from_records_exception(self):
+        def records_with(index: int, record: dict):
+            records: list[dict] = [{'epoch': i} for i in range(5)]
+            records[index] = record
+            return records
+
+        invalid_records = [
+            (TypeError, {'epoch': 1.5}),
+            (TypeError, {'epoch': 1, 'optimizer': 'RMSProp'}),
+            (TypeError, {'epoch': 1, 'ratios': [Fraction(1), 0.5]}),
+            (TypeError, {'epoch': 1, 'ratios': (Fraction(1),)}),
+            (TypeError, {'optimizer': 'SGD'}),
+        ]
+        for error_type, record in invalid_records:
+            for lazy in (False, True):
+                with self.assertRaisesRegex(
+                    error_type, '^Record 3: ',
+                    msg='Should report the index of the invalid record.'
+                ):
+                    list(Config.from_records(
+                        records_with(3, record), lazy=lazy, chunk_size=2
+                    ))
+
+        @dataclass
+        class Config2(RootConfig):
+            epoch: int
+            name: str = 3  # type: ignore
+
+        with self.assertRaisesRegex(
+            TypeError, '^Record 0: ',
+            msg='Should catch default values with incorrect type.'
+        ):
+            Config2.from_records([{'epoch': 1}, {'epoch': 2}])
+        self.assertEqual(
+            Config2.from_records([{'epoch': 1, 'name': 'a'}])[0].name, 'a',
+            'Should not check default values that are not used.'
+        )
+
+        @dataclass
+        class Config3(RootConfig):
+            path: str
+
+            def __post_init__(self):
+                super().__post_init__()
+                self.path.encode('ascii')
+
+        with self.assertRaisesRegex(
+            ValueError, '^Record 1: ',
+            msg='Should report errors whose constructor takes other arguments.'
+        ) as context:
+            Config3.from_records([{'path': 'a'}, {'path': 'é'}])
+        self.assertIsInstance(context.exception.__cause__, UnicodeEncodeError)
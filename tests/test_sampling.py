@@ -0,0 +1,162 @@
+from dataclasses import dataclass
+from typing import Literal
+from unittest import TestCase, skipUnless
+
+from rootconfig import RootConfig
+from rootconfig.sampling import (Choice, ConfigSampler, Distribution,
+                                 IntUniform, LogUniform, Uniform, np)
+
+
+@dataclass
+class Config(RootConfig):
+    learning_rate: float
+    dropout: float
+    batch_size: int
+    optimizer: Literal['Adam', 'AdamW', 'SGD'] = 'Adam'
+    debug: bool = False
+
+
+distributions = {
+    'learning_rate': LogUniform(1e-5, 1e-1),
+    'dropout': Uniform(0., .5),
+    'batch_size': IntUniform(16, 64),
+    'optimizer': Choice(['Adam', 'SGD'], weights=[3, 1]),
+}
+
+
+class SamplingTest(TestCase):
+    def check_configs(self, configs: list[Config]):
+        for config in configs:
+            self.assertIsInstance(config, Config)
+            self.assertTrue(1e-5 <= config.learning_rate < 1e-1)
+            self.assertTrue(0. <= config.dropout < .5)
+            self.assertIs(type(config.batch_size), int)
+            self.assertTrue(16 <= config.batch_size <= 64)
+            self.assertIn(config.optimizer, ('Adam', 'SGD'))
+
+    def test_python_backend(self):
+        for method in ('random', 'lhs', 'halton'):
+            sampler = ConfigSampler(
+                Config, distributions, method=method, seed=7,
+                backend='python',
+            )
+            configs = sampler.sample(200)
+            self.assertEqual(len(configs), 200, 'Should draw `n` configs.')
+            self.check_configs(configs)
+
+            same_sampler = ConfigSampler(
+                Config, distributions, method=method, seed=7,
+                backend='python',
+            )
+            self.assertListEqual(
+                same_sampler.sample(200), configs,
+                'The same seed should draw the same configs.'
+            )
+            other_sampler = ConfigSampler(
+                Config, distributions, method=method, seed=8,
+                backend='python',
+            )
+            self.assertNotEqual(
+                other_sampler.sample(200), configs,
+                'Another seed should draw other configs.'
+            )
+
+    def test_latin_hypercube(self):
+        @dataclass
+        class DropoutConfig(RootConfig):
+            dropout: float
+
+        sampler = ConfigSampler(
+            DropoutConfig, {'dropout': Uniform(0., 1.)}, method='lhs',
+            backend='python',
+        )
+        configs = sampler.sample(50)
+        self.assertListEqual(
+            sorted(int(config.dropout * 50) for config in configs),
+            list(range(50)),
+            'Each stratum should be drawn exactly once.'
+        )
+
+    def test_batches(self):
+        sampler = ConfigSampler(Config, distributions, backend='python')
+        batches = list(sampler.batches(1000, batch_size=300))
+        self.assertListEqual(
+            [len(batch) for batch in batches], [300, 300, 300, 100],
+            'Should split the draws into batches.'
+        )
+        self.assertEqual(sampler.drawn, 1000, 'Should count the draws.')
+        self.assertListEqual(
+            [config for batch in batches for config in batch],
+            ConfigSampler(Config, distributions, backend='python')
+            .sample(1000),
+            'Random draws should not depend on the batch size.'
+        )
+
+    def test_list_choices(self):
+        @dataclass
+        class Network(RootConfig):
+            layers: list[int]
+
+        sampler = ConfigSampler(
+            Network, {'layers': Choice([[64, 64]])}, backend='python'
+        )
+        configs = sampler.sample(3)
+        configs[0].layers.append(1)
+        self.assertEqual(
+            [config.layers for config in configs[1:]], [[64, 64]] * 2,
+            'Instances should not share `list` values.'
+        )
+        self.assertEqual(sampler.distributions[0].values, ([64, 64],))
+
+    def test_sampling_exception(self):
+        with self.assertRaises(
+            TypeError, msg='Should reject a distribution of another type.'
+        ):
+            ConfigSampler(Config, {'batch_size': Uniform(0., 1.)})
+
+        with self.assertRaises(
+            TypeError, msg='Should reject choices not in `Literal`.'
+        ):
+            ConfigSampler(Config, {'optimizer': Choice(['RMSProp'])})
+
+        with self.assertRaises(TypeError, msg='Should reject unknown fields.'):
+            ConfigSampler(Config, {'momentum': Uniform(0., 1.)})
+
+        with self.assertRaises(ValueError, msg='Should check bounds.'):
+            LogUniform(0., 1.)
+
+        class Constant(Distribution):
+            value_type = float
+
+            def transform(self, uniforms: list[float]) -> list[float]:
+                return [0.] * len(uniforms)
+
+        with self.assertRaises(
+            TypeError, msg='Should require both transforms.'
+        ):
+            Constant()  # type: ignore
+
+        with self.assertRaises(
+            TypeError, msg='Should require fields that are not sampled.'
+        ):
+            ConfigSampler(
+                Config, {'learning_rate': Uniform(0., 1.)}, backend='python'
+            ).sample(1)
+
+    @skipUnless(np is not None, 'NumPy is not installed.')
+    def test_numpy_backend(self):
+        for method in ('random', 'lhs', 'halton'):
+            sampler = ConfigSampler(
+                Config, distributions, method=method, seed=7,
+                backend='numpy',
+            )
+            configs = sampler.sample(500)
+            self.check_configs(configs)
+            self.assertListEqual(
+                ConfigSampler(
+                    Config, distributions, method=method, seed=7,
+                    backend='numpy',
+                ).sample(500),
+                configs,
+                'The same seed should draw the same configs.'
+            )
@@ -0,0 +1,160 @@
+import json
+import os
+from dataclasses import dataclass
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from rootconfig import RootConfig
+from rootconfig.sweep import SweepSummary, iter_sweep_results, run_sweep
+
+
+@dataclass
+class Config(RootConfig):
+    seed: int
+    scale: float = 1.
+
+
+def square(config: Config):
+    if config.seed < 0:
+        raise ValueError('negative seed')
+    return {'value': config.seed ** 2 * config.scale}
+
+
+def unserializable(config: Config):
+    return object()
+
+
+class SweepTest(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.results_path = os.path.join(self.directory.name, 'results.jsonl')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def records(self):
+        return list(iter_sweep_results(Config, self.results_path))
+
+    def test_run(self):
+        configs = [Config(seed) for seed in range(10)]
+        summary = run_sweep(
+            square, configs, self.results_path, workers=2,
+            executor='thread',
+        )
+        self.assertEqual(summary, SweepSummary(10, 0, 0))
+        records = self.records()
+        self.assertEqual(
+            sorted(record.config.seed for record in records), list(range(10))
+        )
+        for record in records:
+            self.assertEqual(record.fingerprint, record.config.fingerprint())
+            self.assertEqual(record.result, square(record.config))
+            self.assertIsNone(record.error)
+
+    def test_process_executor(self):
+        summary = run_sweep(
+            square, map(Config, range(4)), self.results_path, workers=2
+        )
+        self.assertEqual(summary, SweepSummary(4, 0, 0))
+        self.assertEqual(len(self.records()), 4)
+
+    def test_resume(self):
+        run_sweep(
+            square, map(Config, range(5)), self.results_path,
+            executor='thread',
+        )
+        size = os.path.getsize(self.results_path)
+        summary = run_sweep(
+            square, map(Config, range(8)), self.results_path,
+            executor='thread',
+        )
+        self.assertEqual(
+            summary, SweepSummary(3, 5, 0), 'Should skip completed configs.'
+        )
+        with open(self.results_path, 'rb') as f:
+            f.seek(size)
+            self.assertEqual(
+                len(f.readlines()), 3, 'Should append new records.'
+            )
+        self.assertEqual(
+            run_sweep(
+                square, [Config(1), Config(1), Config(9)], self.results_path,
+                executor='thread',
+            ),
+            SweepSummary(1, 2, 0),
+            'Should skip duplicate configs.'
+        )
+
+    def test_failures(self):
+        configs = [Config(-1), Config(1)]
+        summary = run_sweep(
+            square, configs, self.results_path, executor='thread'
+        )
+        self.assertEqual(summary, SweepSummary(1, 0, 1))
+        error = next(
+            record.error for record in self.records()
+            if record.config.seed == -1
+        )
+        self.assertEqual(error, 'ValueError: negative seed')
+        self.assertEqual(
+            run_sweep(square, configs, self.results_path, executor='thread'),
+            SweepSummary(0, 1, 1),
+            'Should run failed configs again.'
+        )
+        self.assertEqual(
+            run_sweep(
+                unserializable, [Config(2)], self.results_path,
+                executor='thread',
+            ),
+            SweepSummary(0, 0, 1),
+            'Should record unserializable results as failures.'
+        )
+
+    def test_catch_up(self):
+        run_sweep(
+            square, map(Config, range(3)), self.results_path,
+            executor='thread',
+        )
+        os.remove(self.results_path + '.index')
+        with open(self.results_path, 'ab') as f:
+            line = json.dumps({
+                'fingerprint': Config(3).fingerprint(),
+                'config': Config(3).to_dict(), 'result': None, 'error': None,
+            })
+            f.write(line.encode() + b'\n')
+            f.write(b'{"fingerprint": "trunc')
+        summary = run_sweep(
+            square, map(Config, range(5)), self.results_path,
+            executor='thread',
+        )
+        self.assertEqual(
+            summary, SweepSummary(1, 4, 0),
+            'Should index records missing from the index.'
+        )
+        self.assertEqual(
+            len(self.records()), 5, 'Should cut off a partial record.'
+        )
+
+    def test_backpressure(self):
+        consumed = 0
+
+        def configs():
+            nonlocal consumed
+            for seed in range(50):
+                consumed += 1
+                yield Config(seed)
+
+        seen = []
+
+        def record(config: Config):
+            seen.append(consumed - config.seed)
+            return None
+
+        summary = run_sweep(
+            record, configs(), self.results_path, workers=1,
+            executor='thread', max_pending=3,
+        )
+        self.assertEqual(summary, SweepSummary(50, 0, 0))
+        self.assertLessEqual(
+            max(seen), 4, 'Should not consume configs ahead of the workers.'
+        )
@@ -256,3 +256,47 @@ class TypeCheckingTest(TestCase):
                     default_factory=lambda: (1, 2.0, 3)
                 )
             Config11()
+
+    def test_compiled_schema(self):
+        @dataclass
+        class Config(RootConfig):
+            epoch: int
+            optimizer: Literal['Adam', 'SGD'] = 'Adam'
+
+        @dataclass
+        class SubConfig(Config):
+            ratios: list[float] = field(default_factory=list)
+
+        Config(1)
+        schema = Config._compiled_schema()
+        Config(2, 'SGD')
+        self.assertIs(
+            Config._compiled_schema(), schema,
+            'The schema should be compiled once and cached on the class.'
+        )
+        self.assertEqual(
+            schema.names, ('epoch', 'optimizer'),
+            'The schema should follow the field order.'
+        )
+        self.assertEqual(
+            SubConfig._compiled_schema().names,
+            ('epoch', 'optimizer', 'ratios'),
+            'A subclass should not reuse the schema of its parent.'
+        )
+
+        Config.clear_cache()
+        self.assertIsNot(
+            Config._compiled_schema(), schema,
+            'Clearing the cache should recompile the schema.'
+        )
+
+        @dataclass
+        class Config2(RootConfig):
+            model_version: Literal[1, 2, '3'] = 1
+
+        for _ in range(2):
+            with self.assertRaises(
+                TypeError,
+                msg='A malformed schema should fail on every instantiation.'
+            ):
+                Config2()
@@ -0,0 +1,192 @@
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from fractions import Fraction
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Callable, Literal
+from unittest import TestCase
+from unittest.mock import patch
+
+from rootconfig import RootConfig, config_dataclass, validation_level
+from rootconfig import rootconfig as rootconfig_module
+
+
+@dataclass
+class Config(RootConfig):
+    epoch: int
+    optimizer: Literal['Adam', 'SGD'] = 'Adam'
+    ratios: list[Fraction] = field(default_factory=lambda: [Fraction(1, 3)])
+    debug: bool = False
+
+
+@dataclass
+class TrustedConfig(Config, validation='none'):
+    pass
+
+
+@config_dataclass(compact=True)
+class CompactTrustedConfig(RootConfig, validation='values-only'):
+    epoch: int
+
+
+valid_inputs: list[dict[str, Any]] = [
+    {'epoch': 1},
+    {'epoch': True, 'optimizer': 'SGD'},
+    {'epoch': -1, 'ratios': [], 'debug': True},
+]
+
+invalid_inputs: list[dict[str, Any]] = [
+    {'epoch': 1.},
+    {'epoch': '1'},
+    {'epoch': 1, 'optimizer': 'RMSProp'},
+    {'epoch': 1, 'ratios': Fraction(1, 3)},
+    {'epoch': 1, 'ratios': [0.5]},
+    {'epoch': 1, 'debug': 0},
+]
+
+levels = ('full', 'values-only', 'none')
+
+
+def outcome(create: Callable[[], Any]):
+    try:
+        return 'ok', create()
+    except (TypeError, ValueError) as e:
+        return 'error', type(e), str(e)
+
+
+class ValidationLevelTest(TestCase):
+    def check_levels(self, create: Callable[[dict[str, Any], str], Any]):
+        """Check that checking levels agree, and `none` checks nothing."""
+
+        for values in valid_inputs:
+            expected = Config(**values)
+            for level in levels:
+                self.assertEqual(
+                    outcome(lambda: create(values, level)),
+                    ('ok', expected),
+                    f'`{level}` should accept {values}.'
+                )
+        for values in invalid_inputs:
+            full = outcome(lambda: create(values, 'full'))
+            self.assertEqual(
+                full[0], 'error', f'`full` should reject {values}.'
+            )
+            self.assertEqual(
+                outcome(lambda: create(values, 'values-only')), full,
+                f'`values-only` should reject {values} the same way.'
+            )
+            self.assertEqual(
+                outcome(lambda: create(values, 'none'))[0], 'ok',
+                f'`none` should accept {values}.'
+            )
+
+    def test_per_call(self):
+        self.check_levels(
+            lambda values, level: Config.from_dict(values, validate=level)
+        )
+        self.check_levels(
+            lambda values, level: Config.from_records(
+                [values], validate=level
+            )[0]
+        )
+        with TemporaryDirectory() as directory:
+            json_file = Path(directory) / 'config.json'
+
+            def from_json(values: dict[str, Any], level: Any):
+                Config._create_unchecked(values).to_json(json_file)
+                return Config.from_json(json_file, validate=level)
+
+            self.check_levels(from_json)
+
+        with self.assertRaises(
+            ValueError, msg='Should reject unknown levels.'
+        ):
+            Config.from_dict({'epoch': 1}, validate='partial')  # type: ignore
+
+    def test_context_manager(self):
+        def create(values: dict[str, Any], level: Any):
+            with validation_level(level):
+                return Config(**values)
+
+        self.check_levels(create)
+        with validation_level('none'):
+            self.assertEqual(
+                outcome(
+                    lambda: Config.from_dict({'epoch': 1.}, 'full')
+                )[0],
+                'error',
+                'The `validate` argument should override the context.'
+            )
+            with validation_level('full'):
+                self.assertEqual(
+                    outcome(lambda: Config(1.))[0],  # type: ignore
+                    'error',
+                    'Nested contexts should override outer ones.'
+                )
+            self.assertEqual(
+                outcome(lambda: Config(1.))[0], 'ok',  # type: ignore
+                'Should restore the outer level.'
+            )
+        with self.assertRaises(
+            ValueError, msg='Should reject unknown levels.'
+        ):
+            with validation_level('partial'):  # type: ignore
+                pass
+
+    def test_per_class(self):
+        self.assertEqual(
+            outcome(lambda: TrustedConfig(1.))[0], 'ok',  # type: ignore
+            'Should use the class level.'
+        )
+        self.assertEqual(
+            outcome(lambda: CompactTrustedConfig(1.))[0],  # type: ignore
+            'error',
+            'Should keep the class level of compact classes.'
+        )
+        with validation_level('full'):
+            self.assertEqual(
+                outcome(lambda: TrustedConfig(1.))[0],  # type: ignore
+                'error',
+                'The context should override the class level.'
+            )
+
+        with self.assertRaises(
+            ValueError, msg='Should reject unknown levels.'
+        ):
+            @dataclass
+            class InvalidConfig(
+                RootConfig, validation='partial',  # type: ignore
+            ):
+                epoch: int
+
+    def test_default(self):
+        def create(values: dict[str, Any], level: Any):
+            with patch.object(
+                rootconfig_module, 'default_validation_level', level
+            ):
+                return Config(**values)
+
+        self.check_levels(create)
+
+        environment = dict(os.environ, ROOTCONFIG_VALIDATION='none')
+        result = subprocess.run(
+            [sys.executable, '-c',
+             'from rootconfig import rootconfig; '
+             'print(rootconfig.default_validation_level)'],
+            env=environment, capture_output=True, text=True,
+        )
+        self.assertEqual(
+            result.stdout.strip(), 'none',
+            'Should read the default level from the environment.'
+        )
+        environment['ROOTCONFIG_VALIDATION'] = 'partial'
+        result = subprocess.run(
+            [sys.executable, '-c', 'import rootconfig'],
+            env=environment, capture_output=True, text=True,
+        )
+        self.assertIn(
+            'ValueError', result.stderr,
+            'Should reject unknown levels from the environment.'
+        )
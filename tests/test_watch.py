@@ -0,0 +1,144 @@
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Literal
+from unittest import TestCase
+
+from rootconfig import RootConfig, validation_level
+from rootconfig.watch import JSONFileCache, json_file_cache
+
+
+@dataclass
+class Config(RootConfig):
+    epoch: int
+    optimizer: Literal['Adam', 'SGD'] = 'Adam'
+
+
+class WatchTest(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.path = Path(self.directory.name)
+        self.json_file = self.path / 'config.json'
+        self.version = 0
+        self.write({'epoch': 1})
+        json_file_cache.clear()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, data):
+        """Write the file with a new modification time, like an edit."""
+
+        self.json_file.write_text(json.dumps(data))
+        self.version += 1
+        os.utime(self.json_file, ns=(0, self.version * 10 ** 9))
+
+    def test_cached_from_json(self):
+        config = Config.from_json(self.json_file, cached=True)
+        self.assertEqual(config, Config(1), 'Should load the file.')
+        self.assertIs(
+            Config.from_json(self.json_file, cached=True), config,
+            'Should return the cached instance.'
+        )
+        self.assertIs(
+            Config.from_json(self.path / '.' / 'config.json', cached=True),
+            config,
+            'Should resolve paths.'
+        )
+        self.assertIsNot(
+            Config.from_json(self.json_file), config,
+            'Should not cache by default.'
+        )
+
+        self.write({'epoch': 2})
+        self.assertEqual(
+            Config.from_json(self.json_file, cached=True), Config(2),
+            'Should reload changed files.'
+        )
+        with validation_level('none'):
+            self.assertIsNot(
+                Config.from_json(self.json_file, cached=True),
+                Config.from_json(self.json_file, cached=True, validate='full'),
+                'Should cache validation levels apart.'
+            )
+        self.assertEqual(
+            json_file_cache.stats(), {'hits': 3, 'misses': 3, 'size': 2},
+            'Should count hits and misses.'
+        )
+
+        self.write({'epoch': 1.5})
+        with self.assertRaises(TypeError, msg='Should validate reloads.'):
+            Config.from_json(self.json_file, cached=True)
+
+    def test_eviction(self):
+        cache = JSONFileCache(maxsize=2)
+        paths = [self.path / f'{i}.json' for i in range(3)]
+        for i, path in enumerate(paths):
+            Config(i).to_json(path)
+        first = cache.load(Config, paths[0])
+        cache.load(Config, paths[1])
+        cache.load(Config, paths[0])
+        cache.load(Config, paths[2])
+        self.assertEqual(len(cache), 2, 'Should bound the cache.')
+        self.assertIs(
+            cache.load(Config, paths[0]), first,
+            'Should keep recently used entries.'
+        )
+        self.assertEqual(
+            cache.stats(), {'hits': 2, 'misses': 3, 'size': 2},
+            'Should evict least recently used entries.'
+        )
+        with self.assertRaises(ValueError, msg='Should check the size.'):
+            JSONFileCache(-1)
+
+    def test_watcher(self):
+        watcher = Config.watch_json(self.json_file, interval=0.01)
+        self.assertEqual(watcher.config, Config(1), 'Should load the file.')
+        self.assertIsNone(watcher.poll(), 'Should skip unchanged files.')
+
+        self.write({'epoch': 1})
+        self.assertIsNone(watcher.poll(), 'Should skip unchanged content.')
+
+        self.write({'epoch': 2})
+        self.assertEqual(
+            watcher.poll(), Config(2), 'Should reload changed files.'
+        )
+
+        for data in ({'epoch': 1.5}, '{'):
+            self.write(data)
+            self.assertIsNone(watcher.poll(), 'Should skip invalid files.')
+            self.assertEqual(
+                watcher.config, Config(2), 'Should keep the last good one.'
+            )
+            self.assertIsInstance(
+                watcher.error, (TypeError, ValueError),
+                'Should keep the error.'
+            )
+        self.json_file.unlink()
+        self.assertIsNone(watcher.poll(), 'Should skip missing files.')
+        self.assertIsInstance(watcher.error, FileNotFoundError)
+
+        self.write({'epoch': 3})
+        self.assertEqual(watcher.poll(), Config(3), 'Should recover.')
+        self.assertIsNone(watcher.error, 'Should clear the error.')
+
+        configs = []
+
+        def edit():
+            self.write({'epoch': 4})
+            threading.Timer(0.2, watcher.stop).start()
+
+        threading.Timer(0.05, edit).start()
+        for config in watcher:
+            configs.append(config)
+        self.assertEqual(
+            configs, [Config(4)], 'Should yield changes until stopped.'
+        )
+
+        with self.assertRaises(
+            FileNotFoundError, msg='Should raise initial errors.'
+        ):
+            Config.watch_json(self.path / 'missing.json')